@@ -7,7 +7,7 @@ Nodes are decoupled from the indices.
 import uuid
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from dataclasses_json import DataClassJsonMixin
 
@@ -43,10 +43,33 @@ class IndexGraph(V2IndexStruct):
     root_nodes: Dict[int, str] = field(default_factory=dict)
     node_id_to_children_ids: Dict[str, List[str]] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Init the reverse maps, these are not serialized."""
+        self._node_id_to_index: Dict[str, int] = {}
+        self._node_id_to_parent_id: Dict[str, str] = {}
+        # size of all_nodes when the reverse maps were last updated
+        self._num_indexed_nodes = 0
+        self._build_reverse_maps()
+
+    def _build_reverse_maps(self) -> None:
+        """Build the node id to index and node id to parent id maps."""
+        self._node_id_to_index = {
+            node_id: index for index, node_id in self.all_nodes.items()
+        }
+        self._node_id_to_parent_id = {
+            child_id: parent_id
+            for parent_id, children_ids in self.node_id_to_children_ids.items()
+            for child_id in children_ids
+        }
+        self._num_indexed_nodes = len(self.all_nodes)
+
     @property
     def node_id_to_index(self) -> Dict[str, int]:
         """Map from node id to index."""
-        return {node_id: index for index, node_id in self.all_nodes.items()}
+        # NOTE: all_nodes is a public field, rebuild if it was modified directly
+        if self._num_indexed_nodes != len(self.all_nodes):
+            self._build_reverse_maps()
+        return self._node_id_to_index
 
     @property
     def size(self) -> int:
@@ -57,6 +80,21 @@ class IndexGraph(V2IndexStruct):
         """Get index of node."""
         return self.node_id_to_index[node.get_doc_id()]
 
+    def get_parent_id(self, node_id: str) -> Optional[str]:
+        """Get the id of the parent node, None for root and unlinked nodes."""
+        return self._node_id_to_parent_id.get(node_id)
+
+    def _set_node_index(self, node_id: str, index: int) -> None:
+        """Set the index of a node, keeping the reverse map in sync."""
+        # keep the reverse map in sync before writing to all_nodes
+        node_id_to_index = self.node_id_to_index
+        prev_node_id = self.all_nodes.get(index)
+        if prev_node_id is not None and node_id_to_index.get(prev_node_id) == index:
+            del node_id_to_index[prev_node_id]
+        self.all_nodes[index] = node_id
+        node_id_to_index[node_id] = index
+        self._num_indexed_nodes = len(self.all_nodes)
+
     def insert(
         self,
         node: Node,
@@ -67,12 +105,14 @@ class IndexGraph(V2IndexStruct):
         index = index or self.size
         node_id = node.get_doc_id()
 
-        self.all_nodes[index] = node_id
+        self._set_node_index(node_id, index)
 
         if children_nodes is None:
             children_nodes = []
         children_ids = [n.get_doc_id() for n in children_nodes]
         self.node_id_to_children_ids[node_id] = children_ids
+        for child_id in children_ids:
+            self._node_id_to_parent_id[child_id] = node_id
 
     def get_children(self, parent_node: Optional[Node]) -> Dict[int, str]:
         """Get children nodes."""
@@ -81,26 +121,27 @@ class IndexGraph(V2IndexStruct):
         else:
             parent_id = parent_node.get_doc_id()
             children_ids = self.node_id_to_children_ids[parent_id]
-            return {
-                self.node_id_to_index[child_id]: child_id for child_id in children_ids
-            }
+            node_id_to_index = self.node_id_to_index
+            return {node_id_to_index[child_id]: child_id for child_id in children_ids}
 
     def insert_under_parent(
         self, node: Node, parent_node: Optional[Node], new_index: Optional[int] = None
     ) -> None:
         """Insert under parent node."""
         new_index = new_index or self.size
+        node_id = node.get_doc_id()
         if parent_node is None:
-            self.root_nodes[new_index] = node.get_doc_id()
-            self.node_id_to_children_ids[node.get_doc_id()] = []
+            self.root_nodes[new_index] = node_id
+            self.node_id_to_children_ids[node_id] = []
+            self._node_id_to_parent_id.pop(node_id, None)
         else:
-            if parent_node.doc_id not in self.node_id_to_children_ids:
-                self.node_id_to_children_ids[parent_node.get_doc_id()] = []
-            self.node_id_to_children_ids[parent_node.get_doc_id()].append(
-                node.get_doc_id()
-            )
+            parent_id = parent_node.get_doc_id()
+            if parent_id not in self.node_id_to_children_ids:
+                self.node_id_to_children_ids[parent_id] = []
+            self.node_id_to_children_ids[parent_id].append(node_id)
+            self._node_id_to_parent_id[node_id] = parent_id
 
-        self.all_nodes[new_index] = node.get_doc_id()
+        self._set_node_index(node_id, new_index)
 
     @classmethod
     def get_type(cls) -> IndexStructType:
@@ -205,7 +246,14 @@ class IndexDict(V2IndexStruct):
 
 @dataclass
 class KG(V2IndexStruct):
-    """A table of keywords mapping keywords to text chunks."""
+    """A table of keywords mapping keywords to text chunks.
+
+    `rel_map` is the adjacency list of the graph: it maps each subject to its
+    (object, relationship) edges, and supports bounded-depth traversal.
+    Triplet embeddings are also kept in a float32 matrix (not serialized),
+    built on first use and updated incrementally, for fast similarity search.
+
+    """
 
     # Unidirectional
 
@@ -214,14 +262,48 @@ class KG(V2IndexStruct):
     rel_map: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
     embedding_dict: Dict[str, List[float]] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Init the cached embedding matrix."""
+        # NOTE: an EmbeddingMatrix, see `embedding_matrix`
+        self._embedding_matrix: Optional[Any] = None
+
     @property
     def node_ids(self) -> Set[str]:
         """Get all node ids."""
         return set.union(*self.table.values())
 
+    @property
+    def embedding_matrix(self) -> Any:
+        """Get the float32 matrix of triplet embeddings (an EmbeddingMatrix)."""
+        # NOTE: lazy import, to avoid a circular import
+        from gpt_index.vector_stores.simple import EmbeddingMatrix
+
+        # NOTE: rebuild if the embedding dict was modified directly
+        if self._embedding_matrix is None or self._embedding_matrix.size != len(
+            self.embedding_dict
+        ):
+            self._embedding_matrix = EmbeddingMatrix()
+            self._embedding_matrix.add(
+                list(self.embedding_dict.keys()), list(self.embedding_dict.values())
+            )
+        return self._embedding_matrix
+
     def add_to_embedding_dict(self, triplet_str: str, embedding: List[float]) -> None:
         """Add embedding to dict."""
         self.embedding_dict[triplet_str] = embedding
+        if self._embedding_matrix is not None:
+            self._embedding_matrix.add([triplet_str], [embedding])
+
+    def get_top_k_rel_texts(
+        self, query_embedding: List[float], similarity_top_k: int
+    ) -> Tuple[List[float], List[str]]:
+        """Get the triplets most similar to a query embedding."""
+        if len(self.embedding_dict) == 0:
+            return [], []
+        similarities, rel_texts = self.embedding_matrix.get_top_k(
+            [query_embedding], similarity_top_k=similarity_top_k
+        )
+        return similarities[0], rel_texts[0]
 
     def upsert_triplet(self, triplet: Tuple[str, str, str]) -> None:
         """Upsert a knowledge triplet to the graph."""
@@ -239,15 +321,49 @@ class KG(V2IndexStruct):
             self.table[keyword].add(node_id)
         # self.text_chunks[node_id] = node
 
-    def get_rel_map_texts(self, keyword: str) -> List[str]:
+    def get_triplets(
+        self, keyword: str, depth: int = 1, max_fan_out: Optional[int] = None
+    ) -> List[Tuple[str, str, str]]:
+        """Get the triplets reachable from a keyword, in breadth-first order.
+
+        Args:
+            keyword (str): keyword to start from.
+            depth (int): max number of hops.
+            max_fan_out (Optional[int]): max number of edges followed from
+                each keyword. Defaults to all edges.
+
+        """
+        if depth < 1:
+            raise ValueError("depth must be >= 1")
+        triplets: List[Tuple[str, str, str]] = []
+        visited = {keyword}
+        frontier = [keyword]
+        for _ in range(depth):
+            next_frontier = []
+            for subj in frontier:
+                edges = self.rel_map.get(subj, [])
+                if max_fan_out is not None:
+                    edges = edges[:max_fan_out]
+                for obj, rel in edges:
+                    triplets.append((subj, rel, obj))
+                    if obj not in visited:
+                        visited.add(obj)
+                        next_frontier.append(obj)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return triplets
+
+    def get_rel_map_texts(
+        self, keyword: str, depth: int = 1, max_fan_out: Optional[int] = None
+    ) -> List[str]:
         """Get the corresponding knowledge for a given keyword."""
-        # NOTE: return a single node for now
-        if keyword not in self.rel_map:
-            return []
-        texts = []
-        for obj, rel in self.rel_map[keyword]:
-            texts.append(str((keyword, rel, obj)))
-        return texts
+        return [
+            str(triplet)
+            for triplet in self.get_triplets(
+                keyword, depth=depth, max_fan_out=max_fan_out
+            )
+        ]
 
     def get_rel_map_tuples(self, keyword: str) -> List[Tuple[str, str]]:
         """Get the corresponding knowledge for a given keyword."""
@@ -256,22 +372,33 @@ class KG(V2IndexStruct):
             return []
         return self.rel_map[keyword]
 
-    def get_node_ids(self, keyword: str, depth: int = 1) -> List[str]:
-        """Get the corresponding knowledge for a given keyword."""
-        if depth > 1:
-            raise ValueError("Depth > 1 not supported yet.")
+    def get_node_ids(
+        self, keyword: str, depth: int = 1, max_fan_out: Optional[int] = None
+    ) -> List[str]:
+        """Get the node ids of a keyword and of the keywords reachable from it.
+
+        Args:
+            keyword (str): keyword to start from.
+            depth (int): max number of hops.
+            max_fan_out (Optional[int]): max number of edges followed from
+                each keyword. Defaults to all edges.
+
+        """
         if keyword not in self.table:
             return []
         keywords = [keyword]
         # some keywords may correspond to a leaf node, may not be in rel_map
-        if keyword in self.rel_map:
-            keywords.extend([child for child, _ in self.rel_map[keyword]])
+        keywords.extend(
+            obj
+            for _, _, obj in self.get_triplets(
+                keyword, depth=depth, max_fan_out=max_fan_out
+            )
+        )
 
         node_ids: List[str] = []
         for keyword in keywords:
             for node_id in self.table.get(keyword, set()):
                 node_ids.append(node_id)
-            # TODO: Traverse (with depth > 1)
         return node_ids
 
     @classmethod
@@ -7,7 +7,9 @@ from typing import Callable, Coroutine, List, Optional, Tuple
 
 import numpy as np
 
-from gpt_index.utils import globals_helper
+from gpt_index.embeddings.cache import BaseEmbeddingCache, get_embedding_cache_key
+from gpt_index.embeddings.scheduler import EmbeddingScheduler
+from gpt_index.utils import globals_helper, iter_batch
 
 # TODO: change to numpy array
 EMB_TYPE = List
@@ -45,13 +47,38 @@ def similarity(
         return product / norm
 
 
+def _merge_cached_embeddings(
+    cached_embeddings: List[Optional[List[float]]],
+    new_embeddings: List[List[float]],
+) -> List[List[float]]:
+    """Fill in the embeddings that were not cached, preserving order."""
+    new_embeddings_iter = iter(new_embeddings)
+    return [
+        cached if cached is not None else next(new_embeddings_iter)
+        for cached in cached_embeddings
+    ]
+
+
 class BaseEmbedding:
-    """Base class for embeddings."""
+    """Base class for embeddings.
+
+    Args:
+        embed_batch_size (int): batch size for embedding calls.
+        tokenizer (Optional[Callable]): tokenizer used to count tokens.
+        embed_cache (Optional[BaseEmbeddingCache]): cache of embeddings keyed
+            on `model_id` and text. Cache hits skip the embedding API.
+        embed_scheduler (Optional[EmbeddingScheduler]): scheduler for
+            concurrent, rate-limited batch embedding calls. By default,
+            batches are embedded serially (sync) or all at once (async).
+
+    """
 
     def __init__(
         self,
         embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
         tokenizer: Optional[Callable] = None,
+        embed_cache: Optional[BaseEmbeddingCache] = None,
+        embed_scheduler: Optional[EmbeddingScheduler] = None,
     ) -> None:
         """Init params."""
         self._total_tokens_used = 0
@@ -62,6 +89,40 @@ class BaseEmbedding:
         if embed_batch_size <= 0:
             raise ValueError("embed_batch_size must be > 0")
         self._embed_batch_size = embed_batch_size
+        self.embed_cache = embed_cache
+        self.embed_scheduler = embed_scheduler
+
+    @property
+    def model_id(self) -> str:
+        """Get an identifier of the embedding model, used for caching.
+
+        Meant to be overriden so that embeddings of different models (or
+        configurations) never share cache entries.
+
+        """
+        return type(self).__name__
+
+    def _get_cached_embeddings(
+        self, texts: List[str], prefix: str = "text"
+    ) -> List[Optional[List[float]]]:
+        """Get cached embeddings, with None for texts that are not cached."""
+        if self.embed_cache is None:
+            return [None] * len(texts)
+        model_id = f"{self.model_id}/{prefix}"
+        return self.embed_cache.get_many(
+            [get_embedding_cache_key(model_id, text) for text in texts]
+        )
+
+    def _cache_embeddings(
+        self, texts: List[str], embeddings: List[List[float]], prefix: str = "text"
+    ) -> None:
+        """Add embeddings to the cache."""
+        if self.embed_cache is None:
+            return
+        model_id = f"{self.model_id}/{prefix}"
+        self.embed_cache.put_many(
+            [get_embedding_cache_key(model_id, text) for text in texts], embeddings
+        )
 
     @abstractmethod
     def _get_query_embedding(self, query: str) -> List[float]:
@@ -69,9 +130,33 @@ class BaseEmbedding:
 
     def get_query_embedding(self, query: str) -> List[float]:
         """Get query embedding."""
+        cached_embedding = self._get_cached_embeddings([query], prefix="query")[0]
+        if cached_embedding is not None:
+            return cached_embedding
         query_embedding = self._get_query_embedding(query)
         query_tokens_count = len(self._tokenizer(query))
         self._total_tokens_used += query_tokens_count
+        self._cache_embeddings([query], [query_embedding], prefix="query")
+        return query_embedding
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        """Asynchronously get query embedding.
+
+        By default, this falls back to _get_query_embedding.
+        Meant to be overriden if there is a true async implementation.
+
+        """
+        return self._get_query_embedding(query)
+
+    async def aget_query_embedding(self, query: str) -> List[float]:
+        """Asynchronously get query embedding."""
+        cached_embedding = self._get_cached_embeddings([query], prefix="query")[0]
+        if cached_embedding is not None:
+            return cached_embedding
+        query_embedding = await self._aget_query_embedding(query)
+        query_tokens_count = len(self._tokenizer(query))
+        self._total_tokens_used += query_tokens_count
+        self._cache_embeddings([query], [query_embedding], prefix="query")
         return query_embedding
 
     def get_agg_embedding_from_queries(
@@ -84,6 +169,18 @@ class BaseEmbedding:
         agg_fn = agg_fn or mean_agg
         return agg_fn(query_embeddings)
 
+    async def aget_agg_embedding_from_queries(
+        self,
+        queries: List[str],
+        agg_fn: Optional[Callable[..., List[float]]] = None,
+    ) -> List[float]:
+        """Asynchronously get aggregated embedding from multiple queries."""
+        query_embeddings = await asyncio.gather(
+            *[self.aget_query_embedding(query) for query in queries]
+        )
+        agg_fn = agg_fn or mean_agg
+        return agg_fn(list(query_embeddings))
+
     @abstractmethod
     def _get_text_embedding(self, text: str) -> List[float]:
         """Get text embedding."""
@@ -121,9 +218,13 @@ class BaseEmbedding:
 
     def get_text_embedding(self, text: str) -> List[float]:
         """Get text embedding."""
+        cached_embedding = self._get_cached_embeddings([text])[0]
+        if cached_embedding is not None:
+            return cached_embedding
         text_embedding = self._get_text_embedding(text)
         text_tokens_count = len(self._tokenizer(text))
         self._total_tokens_used += text_tokens_count
+        self._cache_embeddings([text], [text_embedding])
         return text_embedding
 
     def queue_text_for_embedding(self, text_id: str, text: str) -> None:
@@ -134,33 +235,63 @@ class BaseEmbedding:
         """
         self._text_queue.append((text_id, text))
 
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts in batches, in order."""
+        token_counts = [len(self._tokenizer(text)) for text in texts]
+        self._total_tokens_used += sum(token_counts)
+        if self.embed_scheduler is not None:
+            return self.embed_scheduler.embed(
+                self._get_text_embeddings, texts, token_counts, self._embed_batch_size
+            )
+
+        result_embeddings: List[List[float]] = []
+        for cur_batch_texts in iter_batch(texts, self._embed_batch_size):
+            result_embeddings.extend(self._get_text_embeddings(cur_batch_texts))
+        return result_embeddings
+
+    async def _aembed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed texts in batches, in order."""
+        token_counts = [len(self._tokenizer(text)) for text in texts]
+        self._total_tokens_used += sum(token_counts)
+        if self.embed_scheduler is not None:
+            return await self.embed_scheduler.aembed(
+                self._aget_text_embeddings,
+                texts,
+                token_counts,
+                self._embed_batch_size,
+            )
+
+        embeddings_coroutines: List[Coroutine] = [
+            self._aget_text_embeddings(cur_batch_texts)
+            for cur_batch_texts in iter_batch(texts, self._embed_batch_size)
+        ]
+        # flatten the results of asyncio.gather, which is a list of embeddings lists
+        return [
+            embedding
+            for embeddings in await asyncio.gather(*embeddings_coroutines)
+            for embedding in embeddings
+        ]
+
     def get_queued_text_embeddings(self) -> Tuple[List[str], List[List[float]]]:
         """Get queued text embeddings.
 
         Call embedding API to get embeddings for all queued texts.
+        Texts with cached embeddings are not sent to the API.
 
         """
         text_queue = self._text_queue
-        cur_batch: List[Tuple[str, str]] = []
-        result_ids: List[str] = []
-        result_embeddings: List[List[float]] = []
-        for idx, (text_id, text) in enumerate(text_queue):
-            cur_batch.append((text_id, text))
-            text_tokens_count = len(self._tokenizer(text))
-            self._total_tokens_used += text_tokens_count
-            if idx == len(text_queue) - 1 or len(cur_batch) == self._embed_batch_size:
-                # flush
-                cur_batch_ids = [text_id for text_id, _ in cur_batch]
-                cur_batch_texts = [text for _, text in cur_batch]
-                embeddings = self._get_text_embeddings(cur_batch_texts)
-                result_ids.extend(cur_batch_ids)
-                result_embeddings.extend(embeddings)
-
-                cur_batch = []
+        texts = [text for _, text in text_queue]
+        cached_embeddings = self._get_cached_embeddings(texts)
+        texts_to_embed = [
+            text for text, cached in zip(texts, cached_embeddings) if cached is None
+        ]
+        embeddings = self._embed_texts(texts_to_embed)
+        self._cache_embeddings(texts_to_embed, embeddings)
 
         # reset queue
         self._text_queue = []
-        return result_ids, result_embeddings
+        result_ids = [text_id for text_id, _ in text_queue]
+        return result_ids, _merge_cached_embeddings(cached_embeddings, embeddings)
 
     async def aget_queued_text_embeddings(
         self, text_queue: List[Tuple[str, str]]
@@ -169,33 +300,19 @@ class BaseEmbedding:
 
         Call async embedding API to get embeddings for all queued texts in parallel.
         Argument `text_queue` must be passed in to avoid updating it async.
+        Texts with cached embeddings are not sent to the API.
 
         """
-        cur_batch: List[Tuple[str, str]] = []
-        result_ids: List[str] = []
-        result_embeddings: List[List[float]] = []
-        embeddings_coroutines: List[Coroutine] = []
-        for idx, (text_id, text) in enumerate(text_queue):
-            cur_batch.append((text_id, text))
-            text_tokens_count = len(self._tokenizer(text))
-            self._total_tokens_used += text_tokens_count
-            if idx == len(text_queue) - 1 or len(cur_batch) == self._embed_batch_size:
-                # flush
-                cur_batch_ids = [text_id for text_id, _ in cur_batch]
-                cur_batch_texts = [text for _, text in cur_batch]
-                embeddings_coroutines.append(
-                    self._aget_text_embeddings(cur_batch_texts)
-                )
-                result_ids.extend(cur_batch_ids)
-
-        # flatten the results of asyncio.gather, which is a list of embeddings lists
-        result_embeddings = [
-            embedding
-            for embeddings in await asyncio.gather(*embeddings_coroutines)
-            for embedding in embeddings
+        texts = [text for _, text in text_queue]
+        cached_embeddings = self._get_cached_embeddings(texts)
+        texts_to_embed = [
+            text for text, cached in zip(texts, cached_embeddings) if cached is None
         ]
+        embeddings = await self._aembed_texts(texts_to_embed)
+        self._cache_embeddings(texts_to_embed, embeddings)
 
-        return result_ids, result_embeddings
+        result_ids = [text_id for text_id, _ in text_queue]
+        return result_ids, _merge_cached_embeddings(cached_embeddings, embeddings)
 
     def similarity(
         self,
@@ -0,0 +1,114 @@
+"""Embedding caches.
+
+Embeddings are cached by content: the key is a hash of the embedded text,
+namespaced by the identity of the embedding model (see
+`BaseEmbedding.model_id`), so cache hits skip the embedding API entirely.
+
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+def get_embedding_cache_key(model_id: str, text: str) -> str:
+    """Get the cache key of a text embedded by a given model."""
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model_id}:{text_hash}"
+
+
+class BaseEmbeddingCache(ABC):
+    """Base embedding cache.
+
+    Keeps track of hits and misses across lookups.
+
+    """
+
+    def __init__(self) -> None:
+        """Init params."""
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[List[float]]:
+        """Get an embedding, or None if it is not cached."""
+
+    @abstractmethod
+    def put(self, key: str, embedding: List[float]) -> None:
+        """Cache an embedding."""
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Get an embedding, or None if it is not cached."""
+        return self.get_many([key])[0]
+
+    def _get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """Get embeddings.
+
+        By default, this is a wrapper around _get.
+        Meant to be overriden for bulk lookups.
+
+        """
+        return [self._get(key) for key in keys]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """Get embeddings, with None for keys that are not cached."""
+        embeddings = self._get_many(keys)
+        num_hits = sum(embedding is not None for embedding in embeddings)
+        self.hits += num_hits
+        self.misses += len(keys) - num_hits
+        return embeddings
+
+    def put_many(self, keys: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        """Cache embeddings."""
+        for key, embedding in zip(keys, embeddings):
+            self.put(key, embedding)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that were cache hits."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset hit and miss counts."""
+        self.hits = 0
+        self.misses = 0
+
+
+class SimpleEmbeddingCache(BaseEmbeddingCache):
+    """In-memory LRU embedding cache.
+
+    Args:
+        max_size (int): max number of cached embeddings.
+
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Init params."""
+        super().__init__()
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self._max_size = max_size
+        self._data: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        """Get a copy of an embedding, or None if it is not cached."""
+        embedding = self._data.get(key)
+        if embedding is None:
+            return None
+        self._data.move_to_end(key)
+        # NOTE: copy, so that callers can't modify the cached embedding
+        return list(embedding)
+
+    def put(self, key: str, embedding: List[float]) -> None:
+        """Cache an embedding, evicting the least recently used one if full."""
+        self._data[key] = list(embedding)
+        self._data.move_to_end(key)
+        if len(self._data) > self._max_size:
+            self._data.popitem(last=False)
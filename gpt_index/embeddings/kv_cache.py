@@ -0,0 +1,76 @@
+"""Key-value store backed embedding cache."""
+
+from typing import List, Optional, Sequence
+
+from gpt_index.embeddings.cache import BaseEmbeddingCache
+from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from gpt_index.storage.kvstore.types import BaseInMemoryKVStore, BaseKVStore
+
+DEFAULT_NAMESPACE = "embed_cache"
+
+
+class KVEmbeddingCache(BaseEmbeddingCache):
+    """Embedding cache backed by a key-value store.
+
+    Any BaseKVStore can be used, e.g. a persisted SimpleKVStore or a
+    MongoDBKVStore, so that cached embeddings survive across runs.
+
+    Args:
+        kvstore (Optional[BaseKVStore]): key-value store.
+            Defaults to a SimpleKVStore.
+        namespace (Optional[str]): namespace for the cache.
+
+    """
+
+    def __init__(
+        self,
+        kvstore: Optional[BaseKVStore] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """Init params."""
+        super().__init__()
+        self._kvstore = kvstore or SimpleKVStore()
+        self._collection = f"{namespace or DEFAULT_NAMESPACE}/data"
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        """Get an embedding, or None if it is not cached."""
+        value = self._kvstore.get(key, collection=self._collection)
+        if value is None:
+            return None
+        # NOTE: copy, as in-memory kvstores only make shallow copies of values
+        return list(value["embedding"])
+
+    def _get_many(self, keys: Sequence[str]) -> List[Optional[List[float]]]:
+        """Get embeddings, with a single bulk read of the kvstore."""
+        values = self._kvstore.get_many(keys, collection=self._collection)
+        return [
+            list(values[key]["embedding"]) if key in values else None for key in keys
+        ]
+
+    def put(self, key: str, embedding: List[float]) -> None:
+        """Cache an embedding."""
+        self._kvstore.put(
+            key, {"embedding": list(embedding)}, collection=self._collection
+        )
+
+    def put_many(self, keys: Sequence[str], embeddings: Sequence[List[float]]) -> None:
+        """Cache embeddings, with a single bulk write to the kvstore."""
+        self._kvstore.put_many(
+            [
+                (key, {"embedding": list(embedding)})
+                for key, embedding in zip(keys, embeddings)
+            ],
+            collection=self._collection,
+        )
+
+    def persist(self, persist_path: str) -> None:
+        """Persist the cache, if the key-value store is in-memory."""
+        if isinstance(self._kvstore, BaseInMemoryKVStore):
+            self._kvstore.persist(persist_path)
+
+    @classmethod
+    def from_persist_path(
+        cls, persist_path: str, namespace: Optional[str] = None
+    ) -> "KVEmbeddingCache":
+        """Load a KVEmbeddingCache persisted with a SimpleKVStore."""
+        return cls(SimpleKVStore.from_persist_path(persist_path), namespace)
@@ -21,6 +21,16 @@ class LangchainEmbedding(BaseEmbedding):
         super().__init__(**kwargs)
         self._langchain_embedding = langchain_embedding
 
+    @property
+    def model_id(self) -> str:
+        """Get an identifier of the embedding model, used for caching."""
+        model_id = type(self._langchain_embedding).__name__
+        for attr in ("model_name", "model", "deployment"):
+            model_name = getattr(self._langchain_embedding, attr, None)
+            if isinstance(model_name, str):
+                model_id += f"/{model_name}"
+        return model_id
+
     def _get_query_embedding(self, query: str) -> List[float]:
         """Get query embedding."""
         return self._langchain_embedding.embed_query(query)
@@ -211,6 +211,12 @@ class OpenAIEmbedding(BaseEmbedding):
         self.model = OpenAIEmbeddingModelType(model)
         self.deployment_name = deployment_name
 
+    @property
+    def model_id(self) -> str:
+        """Get an identifier of the embedding model, used for caching."""
+        model_name = self.deployment_name or self.model.value
+        return f"{type(self).__name__}/{self.mode.value}/{model_name}"
+
     def _get_query_embedding(self, query: str) -> List[float]:
         """Get query embedding."""
         if self.deployment_name is not None:
@@ -222,6 +228,17 @@ class OpenAIEmbedding(BaseEmbedding):
             engine = _QUERY_MODE_MODEL_DICT[key]
         return get_embedding(query, engine=engine)
 
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        """Asynchronously get query embedding."""
+        if self.deployment_name is not None:
+            engine = self.deployment_name
+        else:
+            key = (self.mode, self.model)
+            if key not in _QUERY_MODE_MODEL_DICT:
+                raise ValueError(f"Invalid mode, model combination: {key}")
+            engine = _QUERY_MODE_MODEL_DICT[key]
+        return await aget_embedding(query, engine=engine)
+
     def _get_text_embedding(self, text: str) -> List[float]:
         """Get text embedding."""
         if self.deployment_name is not None:
@@ -258,7 +275,13 @@ class OpenAIEmbedding(BaseEmbedding):
             if key not in _TEXT_MODE_MODEL_DICT:
                 raise ValueError(f"Invalid mode, model combination: {key}")
             engine = _TEXT_MODE_MODEL_DICT[key]
-        embeddings = get_embeddings(texts, engine=engine)
+        embed_fn = get_embeddings
+        if self.embed_scheduler is not None:
+            # NOTE: the scheduler retries throttled requests itself
+            embed_fn = get_embeddings.retry_with(  # type: ignore
+                stop=stop_after_attempt(1), reraise=True
+            )
+        embeddings = embed_fn(texts, engine=engine)
         return embeddings
 
     async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
@@ -270,5 +293,11 @@ class OpenAIEmbedding(BaseEmbedding):
             if key not in _TEXT_MODE_MODEL_DICT:
                 raise ValueError(f"Invalid mode, model combination: {key}")
             engine = _TEXT_MODE_MODEL_DICT[key]
-        embeddings = await aget_embeddings(texts, engine=engine)
+        aembed_fn = aget_embeddings
+        if self.embed_scheduler is not None:
+            # NOTE: the scheduler retries throttled requests itself
+            aembed_fn = aget_embeddings.retry_with(  # type: ignore
+                stop=stop_after_attempt(1), reraise=True
+            )
+        embeddings = await aembed_fn(texts, engine=engine)
         return embeddings
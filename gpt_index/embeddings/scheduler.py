@@ -0,0 +1,226 @@
+"""Embedding scheduler.
+
+Schedules batched embedding calls under a concurrency cap and
+request/token per-minute budgets, retrying throttled requests with backoff.
+
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional
+
+import openai
+import tenacity
+
+from gpt_index.utils import (
+    ErrorToRetry,
+    RateLimiter,
+    aretry_on_exceptions_with_backoff,
+    retry_on_exceptions_with_backoff,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_TRIES = 6
+# NOTE: well above typical batches of chunks, but keeps a batch of texts that
+# are close to the 8191 token input limit of OpenAI embeddings in check
+DEFAULT_MAX_BATCH_TOKENS = 32768
+
+
+def _get_default_errors_to_retry() -> List[ErrorToRetry]:
+    """Get the OpenAI throttling errors retried by default."""
+    return [
+        ErrorToRetry(openai.error.RateLimitError),
+        ErrorToRetry(openai.error.ServiceUnavailableError),
+        ErrorToRetry(openai.error.TryAgain),
+        ErrorToRetry(openai.error.APIConnectionError, lambda e: e.should_retry),
+    ]
+
+
+def _reraise_retry_error(e: tenacity.RetryError) -> None:
+    """Raise the last error of an embedding function that retries with tenacity.
+
+    e.g. the OpenAI embedding functions, so that the scheduler can retry
+    throttling errors (reserving rate limit budgets again).
+
+    """
+    last_error = e.last_attempt.exception()
+    if last_error is None:
+        raise e
+    raise last_error from e
+
+
+class EmbeddingScheduler:
+    """Embedding scheduler.
+
+    Splits texts into batches of at most `max_batch_size` texts and
+    `max_batch_tokens` tokens, and embeds up to `max_concurrency` batches at
+    a time (with threads in the sync path, and tasks in the async path).
+    Each request waits for the request and token budgets before being sent.
+
+    Args:
+        max_concurrency (int): max number of in-flight embedding requests.
+        max_batch_size (Optional[int]): max number of texts per request.
+            Defaults to the `embed_batch_size` of the embedding model.
+        max_batch_tokens (Optional[int]): max number of tokens per request.
+            A text with more tokens is sent in a batch of its own.
+            Defaults to DEFAULT_MAX_BATCH_TOKENS, None disables it.
+        max_requests_per_minute (Optional[int]): request budget.
+        max_tokens_per_minute (Optional[int]): token budget.
+        errors_to_retry (Optional[List[ErrorToRetry]]): errors retried with
+            backoff. Defaults to OpenAI throttling errors.
+        max_tries (int): max number of tries per request.
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_batch_size: Optional[int] = None,
+        max_batch_tokens: Optional[int] = DEFAULT_MAX_BATCH_TOKENS,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+        errors_to_retry: Optional[List[ErrorToRetry]] = None,
+        max_tries: int = DEFAULT_MAX_TRIES,
+    ) -> None:
+        """Init params."""
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ValueError("max_batch_size must be > 0")
+        if max_batch_tokens is not None and max_batch_tokens <= 0:
+            raise ValueError("max_batch_tokens must be > 0")
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.errors_to_retry = errors_to_retry or _get_default_errors_to_retry()
+        self.max_tries = max_tries
+
+        self._request_limiter = (
+            RateLimiter(max_requests_per_minute) if max_requests_per_minute else None
+        )
+        self._token_limiter = (
+            RateLimiter(max_tokens_per_minute) if max_tokens_per_minute else None
+        )
+
+    def get_batches(
+        self, token_counts: List[int], default_batch_size: int
+    ) -> List[List[int]]:
+        """Split texts into batches, given their token counts.
+
+        Returns:
+            List[List[int]]: batches of text indices, in order.
+
+        """
+        max_batch_size = self.max_batch_size or default_batch_size
+        batches: List[List[int]] = []
+        cur_batch: List[int] = []
+        cur_batch_tokens = 0
+        for idx, num_tokens in enumerate(token_counts):
+            if cur_batch and (
+                len(cur_batch) == max_batch_size
+                or (
+                    self.max_batch_tokens is not None
+                    and cur_batch_tokens + num_tokens > self.max_batch_tokens
+                )
+            ):
+                batches.append(cur_batch)
+                cur_batch = []
+                cur_batch_tokens = 0
+            cur_batch.append(idx)
+            cur_batch_tokens += num_tokens
+        if cur_batch:
+            batches.append(cur_batch)
+        return batches
+
+    def _get_wait_secs(self, num_tokens: int) -> float:
+        """Reserve budget for a request, returning how long to wait for it."""
+        wait_secs = 0.0
+        if self._request_limiter is not None:
+            wait_secs = self._request_limiter.reserve(1)
+        if self._token_limiter is not None:
+            wait_secs = max(wait_secs, self._token_limiter.reserve(num_tokens))
+        if wait_secs > 0:
+            logger.debug(f"> Waiting {wait_secs:.2f}s for embedding rate limits.")
+        return wait_secs
+
+    def embed(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        texts: List[str],
+        token_counts: List[int],
+        default_batch_size: int,
+    ) -> List[List[float]]:
+        """Embed texts with a batch embedding function, in order."""
+        batches = self.get_batches(token_counts, default_batch_size)
+
+        def _embed_batch(batch: List[int]) -> List[List[float]]:
+            batch_texts = [texts[i] for i in batch]
+            num_tokens = sum(token_counts[i] for i in batch)
+
+            def _try_embed_batch() -> List[List[float]]:
+                # NOTE: every try is a request, so reserves budget again
+                wait_secs = self._get_wait_secs(num_tokens)
+                if wait_secs > 0:
+                    time.sleep(wait_secs)
+                try:
+                    return embed_fn(batch_texts)
+                except tenacity.RetryError as e:
+                    _reraise_retry_error(e)
+                    raise
+
+            return retry_on_exceptions_with_backoff(
+                _try_embed_batch, self.errors_to_retry, max_tries=self.max_tries
+            )
+
+        if self.max_concurrency == 1 or len(batches) <= 1:
+            batch_embeddings = [_embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches))
+            ) as executor:
+                batch_embeddings = list(executor.map(_embed_batch, batches))
+        return [
+            embedding for embeddings in batch_embeddings for embedding in embeddings
+        ]
+
+    async def aembed(
+        self,
+        aembed_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+        texts: List[str],
+        token_counts: List[int],
+        default_batch_size: int,
+    ) -> List[List[float]]:
+        """Asynchronously embed texts with a batch embedding function, in order."""
+        batches = self.get_batches(token_counts, default_batch_size)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _aembed_batch(batch: List[int]) -> List[List[float]]:
+            batch_texts = [texts[i] for i in batch]
+            num_tokens = sum(token_counts[i] for i in batch)
+
+            async def _atry_embed_batch() -> List[List[float]]:
+                # NOTE: every try is a request, so reserves budget again
+                wait_secs = self._get_wait_secs(num_tokens)
+                if wait_secs > 0:
+                    await asyncio.sleep(wait_secs)
+                try:
+                    return await aembed_fn(batch_texts)
+                except tenacity.RetryError as e:
+                    _reraise_retry_error(e)
+                    raise
+
+            async with semaphore:
+                return await aretry_on_exceptions_with_backoff(
+                    _atry_embed_batch, self.errors_to_retry, max_tries=self.max_tries
+                )
+
+        batch_embeddings = await asyncio.gather(
+            *[_aembed_batch(batch) for batch in batches]
+        )
+        return [
+            embedding for embeddings in batch_embeddings for embedding in embeddings
+        ]
@@ -1,7 +1,7 @@
 """Base index classes."""
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Optional, Sequence, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Type, TypeVar
 
 from gpt_index.callbacks.schema import CBEventType
 from gpt_index.data_structs.data_structs_v2 import V2IndexStruct
@@ -19,6 +19,8 @@ IndexType = TypeVar("IndexType", bound="BaseGPTIndex")
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHECKPOINT_BATCH_SIZE = 1000
+
 
 class BaseGPTIndex(Generic[IS], ABC):
     """Base LlamaIndex.
@@ -104,6 +106,128 @@ class BaseGPTIndex(Generic[IS], ABC):
             **kwargs,
         )
 
+    @classmethod
+    def from_documents_with_checkpoints(
+        cls: Type[IndexType],
+        documents: Sequence[Document],
+        index_id: str,
+        storage_context: Optional[StorageContext] = None,
+        service_context: Optional[ServiceContext] = None,
+        checkpoint_batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE,
+        persist_dir: Optional[str] = None,
+        **kwargs: Any,
+    ) -> IndexType:
+        """Create index from documents, checkpointing the build.
+
+        Documents are inserted in batches of at least `checkpoint_batch_size`
+        nodes. After each batch, the index struct is written to the index store,
+        and the hashes of the inserted documents to the docstore.
+
+        If the build fails, calling this again with the same `index_id` and
+        storage context resumes from the last checkpoint: documents that were
+        already inserted are skipped, and documents that changed since are
+        deleted and inserted again.
+
+        Args:
+            documents (Sequence[Document]): List of documents to
+                build the index from.
+            index_id (str): id of the index struct, used to find the checkpoint.
+            checkpoint_batch_size (int): min number of nodes between checkpoints.
+            persist_dir (Optional[str]): if set, the storage context is persisted
+                to this directory after each checkpoint. Not needed when the
+                stores are backed by a database.
+
+        """
+        if checkpoint_batch_size <= 0:
+            raise ValueError("checkpoint_batch_size must be > 0")
+        storage_context = storage_context or StorageContext.from_defaults()
+        service_context = service_context or ServiceContext.from_defaults()
+        docstore = storage_context.docstore
+
+        index_struct = storage_context.index_store.get_index_struct(index_id)
+        if index_struct is None:
+            index = cls(
+                nodes=[],
+                storage_context=storage_context,
+                service_context=service_context,
+                **kwargs,
+            )
+            index.set_index_id(index_id)
+        elif isinstance(index_struct, cls.index_struct_cls):
+            logger.info(f"> Resuming build of index: {index_id}")
+            index = cls(
+                index_struct=index_struct,
+                storage_context=storage_context,
+                service_context=service_context,
+                **kwargs,
+            )
+        else:
+            raise ValueError(
+                f"Index struct {index_id} is a {type(index_struct).__name__}, "
+                f"expected a {cls.index_struct_cls.__name__}."
+            )
+
+        existing_doc_hashes = docstore.get_document_hashes(
+            [doc.get_doc_id() for doc in documents]
+        )
+        pending_documents = []
+        stale_doc_ids = []
+        for doc in documents:
+            doc_hash = existing_doc_hashes.get(doc.get_doc_id())
+            if doc_hash == doc.get_doc_hash():
+                continue
+            if doc_hash is not None:
+                stale_doc_ids.append(doc.get_doc_id())
+            pending_documents.append(doc)
+        logger.info(
+            f"> Skipping {len(documents) - len(pending_documents)} "
+            "already indexed documents"
+        )
+        if len(stale_doc_ids) > 0:
+            index.delete_many(stale_doc_ids)
+
+        event_id = service_context.callback_manager.on_event_start(
+            CBEventType.CHUNKING, payload={"documents": pending_documents}
+        )
+        doc_nodes = [
+            service_context.node_parser.get_nodes_from_documents([doc])
+            for doc in pending_documents
+        ]
+        service_context.callback_manager.on_event_end(
+            CBEventType.CHUNKING,
+            payload={"nodes": [node for nodes in doc_nodes for node in nodes]},
+            event_id=event_id,
+        )
+
+        # NOTE: a document is never split across checkpoints, so that documents
+        # are either fully inserted or skipped when resuming
+        batch_docs: List[Document] = []
+        batch_nodes: List[Node] = []
+        for i, (doc, nodes) in enumerate(zip(pending_documents, doc_nodes)):
+            batch_docs.append(doc)
+            batch_nodes.extend(nodes)
+            if (
+                len(batch_nodes) < checkpoint_batch_size
+                and i < len(pending_documents) - 1
+            ):
+                continue
+            # NOTE: this also writes the index struct to the index store
+            index.insert_nodes(batch_nodes)
+            docstore.set_document_hashes(
+                {
+                    batch_doc.get_doc_id(): batch_doc.get_doc_hash()
+                    for batch_doc in batch_docs
+                }
+            )
+            if persist_dir is not None:
+                storage_context.persist(persist_dir=persist_dir)
+            logger.info(
+                f"> Checkpoint: {i + 1}/{len(pending_documents)} documents indexed"
+            )
+            batch_docs, batch_nodes = [], []
+
+        return index
+
     @property
     def index_struct(self) -> IS:
         """Get the index struct."""
@@ -170,6 +294,20 @@ class BaseGPTIndex(Generic[IS], ABC):
         self._insert(nodes, **insert_kwargs)
         self._storage_context.index_store.add_index_struct(self._index_struct)
 
+    def _insert_nodes_with_embeddings(
+        self,
+        nodes: Sequence[Node],
+        embeddings_by_text: Dict[str, List[float]],
+        **insert_kwargs: Any,
+    ) -> None:
+        """Insert nodes, reusing the embeddings of their texts if known.
+
+        By default, this is a wrapper around insert_nodes, as indices
+        that don't store embeddings have none to reuse.
+
+        """
+        self.insert_nodes(nodes, **insert_kwargs)
+
     def insert(self, document: Document, **insert_kwargs: Any) -> None:
         """Insert a document."""
         event_id = self.service_context.callback_manager.on_event_start(
@@ -199,6 +337,30 @@ class BaseGPTIndex(Generic[IS], ABC):
         self._delete(doc_id, **delete_kwargs)
         self._storage_context.index_store.add_index_struct(self._index_struct)
 
+    def _delete_many(self, doc_ids: Sequence[str], **delete_kwargs: Any) -> None:
+        """Delete documents.
+
+        By default, this deletes documents one at a time.
+        Meant to be overriden if the index supports bulk deletes.
+
+        """
+        for doc_id in doc_ids:
+            self._delete(doc_id, **delete_kwargs)
+
+    def delete_many(self, doc_ids: Sequence[str], **delete_kwargs: Any) -> None:
+        """Delete documents from the index.
+
+        Equivalent to calling `delete` for each document, but the index struct
+        is only written to the index store once.
+
+        Args:
+            doc_ids (Sequence[str]): document ids
+
+        """
+        logger.debug(f"> Deleting {len(doc_ids)} documents")
+        self._delete_many(doc_ids, **delete_kwargs)
+        self._storage_context.index_store.add_index_struct(self._index_struct)
+
     def update(self, document: Document, **update_kwargs: Any) -> None:
         """Update a document.
 
@@ -213,6 +375,15 @@ class BaseGPTIndex(Generic[IS], ABC):
         self.delete(document.get_doc_id(), **update_kwargs.pop("delete_kwargs", {}))
         self.insert(document, **update_kwargs.pop("insert_kwargs", {}))
 
+    def _get_embeddings_by_text(self, doc_ids: Sequence[str]) -> Dict[str, List[float]]:
+        """Get the embeddings of the nodes of documents, keyed by node text.
+
+        Used to avoid embedding unchanged text again on refresh.
+        Meant to be overriden by indices that store node embeddings.
+
+        """
+        return {}
+
     def refresh(
         self, documents: Sequence[Document], **update_kwargs: Any
     ) -> List[bool]:
@@ -221,17 +392,63 @@ class BaseGPTIndex(Generic[IS], ABC):
         This allows users to save LLM and Embedding model calls, while only
         updating documents that have any changes in text or extra_info. It
         will also insert any documents that previously were not stored.
+
+        Changed documents are deleted together, then changed and new documents
+        are parsed and inserted together. Nodes of changed documents whose text
+        did not change keep their embeddings, if the index stores them.
+
         """
+        insert_kwargs = update_kwargs.pop("insert_kwargs", {})
+        delete_kwargs = update_kwargs.pop("delete_kwargs", {})
+        existing_doc_hashes = self._docstore.get_document_hashes(
+            [document.get_doc_id() for document in documents]
+        )
+
         refreshed_documents = [False] * len(documents)
+        # NOTE: if a doc_id is repeated, the last changed document is kept
+        new_documents: Dict[str, Document] = {}
+        stale_doc_ids: Set[str] = set()
         for i, document in enumerate(documents):
-            existing_doc_hash = self._docstore.get_document_hash(document.get_doc_id())
-            if existing_doc_hash != document.get_doc_hash():
-                self.update(document, **update_kwargs)
-                refreshed_documents[i] = True
-            elif existing_doc_hash is None:
-                self.insert(document, **update_kwargs.pop("insert_kwargs", {}))
-                refreshed_documents[i] = True
+            doc_id = document.get_doc_id()
+            doc_hash = document.get_doc_hash()
+            existing_doc_hash: Optional[str]
+            if doc_id in new_documents:
+                existing_doc_hash = new_documents[doc_id].get_doc_hash()
+            else:
+                existing_doc_hash = existing_doc_hashes.get(doc_id)
+            if existing_doc_hash == doc_hash:
+                continue
+            if doc_id in existing_doc_hashes:
+                stale_doc_ids.add(doc_id)
+            new_documents[doc_id] = document
+            refreshed_documents[i] = True
+
+        if len(new_documents) == 0:
+            return refreshed_documents
+        logger.info(
+            f"> Refreshing {len(new_documents)} documents, "
+            f"{len(stale_doc_ids)} of them were changed"
+        )
 
+        embeddings_by_text: Dict[str, List[float]] = {}
+        if len(stale_doc_ids) > 0:
+            embeddings_by_text = self._get_embeddings_by_text(list(stale_doc_ids))
+            self.delete_many(list(stale_doc_ids), **delete_kwargs)
+
+        documents_to_insert = list(new_documents.values())
+        event_id = self.service_context.callback_manager.on_event_start(
+            CBEventType.CHUNKING, payload={"documents": documents_to_insert}
+        )
+        nodes = self.service_context.node_parser.get_nodes_from_documents(
+            documents_to_insert
+        )
+        self.service_context.callback_manager.on_event_end(
+            CBEventType.CHUNKING, payload={"nodes": nodes}, event_id=event_id
+        )
+        self._insert_nodes_with_embeddings(nodes, embeddings_by_text, **insert_kwargs)
+        self._docstore.set_document_hashes(
+            {doc_id: doc.get_doc_hash() for doc_id, doc in new_documents.items()}
+        )
         return refreshed_documents
 
     @abstractmethod
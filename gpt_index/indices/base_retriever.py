@@ -28,3 +28,24 @@ class BaseRetriever(ABC):
 
         """
         pass
+
+    async def aretrieve(self, str_or_query_bundle: QueryType) -> List[NodeWithScore]:
+        """Asynchronously retrieve nodes given query.
+
+        Args:
+            str_or_query_bundle (QueryType): Either a query string or
+                a QueryBundle object.
+
+        """
+        if isinstance(str_or_query_bundle, str):
+            str_or_query_bundle = QueryBundle(str_or_query_bundle)
+        return await self._aretrieve(str_or_query_bundle)
+
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """Asynchronously retrieve nodes given query.
+
+        By default, this falls back to _retrieve.
+        Meant to be overriden if there is a true async implementation.
+
+        """
+        return self._retrieve(query_bundle)
@@ -3,7 +3,7 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Awaitable, Dict, List, Optional, Sequence, Tuple, Union
 
 from gpt_index.async_utils import run_async_tasks
 from gpt_index.callbacks.schema import CBEventType
@@ -17,6 +17,8 @@ from gpt_index.prompts.prompts import SummaryPrompt
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class GPTTreeIndexBuilder:
     """GPT tree index builder.
@@ -33,14 +35,18 @@ class GPTTreeIndexBuilder:
         service_context: ServiceContext,
         docstore: Optional[BaseDocumentStore] = None,
         use_async: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         """Initialize with params."""
         if num_children < 2:
             raise ValueError("Invalid number of children.")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         self.num_children = num_children
         self.summary_prompt = summary_prompt
         self._service_context = service_context
         self._use_async = use_async
+        self._max_concurrency = max_concurrency
         self._docstore = docstore or get_default_docstore()
 
     @property
@@ -74,10 +80,7 @@ class GPTTreeIndexBuilder:
         self, cur_node_ids: Dict[int, str]
     ) -> Tuple[List[int], List[List[Node]], List[str]]:
         """Prepare node and text chunks."""
-        cur_nodes = {
-            index: self._docstore.get_node(node_id)
-            for index, node_id in cur_node_ids.items()
-        }
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
         cur_node_list = get_sorted_node_list(cur_nodes)
         logger.info(
             f"> Building index from nodes: {len(cur_nodes) // self.num_children} chunks"
@@ -106,6 +109,7 @@ class GPTTreeIndexBuilder:
 
         """
         new_node_dict = {}
+        new_nodes = []
         for i, cur_nodes_chunk, new_summary in zip(
             indices, cur_nodes_chunks, summaries
         ):
@@ -119,7 +123,8 @@ class GPTTreeIndexBuilder:
             index_graph.insert(new_node, children_nodes=cur_nodes_chunk)
             index = index_graph.get_index(new_node)
             new_node_dict[index] = new_node.get_doc_id()
-            self._docstore.add_documents([new_node], allow_update=False)
+            new_nodes.append(new_node)
+        self._docstore.add_documents(new_nodes, allow_update=False)
         return new_node_dict
 
     def build_index_from_nodes(
@@ -130,6 +135,16 @@ class GPTTreeIndexBuilder:
         level: int = 0,
     ) -> IndexGraph:
         """Consolidates chunks recursively, in a bottoms-up fashion."""
+        if self._use_async:
+            outputs: List[IndexGraph] = run_async_tasks(
+                [
+                    self.abuild_index_from_nodes(
+                        index_graph, cur_node_ids, all_node_ids, level=level
+                    )
+                ]
+            )
+            return outputs[0]
+
         if len(cur_node_ids) <= self.num_children:
             index_graph.root_nodes = cur_node_ids
             return index_graph
@@ -140,23 +155,12 @@ class GPTTreeIndexBuilder:
         event_id = self._service_context.callback_manager.on_event_start(
             CBEventType.TREE, payload={"chunks": text_chunks}
         )
-
-        if self._use_async:
-            tasks = [
-                self._service_context.llm_predictor.apredict(
-                    self.summary_prompt, context_str=text_chunk
-                )
-                for text_chunk in text_chunks
-            ]
-            outputs: List[Tuple[str, str]] = run_async_tasks(tasks)
-            summaries = [output[0] for output in outputs]
-        else:
-            summaries = [
-                self._service_context.llm_predictor.predict(
-                    self.summary_prompt, context_str=text_chunk
-                )[0]
-                for text_chunk in text_chunks
-            ]
+        summaries = [
+            self._service_context.llm_predictor.predict(
+                self.summary_prompt, context_str=text_chunk
+            )[0]
+            for text_chunk in text_chunks
+        ]
         self._service_context.llama_logger.add_log(
             {"summaries": summaries, "level": level}
         )
@@ -180,6 +184,40 @@ class GPTTreeIndexBuilder:
                 index_graph, new_node_dict, all_node_ids, level=level + 1
             )
 
+    async def _asummarize_nodes(
+        self,
+        index_graph: IndexGraph,
+        children: Sequence[Union[Node, Awaitable[Node]]],
+        index: int,
+        level: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Node:
+        """Summarize a chunk of nodes, once all of them are available."""
+        cur_nodes_chunk = [
+            child if isinstance(child, Node) else await child for child in children
+        ]
+        text_chunk = self._service_context.prompt_helper.get_text_from_nodes(
+            cur_nodes_chunk, prompt=self.summary_prompt
+        )
+        async with semaphore:
+            event_id = self._service_context.callback_manager.on_event_start(
+                CBEventType.TREE, payload={"chunks": [text_chunk]}
+            )
+            new_summary, _ = await self._service_context.llm_predictor.apredict(
+                self.summary_prompt, context_str=text_chunk
+            )
+            self._service_context.callback_manager.on_event_end(
+                CBEventType.TREE,
+                payload={"summaries": [new_summary], "level": level},
+                event_id=event_id,
+            )
+        logger.debug(f"> {index}, summary: {truncate_text(new_summary, 50)}")
+        new_node = Node(
+            text=new_summary,
+        )
+        index_graph.insert(new_node, index=index, children_nodes=cur_nodes_chunk)
+        return new_node
+
     async def abuild_index_from_nodes(
         self,
         index_graph: IndexGraph,
@@ -187,45 +225,67 @@ class GPTTreeIndexBuilder:
         all_node_ids: Dict[int, str],
         level: int = 0,
     ) -> IndexGraph:
-        """Consolidates chunks recursively, in a bottoms-up fashion."""
+        """Consolidates chunks in a bottoms-up fashion.
+
+        A chunk of nodes is summarized as soon as all of its children are,
+        instead of waiting for the whole level below to be summarized.
+        At most max_concurrency summaries are requested at a time.
+
+        """
         if len(cur_node_ids) <= self.num_children:
             index_graph.root_nodes = cur_node_ids
             return index_graph
 
-        indices, cur_nodes_chunks, text_chunks = self._prepare_node_and_text_chunks(
-            cur_node_ids
-        )
-        event_id = self._service_context.callback_manager.on_event_start(
-            CBEventType.TREE, payload={"chunks": text_chunks}
-        )
-
-        tasks = [
-            self._service_context.llm_predictor.apredict(
-                self.summary_prompt, context_str=text_chunk
-            )
-            for text_chunk in text_chunks
-        ]
-        outputs: List[Tuple[str, str]] = await asyncio.gather(*tasks)
-        summaries = [output[0] for output in outputs]
-        self._service_context.llama_logger.add_log(
-            {"summaries": summaries, "level": level}
-        )
-        self._service_context.callback_manager.on_event_end(
-            CBEventType.TREE,
-            payload={"summaries": summaries, "level": level},
-            event_id=event_id,
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
+        cur_node_list: List[Union[Node, Awaitable[Node]]] = list(
+            get_sorted_node_list(cur_nodes)
         )
+        semaphore = asyncio.Semaphore(self._max_concurrency)
 
-        new_node_dict = self._construct_parent_nodes(
-            index_graph, indices, cur_nodes_chunks, summaries
+        # NOTE: schedule all levels upfront, the new nodes get the same indices
+        # as when building one level at a time
+        level_tasks: List[List["asyncio.Task[Node]"]] = []
+        next_index = index_graph.size
+        while len(cur_node_list) > self.num_children:
+            cur_level = level + len(level_tasks)
+            tasks = []
+            for i in range(0, len(cur_node_list), self.num_children):
+                coroutine = self._asummarize_nodes(
+                    index_graph,
+                    cur_node_list[i : i + self.num_children],
+                    next_index,
+                    cur_level,
+                    semaphore,
+                )
+                tasks.append(asyncio.ensure_future(coroutine))
+                next_index += 1
+            level_tasks.append(tasks)
+            cur_node_list = list(tasks)
+        logger.info(
+            f"> Building index from nodes: "
+            f"{sum(len(tasks) for tasks in level_tasks)} chunks"
         )
-        all_node_ids.update(new_node_dict)
 
-        index_graph.root_nodes = new_node_dict
+        all_tasks = [task for tasks in level_tasks for task in tasks]
+        try:
+            await asyncio.gather(*all_tasks)
+        except BaseException:
+            for task in all_tasks:
+                task.cancel()
+            raise
 
-        if len(new_node_dict) <= self.num_children:
-            return index_graph
-        else:
-            return await self.abuild_index_from_nodes(
-                index_graph, new_node_dict, all_node_ids, level=level + 1
+        for i, tasks in enumerate(level_tasks):
+            new_nodes = [task.result() for task in tasks]
+            self._service_context.llama_logger.add_log(
+                {
+                    "summaries": [node.get_text() for node in new_nodes],
+                    "level": level + i,
+                }
             )
+            self._docstore.add_documents(new_nodes, allow_update=False)
+            new_node_dict = {
+                index_graph.get_index(node): node.get_doc_id() for node in new_nodes
+            }
+            all_node_ids.update(new_node_dict)
+            index_graph.root_nodes = new_node_dict
+        return index_graph
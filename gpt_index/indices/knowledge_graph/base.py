@@ -8,24 +8,33 @@ existing keywords in the table.
 
 """
 
+import asyncio
 import logging
-from typing import Any, List, Optional, Sequence, Tuple
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from gpt_index.async_utils import run_async_tasks
 from gpt_index.callbacks.schema import CBEventType
 from gpt_index.data_structs.data_structs_v2 import KG
 from gpt_index.data_structs.node_v2 import Node
 from gpt_index.indices.base import BaseGPTIndex
 from gpt_index.indices.base_retriever import BaseRetriever
 from gpt_index.prompts.default_prompts import (
+    DEFAULT_KG_TRIPLET_EXTRACT_MULTI_PROMPT,
     DEFAULT_KG_TRIPLET_EXTRACT_PROMPT,
     DEFAULT_QUERY_KEYWORD_EXTRACT_TEMPLATE,
 )
 from gpt_index.prompts.prompts import KnowledgeGraphPrompt
+from gpt_index.utils import globals_helper
 
 DQKET = DEFAULT_QUERY_KEYWORD_EXTRACT_TEMPLATE
 
+DEFAULT_MAX_CONCURRENCY = 8
+
 logger = logging.getLogger(__name__)
 
+Triplet = Tuple[str, str, str]
+
 
 class GPTKnowledgeGraphIndex(BaseGPTIndex[KG]):
     """GPT Knowledge Graph Index.
@@ -36,6 +45,17 @@ class GPTKnowledgeGraphIndex(BaseGPTIndex[KG]):
         kg_triple_extract_template (KnowledgeGraphPrompt): The prompt to use for
             extracting triplets.
         max_triplets_per_chunk (int): The maximum number of triplets to extract.
+        include_embeddings (bool): Whether to embed the triplets, for hybrid
+            retrieval. All new triplets are embedded in a single batched pass.
+        use_async (bool): Whether to extract triplets with concurrent async
+            LLM calls. Defaults to False.
+        max_concurrency (int): The maximum number of concurrent extraction
+            calls when `use_async` is set.
+        num_chunks_per_prompt (int): The maximum number of chunks packed into
+            a single extraction prompt. Chunks are only packed while they fit
+            in the prompt. Defaults to 1 (one prompt per chunk).
+        kg_triple_extract_multi_template (KnowledgeGraphPrompt): The prompt to
+            use for extracting triplets from several numbered chunks at once.
 
     """
 
@@ -48,11 +68,22 @@ class GPTKnowledgeGraphIndex(BaseGPTIndex[KG]):
         kg_triple_extract_template: Optional[KnowledgeGraphPrompt] = None,
         max_triplets_per_chunk: int = 10,
         include_embeddings: bool = False,
+        use_async: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        num_chunks_per_prompt: int = 1,
+        kg_triple_extract_multi_template: Optional[KnowledgeGraphPrompt] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        if num_chunks_per_prompt <= 0:
+            raise ValueError("num_chunks_per_prompt must be > 0")
         # need to set parameters before building index in base class.
         self.include_embeddings = include_embeddings
+        self._use_async = use_async
+        self._max_concurrency = max_concurrency
+        self.num_chunks_per_prompt = num_chunks_per_prompt
         self.max_triplets_per_chunk = max_triplets_per_chunk
         self.kg_triple_extract_template = (
             kg_triple_extract_template or DEFAULT_KG_TRIPLET_EXTRACT_PROMPT
@@ -63,6 +94,9 @@ class GPTKnowledgeGraphIndex(BaseGPTIndex[KG]):
                 max_knowledge_triplets=self.max_triplets_per_chunk
             )
         )
+        self.kg_triple_extract_multi_template = (
+            kg_triple_extract_multi_template or DEFAULT_KG_TRIPLET_EXTRACT_MULTI_PROMPT
+        ).partial_format(max_knowledge_triplets=self.max_triplets_per_chunk)
 
         super().__init__(
             nodes=nodes,
@@ -81,14 +115,37 @@ class GPTKnowledgeGraphIndex(BaseGPTIndex[KG]):
 
         return KGTableRetriever(self, **kwargs)
 
-    def _extract_triplets(self, text: str) -> List[Tuple[str, str, str]]:
+    def _extract_triplets(self, text: str) -> List[Triplet]:
         """Extract keywords from text."""
+        response = self._predict_triplets(self.kg_triple_extract_template, text)
+        return self._parse_triplet_response(response)
+
+    async def _aextract_triplets(self, text: str) -> List[Triplet]:
+        """Asynchronously extract keywords from text."""
+        response = await self._apredict_triplets(self.kg_triple_extract_template, text)
+        return self._parse_triplet_response(response)
+
+    def _extract_triplets_multi(self, texts: List[str]) -> List[List[Triplet]]:
+        """Extract triplets of several texts with a single prompt."""
+        response = self._predict_triplets(
+            self.kg_triple_extract_multi_template, self._get_numbered_text(texts)
+        )
+        return self._parse_numbered_triplet_response(response, len(texts))
+
+    async def _aextract_triplets_multi(self, texts: List[str]) -> List[List[Triplet]]:
+        """Asynchronously extract triplets of several texts with a single prompt."""
+        response = await self._apredict_triplets(
+            self.kg_triple_extract_multi_template, self._get_numbered_text(texts)
+        )
+        return self._parse_numbered_triplet_response(response, len(texts))
+
+    def _predict_triplets(self, prompt: KnowledgeGraphPrompt, text: str) -> str:
         event_id = self._service_context.callback_manager.on_event_start(
             CBEventType.LLM,
-            payload={"template": self.kg_triple_extract_template, "text": text},
+            payload={"template": prompt, "text": text},
         )
         response, formatted_prompt = self._service_context.llm_predictor.predict(
-            self.kg_triple_extract_template,
+            prompt,
             text=text,
         )
         self._service_context.callback_manager.on_event_end(
@@ -96,84 +153,180 @@ class GPTKnowledgeGraphIndex(BaseGPTIndex[KG]):
             payload={"response": response, "formatted_prompt": formatted_prompt},
             event_id=event_id,
         )
-        return self._parse_triplet_response(response)
+        return response
+
+    async def _apredict_triplets(self, prompt: KnowledgeGraphPrompt, text: str) -> str:
+        event_id = self._service_context.callback_manager.on_event_start(
+            CBEventType.LLM,
+            payload={"template": prompt, "text": text},
+        )
+        response, formatted_prompt = await self._service_context.llm_predictor.apredict(
+            prompt,
+            text=text,
+        )
+        self._service_context.callback_manager.on_event_end(
+            CBEventType.LLM,
+            payload={"response": response, "formatted_prompt": formatted_prompt},
+            event_id=event_id,
+        )
+        return response
+
+    @staticmethod
+    def _get_numbered_text(texts: List[str]) -> str:
+        return "\n".join(f"[{i + 1}] {text}" for i, text in enumerate(texts))
 
     @staticmethod
-    def _parse_triplet_response(response: str) -> List[Tuple[str, str, str]]:
+    def _parse_triplet(text: str) -> Optional[Triplet]:
+        tokens = text[1:-1].split(",")
+        if len(tokens) != 3:
+            return None
+        subj, pred, obj = tokens
+        return subj.strip(), pred.strip(), obj.strip()
+
+    @classmethod
+    def _parse_triplet_response(cls, response: str) -> List[Triplet]:
         knowledge_strs = response.strip().split("\n")
         results = []
         for text in knowledge_strs:
-            tokens = text[1:-1].split(",")
-            if len(tokens) != 3:
+            triplet = cls._parse_triplet(text)
+            if triplet is not None:
+                results.append(triplet)
+        return results
+
+    @classmethod
+    def _parse_numbered_triplet_response(
+        cls, response: str, num_texts: int
+    ) -> List[List[Triplet]]:
+        """Demultiplex triplets prefixed by the number of their text.
+
+        Lines without a valid text number are skipped.
+
+        """
+        results: List[List[Triplet]] = [[] for _ in range(num_texts)]
+        for line in response.strip().split("\n"):
+            match = re.match(r"^\s*\[(\d+)\]\s*(.*?)\s*$", line)
+            if match is None:
                 continue
-            subj, pred, obj = tokens
-            results.append((subj.strip(), pred.strip(), obj.strip()))
+            text_idx = int(match.group(1)) - 1
+            triplet = cls._parse_triplet(match.group(2))
+            if 0 <= text_idx < num_texts and triplet is not None:
+                results[text_idx].append(triplet)
         return results
 
+    def _get_node_batches(self, nodes: Sequence[Node]) -> List[List[Node]]:
+        """Pack consecutive nodes into batches sharing an extraction prompt."""
+        if self.num_chunks_per_prompt == 1:
+            return [[n] for n in nodes]
+
+        prompt_helper = self._service_context.prompt_helper
+        # NOTE: the packed chunks only need to fit in the prompt
+        max_batch_tokens = prompt_helper.get_text_splitter_given_prompt(
+            self.kg_triple_extract_multi_template, 1, use_chunk_size_limit=False
+        ).chunk_size
+        batches: List[List[Node]] = []
+        cur_batch: List[Node] = []
+        cur_batch_tokens = 0
+        for n in nodes:
+            # NOTE: count the "[i] " prefix and the separating newline
+            num_tokens = len(globals_helper.tokenizer(n.get_text())) + 4
+            if cur_batch and (
+                len(cur_batch) == self.num_chunks_per_prompt
+                or cur_batch_tokens + num_tokens > max_batch_tokens
+            ):
+                batches.append(cur_batch)
+                cur_batch = []
+                cur_batch_tokens = 0
+            cur_batch.append(n)
+            cur_batch_tokens += num_tokens
+        if cur_batch:
+            batches.append(cur_batch)
+        return batches
+
+    def _extract_batch_triplets(self, batch: List[Node]) -> List[List[Triplet]]:
+        if len(batch) == 1:
+            return [self._extract_triplets(batch[0].get_text())]
+        return self._extract_triplets_multi([n.get_text() for n in batch])
+
+    async def _aextract_batch_triplets(
+        self, batch: List[Node], semaphore: asyncio.Semaphore
+    ) -> List[List[Triplet]]:
+        async with semaphore:
+            if len(batch) == 1:
+                return [await self._aextract_triplets(batch[0].get_text())]
+            return await self._aextract_triplets_multi([n.get_text() for n in batch])
+
+    async def _aextract_all_triplets(
+        self, batches: List[List[Node]]
+    ) -> List[List[List[Triplet]]]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        return await asyncio.gather(
+            *[self._aextract_batch_triplets(batch, semaphore) for batch in batches]
+        )
+
+    def _embed_triplets(self, index_struct: KG, triplets: List[Triplet]) -> None:
+        """Embed all new triplets in a single batched pass."""
+        triplet_strs: Dict[str, None] = {}
+        for triplet in triplets:
+            triplet_str = str(triplet)
+            if triplet_str not in index_struct.embedding_dict:
+                triplet_strs[triplet_str] = None
+        if not triplet_strs:
+            return
+
+        embed_model = self._service_context.embed_model
+        event_id = self._service_context.callback_manager.on_event_start(
+            CBEventType.EMBEDDING
+        )
+        text_queue = [(triplet_str, triplet_str) for triplet_str in triplet_strs]
+        if self._use_async:
+            embed_outputs = run_async_tasks(
+                [embed_model.aget_queued_text_embeddings(text_queue)]
+            )[0]
+        else:
+            for triplet_str, _ in text_queue:
+                embed_model.queue_text_for_embedding(triplet_str, triplet_str)
+            embed_outputs = embed_model.get_queued_text_embeddings()
+        self._service_context.callback_manager.on_event_end(
+            CBEventType.EMBEDDING,
+            payload={"num_nodes": len(text_queue)},
+            event_id=event_id,
+        )
+        for rel_text, rel_embed in zip(*embed_outputs):
+            index_struct.add_to_embedding_dict(rel_text, rel_embed)
+
+    def _add_nodes_to_index(self, index_struct: KG, nodes: Sequence[Node]) -> None:
+        """Extract triplets of nodes and add them to the index struct."""
+        batches = self._get_node_batches(nodes)
+        if self._use_async:
+            batch_triplets = run_async_tasks([self._aextract_all_triplets(batches)])[0]
+        else:
+            batch_triplets = [self._extract_batch_triplets(b) for b in batches]
+
+        all_triplets: List[Triplet] = []
+        for batch, node_triplets in zip(batches, batch_triplets):
+            for n, triplets in zip(batch, node_triplets):
+                logger.debug(f"> Extracted triplets: {triplets}")
+                for triplet in triplets:
+                    subj, _, obj = triplet
+                    index_struct.upsert_triplet(triplet)
+                    index_struct.add_node([subj, obj], n)
+                all_triplets.extend(triplets)
+
+        if self.include_embeddings:
+            self._embed_triplets(index_struct, all_triplets)
+
     def _build_index_from_nodes(self, nodes: Sequence[Node]) -> KG:
         """Build the index from nodes."""
         # do simple concatenation
         index_struct = KG(table={})
-        for n in nodes:
-            triplets = self._extract_triplets(n.get_text())
-            logger.debug(f"> Extracted triplets: {triplets}")
-            for triplet in triplets:
-                subj, _, obj = triplet
-                index_struct.upsert_triplet(triplet)
-                index_struct.add_node([subj, obj], n)
-
-            if self.include_embeddings:
-                event_id = self._service_context.callback_manager.on_event_start(
-                    CBEventType.EMBEDDING
-                )
-                for i, triplet in enumerate(triplets):
-                    self._service_context.embed_model.queue_text_for_embedding(
-                        str(triplet), str(triplet)
-                    )
-
-                embed_outputs = (
-                    self._service_context.embed_model.get_queued_text_embeddings()
-                )
-                self._service_context.callback_manager.on_event_end(
-                    CBEventType.EMBEDDING,
-                    payload={"num_nodes": len(triplets)},
-                    event_id=event_id,
-                )
-                for rel_text, rel_embed in zip(*embed_outputs):
-                    index_struct.add_to_embedding_dict(rel_text, rel_embed)
-
+        self._add_nodes_to_index(index_struct, nodes)
         return index_struct
 
     def _insert(self, nodes: Sequence[Node], **insert_kwargs: Any) -> None:
         """Insert a document."""
-        for n in nodes:
-            triplets = self._extract_triplets(n.get_text())
-            logger.debug(f"Extracted triplets: {triplets}")
-            for triplet in triplets:
-                subj, _, obj = triplet
-                triplet_str = str(triplet)
-                self._index_struct.upsert_triplet(triplet)
-                self._index_struct.add_node([subj, obj], n)
-                if (
-                    self.include_embeddings
-                    and triplet_str not in self._index_struct.embedding_dict
-                ):
-                    event_id = self._service_context.callback_manager.on_event_start(
-                        CBEventType.EMBEDDING
-                    )
-                    rel_embedding = (
-                        self._service_context.embed_model.get_text_embedding(
-                            triplet_str
-                        )
-                    )
-                    self._service_context.callback_manager.on_event_end(
-                        CBEventType.EMBEDDING,
-                        payload={"num_nodes": 1},
-                        event_id=event_id,
-                    )
-                    self.index_struct.add_to_embedding_dict(triplet_str, rel_embedding)
-
-    def upsert_triplet(self, triplet: Tuple[str, str, str]) -> None:
+        self._add_nodes_to_index(self._index_struct, nodes)
+
+    def upsert_triplet(self, triplet: Triplet) -> None:
         """Insert triplets.
 
         Used for manual insertion of KG triplets (in the form
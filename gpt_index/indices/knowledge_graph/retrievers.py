@@ -9,9 +9,6 @@ from gpt_index.data_structs.node_v2 import Node, NodeWithScore
 from gpt_index.indices.base_retriever import BaseRetriever
 from gpt_index.indices.keyword_table.utils import extract_keywords_given_response
 from gpt_index.indices.knowledge_graph.base import GPTKnowledgeGraphIndex
-from gpt_index.indices.query.embedding_utils import (
-    get_top_k_embeddings,
-)
 from gpt_index.indices.query.schema import QueryBundle
 from gpt_index.prompts.default_prompts import DEFAULT_QUERY_KEYWORD_EXTRACT_TEMPLATE
 from gpt_index.prompts.prompts import QueryKeywordExtractPrompt
@@ -64,6 +61,10 @@ class KGTableRetriever(BaseRetriever):
             "embedding", or "hybrid".
         similarity_top_k (int): The number of top embeddings to use
             (if embeddings are used).
+        graph_traversal_depth (int): The max number of hops followed from
+            each keyword when collecting triplets and text chunks.
+        max_fan_out (Optional[int]): The max number of edges followed from
+            each keyword during traversal. Defaults to all edges.
     """
 
     def __init__(
@@ -75,9 +76,13 @@ class KGTableRetriever(BaseRetriever):
         include_text: bool = True,
         retriever_mode: Optional[KGRetrieverMode] = KGRetrieverMode.KEYWORD,
         similarity_top_k: int = 2,
+        graph_traversal_depth: int = 1,
+        max_fan_out: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
+        if graph_traversal_depth < 1:
+            raise ValueError("graph_traversal_depth must be >= 1")
 
         assert isinstance(index, GPTKnowledgeGraphIndex)
         self._index = index
@@ -91,6 +96,8 @@ class KGTableRetriever(BaseRetriever):
         self.similarity_top_k = similarity_top_k
         self._include_text = include_text
         self._retriever_mode = KGRetrieverMode(retriever_mode)
+        self._graph_traversal_depth = graph_traversal_depth
+        self._max_fan_out = max_fan_out
 
     def _get_keywords(self, query_str: str) -> List[str]:
         """Extract keywords."""
@@ -126,6 +133,12 @@ class KGTableRetriever(BaseRetriever):
                 keywords.append(keyword.strip("(\"'"))
         return keywords
 
+    def _get_node_ids(self, keyword: str) -> List[str]:
+        """Get the node ids of a keyword and of its neighborhood."""
+        return self._index_struct.get_node_ids(
+            keyword, depth=self._graph_traversal_depth, max_fan_out=self._max_fan_out
+        )
+
     def _retrieve(
         self,
         query_bundle: QueryBundle,
@@ -140,11 +153,15 @@ class KGTableRetriever(BaseRetriever):
 
         if self._retriever_mode != KGRetrieverMode.EMBEDDING:
             for keyword in keywords:
-                cur_rel_texts = self._index_struct.get_rel_map_texts(keyword)
+                cur_rel_texts = self._index_struct.get_rel_map_texts(
+                    keyword,
+                    depth=self._graph_traversal_depth,
+                    max_fan_out=self._max_fan_out,
+                )
                 rel_texts.extend(cur_rel_texts)
                 cur_rel_map[keyword] = self._index_struct.get_rel_map_tuples(keyword)
                 if self._include_text:
-                    for node_id in self._index_struct.get_node_ids(keyword):
+                    for node_id in self._get_node_ids(keyword):
                         chunk_indices_count[node_id] += 1
 
         if (
@@ -160,16 +177,8 @@ class KGTableRetriever(BaseRetriever):
             self._service_context.callback_manager.on_event_end(
                 CBEventType.EMBEDDING, payload={"num_nodes": 1}, event_id=event_id
             )
-            all_rel_texts = list(self._index_struct.embedding_dict.keys())
-
-            rel_text_embeddings = [
-                self._index_struct.embedding_dict[_id] for _id in all_rel_texts
-            ]
-            similarities, top_rel_texts = get_top_k_embeddings(
-                query_embedding,
-                rel_text_embeddings,
-                similarity_top_k=self.similarity_top_k,
-                embedding_ids=all_rel_texts,
+            similarities, top_rel_texts = self._index_struct.get_top_k_rel_texts(
+                query_embedding, self.similarity_top_k
             )
             logger.debug(
                 f"Found the following rel_texts+query similarites: {str(similarities)}"
@@ -178,9 +187,7 @@ class KGTableRetriever(BaseRetriever):
             rel_texts.extend(top_rel_texts)
             if self._include_text:
                 keywords = self._extract_rel_text_keywords(top_rel_texts)
-                nested_node_ids = [
-                    self._index_struct.get_node_ids(keyword) for keyword in keywords
-                ]
+                nested_node_ids = [self._get_node_ids(keyword) for keyword in keywords]
                 # flatten list
                 node_ids = [_id for ids in nested_node_ids for _id in ids]
                 for node_id in node_ids:
@@ -84,7 +84,11 @@ class PromptHelper:
         )
 
     def get_chunk_size_given_prompt(
-        self, prompt_text: str, num_chunks: int, padding: Optional[int] = 1
+        self,
+        prompt_text: str,
+        num_chunks: int,
+        padding: Optional[int] = 1,
+        use_chunk_size_limit: Optional[bool] = None,
     ) -> int:
         """Get chunk size making sure we can also fit the prompt in.
 
@@ -95,8 +99,12 @@ class PromptHelper:
         By default we assume there is a padding of 1 (for the newline between chunks).
 
         Limit by embedding_limit and chunk_size_limit if specified.
+        `use_chunk_size_limit` overrides the attribute of the same name for this
+        call only, without changing the (possibly shared) prompt helper.
 
         """
+        if use_chunk_size_limit is None:
+            use_chunk_size_limit = self.use_chunk_size_limit
         prompt_tokens = self._tokenizer(prompt_text)
         num_prompt_tokens = len(prompt_tokens)
 
@@ -110,7 +118,7 @@ class PromptHelper:
 
         if self.embedding_limit is not None:
             result = min(result, self.embedding_limit)
-        if self.chunk_size_limit is not None and self.use_chunk_size_limit:
+        if self.chunk_size_limit is not None and use_chunk_size_limit:
             result = min(result, self.chunk_size_limit)
 
         return result
@@ -146,7 +154,11 @@ class PromptHelper:
         return biggest_prompt
 
     def get_text_splitter_given_prompt(
-        self, prompt: Prompt, num_chunks: int, padding: Optional[int] = 1
+        self,
+        prompt: Prompt,
+        num_chunks: int,
+        padding: Optional[int] = 1,
+        use_chunk_size_limit: Optional[bool] = None,
     ) -> TokenTextSplitter:
         """Get text splitter given initial prompt.
 
@@ -157,7 +169,10 @@ class PromptHelper:
         # generate empty_prompt_txt to compute initial tokens
         empty_prompt_txt = self._get_empty_prompt_txt(prompt)
         chunk_size = self.get_chunk_size_given_prompt(
-            empty_prompt_txt, num_chunks, padding=padding
+            empty_prompt_txt,
+            num_chunks,
+            padding=padding,
+            use_chunk_size_limit=use_chunk_size_limit,
         )
         text_splitter = TokenTextSplitter(
             separator=self._separator,
@@ -220,7 +235,10 @@ class PromptHelper:
         return "\n\n".join(results)
 
     def compact_text_chunks(
-        self, prompt: Prompt, text_chunks: Sequence[str]
+        self,
+        prompt: Prompt,
+        text_chunks: Sequence[str],
+        use_chunk_size_limit: Optional[bool] = None,
     ) -> List[str]:
         """Compact text chunks.
 
@@ -230,5 +248,7 @@ class PromptHelper:
         """
         combined_str = "\n\n".join([c.strip() for c in text_chunks if c.strip()])
         # resplit based on self.max_chunk_overlap
-        text_splitter = self.get_text_splitter_given_prompt(prompt, 1, padding=1)
+        text_splitter = self.get_text_splitter_given_prompt(
+            prompt, 1, padding=1, use_chunk_size_limit=use_chunk_size_limit
+        )
         return text_splitter.split_text(combined_str)
@@ -29,6 +29,9 @@ class BaseQueryEngine(ABC):
             "This query engine does not support retrieve, use query directly"
         )
 
+    async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return self.retrieve(query_bundle)
+
     def synthesize(
         self,
         query_bundle: QueryBundle,
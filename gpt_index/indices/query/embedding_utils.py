@@ -1,11 +1,14 @@
 """Embedding utils for queries."""
 
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
-from gpt_index.embeddings.base import similarity as default_similarity_fn
+from gpt_index.embeddings.base import SimilarityMode
 import numpy as np
 from gpt_index.vector_stores.types import VectorStoreQueryMode
 
+# max number of query x embedding scores materialized at once
+SCORE_CHUNK_SIZE = 2**24
+
 
 def get_top_k_embeddings(
     query_embedding: List[float],
@@ -19,7 +22,16 @@ def get_top_k_embeddings(
     if embedding_ids is None:
         embedding_ids = [i for i in range(len(embeddings))]
 
-    similarity_fn = similarity_fn or default_similarity_fn
+    if similarity_fn is None:
+        # NOTE: default cosine similarity can be computed in one vectorized pass
+        batch_similarities, batch_ids = get_top_k_embeddings_batch(
+            [query_embedding],
+            embeddings,
+            similarity_top_k=similarity_top_k,
+            embedding_ids=embedding_ids,
+            similarity_cutoff=similarity_cutoff,
+        )
+        return batch_similarities[0], batch_ids[0]
 
     similarities = []
     for emb in embeddings:
@@ -42,6 +54,108 @@ def get_top_k_embeddings(
     return result_similarities, result_ids
 
 
+def _get_similarity_matrix(
+    query_embeddings: np.ndarray,
+    embeddings: np.ndarray,
+    embedding_norms: np.ndarray,
+    mode: SimilarityMode,
+) -> np.ndarray:
+    """Get (num_queries x num_embeddings) similarity (or distance) matrix."""
+    products = query_embeddings @ embeddings.T
+    if mode == SimilarityMode.DOT_PRODUCT:
+        return products
+
+    query_norms = np.linalg.norm(query_embeddings, axis=1)
+    if mode == SimilarityMode.EUCLIDEAN:
+        squared = query_norms[:, None] ** 2 + embedding_norms[None, :] ** 2
+        return np.sqrt(np.maximum(squared - 2 * products, 0.0))
+
+    denom = query_norms[:, None] * embedding_norms[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denom > 0, products / denom, 0.0)
+
+
+def get_top_k_embeddings_batch(
+    query_embeddings: Union[Sequence[Sequence[float]], np.ndarray],
+    embeddings: Union[Sequence[Sequence[float]], np.ndarray],
+    similarity_top_k: Optional[int] = None,
+    embedding_ids: Optional[Sequence] = None,
+    similarity_cutoff: Optional[float] = None,
+    mode: SimilarityMode = SimilarityMode.DEFAULT,
+    embedding_norms: Optional[np.ndarray] = None,
+) -> Tuple[List[List[float]], List[List]]:
+    """Get top nodes for a batch of queries.
+
+    Scores all queries against all embeddings with matrix products, instead
+    of one `similarity` call per pair. Results are ordered the same way as in
+    `get_top_k_embeddings` (ties keep the order of `embeddings`).
+
+    NOTE: in euclidean mode, scores are distances: the closest embeddings are
+    returned first, and `similarity_cutoff` is an upper bound on the distance.
+
+    Args:
+        query_embeddings: (num_queries x dim) query embeddings.
+        embeddings: (num_embeddings x dim) embeddings to search over.
+        similarity_top_k (Optional[int]): number of results per query.
+            Defaults to all embeddings.
+        embedding_ids (Optional[Sequence]): ids of the embeddings. Defaults to
+            their positions.
+        similarity_cutoff (Optional[float]): drop results not scoring better
+            than the cutoff.
+        mode (SimilarityMode): similarity mode.
+        embedding_norms (Optional[np.ndarray]): precomputed norms of
+            `embeddings`, used to skip recomputing them.
+
+    Returns:
+        Tuple[List[List[float]], List[List]]: per-query scores and ids.
+
+    """
+    embeddings_np = np.asarray(embeddings)
+    if not np.issubdtype(embeddings_np.dtype, np.floating):
+        embeddings_np = embeddings_np.astype(np.float64)
+    query_np = np.asarray(query_embeddings, dtype=embeddings_np.dtype)
+    num_embeddings = embeddings_np.shape[0] if embeddings_np.size > 0 else 0
+    if embedding_ids is None:
+        embedding_ids = range(num_embeddings)
+    if num_embeddings == 0:
+        return [[] for _ in range(len(query_np))], [[] for _ in range(len(query_np))]
+    if embedding_norms is None:
+        embedding_norms = np.linalg.norm(embeddings_np, axis=1)
+
+    top_k = min(similarity_top_k or num_embeddings, num_embeddings)
+    # sort keys are "higher is better"
+    sign = -1.0 if mode == SimilarityMode.EUCLIDEAN else 1.0
+
+    result_similarities: List[List[float]] = []
+    result_ids: List[List] = []
+    chunk_size = max(1, SCORE_CHUNK_SIZE // num_embeddings)
+    for start in range(0, len(query_np), chunk_size):
+        scores = _get_similarity_matrix(
+            query_np[start : start + chunk_size],
+            embeddings_np,
+            embedding_norms,
+            mode,
+        )
+        for row_scores in scores:
+            keys = sign * row_scores
+            if top_k < num_embeddings:
+                # keep everything tied with the k-th best, so that ties are
+                # broken by position as in a full stable sort
+                partition = np.argpartition(-keys, top_k - 1)[:top_k]
+                candidates = np.flatnonzero(keys >= keys[partition].min())
+            else:
+                candidates = np.arange(num_embeddings)
+            order = np.argsort(-keys[candidates], kind="stable")
+            top_idxs = candidates[order][:top_k]
+            if similarity_cutoff is not None:
+                top_idxs = top_idxs[keys[top_idxs] > sign * similarity_cutoff]
+
+            result_similarities.append(row_scores[top_idxs].tolist())
+            result_ids.append([embedding_ids[idx] for idx in top_idxs])
+
+    return result_similarities, result_ids
+
+
 def get_top_k_embeddings_learner(
     query_embedding: List[float],
     embeddings: List[List[float]],
@@ -8,7 +8,9 @@ Will support different modes, from 1) stuffing chunks into prompt,
 
 """
 from abc import ABC, abstractmethod
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple, cast
 
 from gpt_index.callbacks.schema import CBEventType
@@ -19,11 +21,13 @@ from gpt_index.indices.common_tree.base import GPTTreeIndexBuilder
 from gpt_index.indices.response.type import ResponseMode
 from gpt_index.indices.service_context import ServiceContext
 from gpt_index.indices.utils import get_sorted_node_list, truncate_text
+from gpt_index.langchain_helpers.text_splitter import TokenTextSplitter
 from gpt_index.prompts.default_prompt_selectors import DEFAULT_REFINE_PROMPT_SEL
 from gpt_index.prompts.default_prompts import (
     DEFAULT_SIMPLE_INPUT_PROMPT,
     DEFAULT_TEXT_QA_PROMPT,
 )
+from gpt_index.prompts.base import Prompt
 from gpt_index.prompts.prompts import (
     QuestionAnswerPrompt,
     RefinePrompt,
@@ -33,10 +37,11 @@ from gpt_index.prompts.prompts import (
 from gpt_index.response.utils import get_response_text
 from gpt_index.token_counter.token_counter import llm_token_counter
 from gpt_index.types import RESPONSE_TEXT_TYPE
-from gpt_index.utils import temp_set_attrs
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAP_REDUCE_CONCURRENCY = 8
+
 
 class BaseResponseBuilder(ABC):
     """Response builder class."""
@@ -144,6 +149,12 @@ class Refine(BaseResponseBuilder):
         self.text_qa_template = text_qa_template
         self._refine_template = refine_template
 
+    def _get_text_splitter(self, prompt: Prompt) -> TokenTextSplitter:
+        """Get text splitter fitting text chunks into a prompt."""
+        return self._service_context.prompt_helper.get_text_splitter_given_prompt(
+            prompt, 1
+        )
+
     @llm_token_counter("aget_response")
     async def aget_response(
         self,
@@ -152,7 +163,78 @@ class Refine(BaseResponseBuilder):
         prev_response: Optional[str] = None,
         **response_kwargs: Any,
     ) -> RESPONSE_TEXT_TYPE:
-        return self.get_response(query_str, text_chunks, prev_response)
+        """Give response over chunks.
+
+        The refine chain is sequential, but splitting a text chunk does not
+        need to wait on the LLM: while the LLM call for a chunk is in flight,
+        the next chunk is split in a worker thread, with the text splitter
+        given the latest available answer. The split is reused if the
+        splitter given the new answer has the same chunk size (e.g. if both
+        are capped by `chunk_size_limit`), and redone otherwise.
+
+        """
+        loop = asyncio.get_running_loop()
+        prev_response_obj = cast(Optional[RESPONSE_TEXT_TYPE], prev_response)
+        response: Optional[RESPONSE_TEXT_TYPE] = None
+        next_split: Optional[Tuple[int, "asyncio.Future[List[str]]"]] = None
+        for idx, text_chunk in enumerate(text_chunks):
+            if isinstance(prev_response_obj, Generator):
+                prev_response_obj = get_response_text(prev_response_obj)
+
+            if prev_response_obj is None:
+                text_splitter = self._get_text_splitter(
+                    self.text_qa_template.partial_format(query_str=query_str)
+                )
+            else:
+                text_splitter = self._get_text_splitter(
+                    self._refine_template.partial_format(
+                        query_str=query_str, existing_answer=prev_response_obj
+                    )
+                )
+            if next_split is not None and next_split[0] == text_splitter.chunk_size:
+                split_future = next_split[1]
+            else:
+                if next_split is not None:
+                    next_split[1].cancel()
+                split_future = loop.run_in_executor(
+                    None, text_splitter.split_text, text_chunk
+                )
+
+            # start splitting the next text chunk before calling the LLM
+            next_split = None
+            if idx + 1 < len(text_chunks):
+                next_text_splitter = self._get_text_splitter(
+                    self._refine_template.partial_format(
+                        query_str=query_str, existing_answer=prev_response_obj or ""
+                    )
+                )
+                next_split = (
+                    next_text_splitter.chunk_size,
+                    loop.run_in_executor(
+                        None, next_text_splitter.split_text, text_chunks[idx + 1]
+                    ),
+                )
+
+            event_id = self._callback_chunking_on_start(text_chunk)
+            cur_text_chunks = await split_future
+            self._callback_chunking_on_end(cur_text_chunks, event_id)
+
+            if prev_response_obj is None:
+                # if this is the first chunk, and text chunk already
+                # is an answer, then return it
+                response = await self._agive_response_over_splits(
+                    query_str, cur_text_chunks
+                )
+            else:
+                response = await self._arefine_response_over_splits(
+                    prev_response_obj, query_str, cur_text_chunks
+                )
+            prev_response_obj = response
+        if isinstance(response, str):
+            response = response or "Empty Response"
+        else:
+            response = cast(Generator, response)
+        return response
 
     @llm_token_counter("get_response")
     def get_response(
@@ -192,11 +274,7 @@ class Refine(BaseResponseBuilder):
     ) -> RESPONSE_TEXT_TYPE:
         """Give response given a query and a corresponding text chunk."""
         text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
-        qa_text_splitter = (
-            self._service_context.prompt_helper.get_text_splitter_given_prompt(
-                text_qa_template, 1
-            )
-        )
+        qa_text_splitter = self._get_text_splitter(text_qa_template)
         event_id = self._callback_chunking_on_start(text_chunk)
         text_chunks = qa_text_splitter.split_text(text_chunk)
         self._callback_chunking_on_end(text_chunk, event_id)
@@ -243,6 +321,49 @@ class Refine(BaseResponseBuilder):
             response = cast(Generator, response)
         return response
 
+    async def _agive_response_over_splits(
+        self,
+        query_str: str,
+        text_chunks: List[str],
+    ) -> RESPONSE_TEXT_TYPE:
+        """Asynchronously give response over the splits of a text chunk."""
+        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
+        response: Optional[RESPONSE_TEXT_TYPE] = None
+        for cur_text_chunk in text_chunks:
+            if response is None:
+                event_id = self._callback_llm_on_start()
+                if not self._streaming:
+                    (
+                        response,
+                        formatted_prompt,
+                    ) = await self._service_context.llm_predictor.apredict(
+                        text_qa_template,
+                        context_str=cur_text_chunk,
+                    )
+                else:
+                    (
+                        response,
+                        formatted_prompt,
+                    ) = self._service_context.llm_predictor.stream(
+                        text_qa_template,
+                        context_str=cur_text_chunk,
+                    )
+                self._log_prompt_and_response(
+                    formatted_prompt, response, log_prefix="Initial"
+                )
+                self._callback_llm_on_end(
+                    formatted_prompt, response, event_id, stage="Initial"
+                )
+            else:
+                response = await self._arefine_response_single(
+                    response, query_str, cur_text_chunk
+                )
+        if isinstance(response, str):
+            response = response or "Empty Response"
+        else:
+            response = cast(Generator, response)
+        return response
+
     def _refine_response_single(
         self,
         response: RESPONSE_TEXT_TYPE,
@@ -261,23 +382,84 @@ class Refine(BaseResponseBuilder):
         refine_template = self._refine_template.partial_format(
             query_str=query_str, existing_answer=response
         )
-        refine_text_splitter = (
-            self._service_context.prompt_helper.get_text_splitter_given_prompt(
-                refine_template, 1
+        refine_text_splitter = self._get_text_splitter(refine_template)
+
+        event_id = self._callback_chunking_on_start(text_chunk)
+        text_chunks = refine_text_splitter.split_text(text_chunk)
+        self._callback_chunking_on_end(text_chunks, event_id)
+
+        for cur_text_chunk in text_chunks:
+            event_id = self._callback_llm_on_start()
+            if not self._streaming:
+                (
+                    response,
+                    formatted_prompt,
+                ) = self._service_context.llm_predictor.predict(
+                    refine_template,
+                    context_msg=cur_text_chunk,
+                )
+            else:
+                response, formatted_prompt = self._service_context.llm_predictor.stream(
+                    refine_template,
+                    context_msg=cur_text_chunk,
+                )
+            refine_template = self._refine_template.partial_format(
+                query_str=query_str, existing_answer=response
             )
+
+            self._log_prompt_and_response(
+                formatted_prompt, response, log_prefix="Refined"
+            )
+            self._callback_llm_on_end(
+                formatted_prompt, response, event_id, stage="Refined"
+            )
+        return response
+
+    async def _arefine_response_single(
+        self,
+        response: RESPONSE_TEXT_TYPE,
+        query_str: str,
+        text_chunk: str,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Asynchronously refine response."""
+        if isinstance(response, Generator):
+            response = get_response_text(response)
+
+        refine_template = self._refine_template.partial_format(
+            query_str=query_str, existing_answer=response
         )
+        refine_text_splitter = self._get_text_splitter(refine_template)
 
         event_id = self._callback_chunking_on_start(text_chunk)
         text_chunks = refine_text_splitter.split_text(text_chunk)
         self._callback_chunking_on_end(text_chunks, event_id)
 
+        return await self._arefine_response_over_splits(
+            response, query_str, text_chunks
+        )
+
+    async def _arefine_response_over_splits(
+        self,
+        response: RESPONSE_TEXT_TYPE,
+        query_str: str,
+        text_chunks: List[str],
+    ) -> RESPONSE_TEXT_TYPE:
+        """Asynchronously refine response over the splits of a text chunk."""
+        if isinstance(response, Generator):
+            response = get_response_text(response)
+
+        fmt_text_chunk = truncate_text(" ".join(text_chunks), 50)
+        logger.debug(f"> Refine context: {fmt_text_chunk}")
+        refine_template = self._refine_template.partial_format(
+            query_str=query_str, existing_answer=response
+        )
         for cur_text_chunk in text_chunks:
             event_id = self._callback_llm_on_start()
             if not self._streaming:
                 (
                     response,
                     formatted_prompt,
-                ) = self._service_context.llm_predictor.predict(
+                ) = await self._service_context.llm_predictor.apredict(
                     refine_template,
                     context_msg=cur_text_chunk,
                 )
@@ -314,6 +496,30 @@ class CompactAndRefine(Refine):
             streaming=streaming,
         )
 
+    def _get_text_splitter(self, prompt: Prompt) -> TokenTextSplitter:
+        """Get text splitter fitting text chunks into a prompt.
+
+        NOTE: compacted text chunks are not limited by chunk_size_limit.
+
+        """
+        return self._service_context.prompt_helper.get_text_splitter_given_prompt(
+            prompt, 1, use_chunk_size_limit=False
+        )
+
+    def _get_compact_text_chunks(
+        self, query_str: str, text_chunks: Sequence[str]
+    ) -> List[str]:
+        """Compact text chunks to fit the biggest of the QA and refine prompts."""
+        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
+        refine_template = self._refine_template.partial_format(query_str=query_str)
+
+        max_prompt = self._service_context.prompt_helper.get_biggest_prompt(
+            [text_qa_template, refine_template]
+        )
+        return self._service_context.prompt_helper.compact_text_chunks(
+            max_prompt, text_chunks, use_chunk_size_limit=False
+        )
+
     async def aget_response(
         self,
         query_str: str,
@@ -321,7 +527,13 @@ class CompactAndRefine(Refine):
         prev_response: Optional[str] = None,
         **response_kwargs: Any,
     ) -> RESPONSE_TEXT_TYPE:
-        return self.get_response(query_str, text_chunks, prev_response)
+        """Get compact response."""
+        # NOTE: the prompt helper is not modified while awaiting the LLM,
+        # since it may be shared with other queries running concurrently
+        new_texts = self._get_compact_text_chunks(query_str, text_chunks)
+        return await super().aget_response(
+            query_str=query_str, text_chunks=new_texts, prev_response=prev_response
+        )
 
     def get_response(
         self,
@@ -334,22 +546,10 @@ class CompactAndRefine(Refine):
         # use prompt helper to fix compact text_chunks under the prompt limitation
         # TODO: This is a temporary fix - reason it's temporary is that
         # the refine template does not account for size of previous answer.
-        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
-        refine_template = self._refine_template.partial_format(query_str=query_str)
-
-        max_prompt = self._service_context.prompt_helper.get_biggest_prompt(
-            [text_qa_template, refine_template]
+        new_texts = self._get_compact_text_chunks(query_str, text_chunks)
+        return super().get_response(
+            query_str=query_str, text_chunks=new_texts, prev_response=prev_response
         )
-        with temp_set_attrs(
-            self._service_context.prompt_helper, use_chunk_size_limit=False
-        ):
-            new_texts = self._service_context.prompt_helper.compact_text_chunks(
-                max_prompt, text_chunks
-            )
-            response = super().get_response(
-                query_str=query_str, text_chunks=new_texts, prev_response=prev_response
-            )
-        return response
 
 
 class TreeSummarize(Refine):
@@ -392,10 +592,7 @@ class TreeSummarize(Refine):
             index_graph, index_graph.all_nodes, index_graph.all_nodes
         )
         root_node_ids = index_graph.root_nodes
-        root_nodes = {
-            index: index_builder.docstore.get_node(node_id)
-            for index, node_id in root_node_ids.items()
-        }
+        root_nodes = index_builder.docstore.get_node_dict(root_node_ids)
         return self._get_tree_response_over_root_nodes(
             query_str, prev_response, root_nodes, text_qa_template
         )
@@ -423,10 +620,7 @@ class TreeSummarize(Refine):
             index_graph, index_graph.all_nodes, index_graph.all_nodes
         )
         root_node_ids = index_graph.root_nodes
-        root_nodes = {
-            index: index_builder.docstore.get_node(node_id)
-            for index, node_id in root_node_ids.items()
-        }
+        root_nodes = index_builder.docstore.get_node_dict(root_node_ids)
         return self._get_tree_response_over_root_nodes(
             query_str, prev_response, root_nodes, text_qa_template
         )
@@ -488,6 +682,195 @@ class TreeSummarize(Refine):
         return response
 
 
+class MapReduce(BaseResponseBuilder):
+    """Map-reduce response builder.
+
+    Text chunks are packed to fill the QA prompt (see
+    `PromptHelper.compact_text_chunks`), and each packed chunk is answered
+    independently and concurrently. The partial answers are then packed and
+    answered again, level by level, until they fit into a single prompt.
+    This takes O(log k) rounds of LLM calls over k chunks, instead of the
+    k sequential calls of Refine.
+
+    Args:
+        service_context (ServiceContext): service context.
+        text_qa_template (QuestionAnswerPrompt): QA prompt, used both to
+            answer text chunks and to combine partial answers.
+        streaming (bool): whether to stream the final answer.
+        max_concurrency (int): max number of concurrent LLM calls.
+
+    """
+
+    def __init__(
+        self,
+        service_context: ServiceContext,
+        text_qa_template: QuestionAnswerPrompt,
+        streaming: bool = False,
+        max_concurrency: int = DEFAULT_MAP_REDUCE_CONCURRENCY,
+    ) -> None:
+        super().__init__(service_context=service_context, streaming=streaming)
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        self.text_qa_template = text_qa_template
+        self._max_concurrency = max_concurrency
+
+    def _compact_text_chunks(
+        self, text_qa_template: QuestionAnswerPrompt, text_chunks: Sequence[str]
+    ) -> List[str]:
+        """Pack text chunks into as few QA prompts as possible."""
+        return self._service_context.prompt_helper.compact_text_chunks(
+            text_qa_template, text_chunks, use_chunk_size_limit=False
+        )
+
+    def _get_next_level_texts(
+        self,
+        text_qa_template: QuestionAnswerPrompt,
+        texts: List[str],
+        answers: List[str],
+    ) -> List[str]:
+        """Pack the partial answers of a level for the next level."""
+        next_texts = self._compact_text_chunks(text_qa_template, answers)
+        if len(next_texts) >= len(texts):
+            raise ValueError(
+                "Partial answers do not fit into fewer prompts than their "
+                "text chunks, cannot reduce them. Try a larger max_input_size "
+                "or a smaller num_output."
+            )
+        return next_texts
+
+    def _get_initial_texts(
+        self,
+        text_qa_template: QuestionAnswerPrompt,
+        text_chunks: Sequence[str],
+        prev_response: Optional[str],
+    ) -> List[str]:
+        if prev_response is not None:
+            text_chunks = [prev_response, *text_chunks]
+        return self._compact_text_chunks(text_qa_template, text_chunks)
+
+    def _log_level(self, level: int, num_texts: int) -> None:
+        logger.debug(f"> Map-reduce level {level}: answering {num_texts} chunks")
+
+    def _get_stage(self, level: int) -> str:
+        return "Map" if level == 0 else "Reduce"
+
+    def _predict_single(
+        self, text_qa_template: QuestionAnswerPrompt, text: str, stage: str
+    ) -> str:
+        event_id = self._callback_llm_on_start()
+        response, formatted_prompt = self._service_context.llm_predictor.predict(
+            text_qa_template,
+            context_str=text,
+        )
+        self._log_prompt_and_response(formatted_prompt, response, log_prefix=stage)
+        self._callback_llm_on_end(formatted_prompt, response, event_id, stage=stage)
+        return response
+
+    async def _apredict_single(
+        self,
+        text_qa_template: QuestionAnswerPrompt,
+        text: str,
+        stage: str,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        async with semaphore:
+            event_id = self._callback_llm_on_start()
+            (
+                response,
+                formatted_prompt,
+            ) = await self._service_context.llm_predictor.apredict(
+                text_qa_template,
+                context_str=text,
+            )
+        self._log_prompt_and_response(formatted_prompt, response, log_prefix=stage)
+        self._callback_llm_on_end(formatted_prompt, response, event_id, stage=stage)
+        return response
+
+    def _get_final_response(
+        self, text_qa_template: QuestionAnswerPrompt, text: str
+    ) -> RESPONSE_TEXT_TYPE:
+        response: RESPONSE_TEXT_TYPE
+        if not self._streaming:
+            response = self._predict_single(text_qa_template, text, stage="Final")
+            return response or "Empty Response"
+        event_id = self._callback_llm_on_start()
+        response, formatted_prompt = self._service_context.llm_predictor.stream(
+            text_qa_template,
+            context_str=text,
+        )
+        self._log_prompt_and_response(formatted_prompt, response, log_prefix="Final")
+        self._callback_llm_on_end(formatted_prompt, response, event_id, stage="Final")
+        return cast(Generator, response)
+
+    @llm_token_counter("aget_response")
+    async def aget_response(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        **response_kwargs: Any,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Get map-reduce response."""
+        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
+        semaphore = asyncio.Semaphore(max_concurrency or self._max_concurrency)
+
+        texts = self._get_initial_texts(text_qa_template, text_chunks, prev_response)
+        level = 0
+        while len(texts) > 1:
+            self._log_level(level, len(texts))
+            answers = await asyncio.gather(
+                *[
+                    self._apredict_single(
+                        text_qa_template, text, self._get_stage(level), semaphore
+                    )
+                    for text in texts
+                ]
+            )
+            texts = self._get_next_level_texts(text_qa_template, texts, answers)
+            level += 1
+
+        if not self._streaming:
+            response = await self._apredict_single(
+                text_qa_template, texts[0] if texts else "", "Final", semaphore
+            )
+            return response or "Empty Response"
+        return self._get_final_response(text_qa_template, texts[0] if texts else "")
+
+    @llm_token_counter("get_response")
+    def get_response(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        **response_kwargs: Any,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Get map-reduce response."""
+        text_qa_template = self.text_qa_template.partial_format(query_str=query_str)
+        max_workers = max_concurrency or self._max_concurrency
+
+        texts = self._get_initial_texts(text_qa_template, text_chunks, prev_response)
+        level = 0
+        while len(texts) > 1:
+            self._log_level(level, len(texts))
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(texts))
+            ) as executor:
+                answers = list(
+                    executor.map(
+                        self._predict_single,
+                        [text_qa_template] * len(texts),
+                        texts,
+                        [self._get_stage(level)] * len(texts),
+                    )
+                )
+            texts = self._get_next_level_texts(text_qa_template, texts, answers)
+            level += 1
+
+        return self._get_final_response(text_qa_template, texts[0] if texts else "")
+
+
 class SimpleSummarize(BaseResponseBuilder):
     def __init__(
         self,
@@ -677,6 +1060,12 @@ def get_response_builder(
             streaming=streaming,
             use_async=use_async,
         )
+    elif mode == ResponseMode.MAP_REDUCE:
+        return MapReduce(
+            service_context=service_context,
+            text_qa_template=text_qa_template,
+            streaming=streaming,
+        )
     elif mode == ResponseMode.SIMPLE_SUMMARIZE:
         return SimpleSummarize(
             service_context=service_context,
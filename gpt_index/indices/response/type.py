@@ -8,5 +8,6 @@ class ResponseMode(str, Enum):
     COMPACT = "compact"
     SIMPLE_SUMMARIZE = "simple_summarize"
     TREE_SUMMARIZE = "tree_summarize"
+    MAP_REDUCE = "map_reduce"
     GENERATION = "generation"
     NO_TEXT = "no_text"
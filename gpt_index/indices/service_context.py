@@ -1,12 +1,16 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 from gpt_index.callbacks.base import CallbackManager
 from gpt_index.embeddings.base import BaseEmbedding
+from gpt_index.embeddings.cache import BaseEmbeddingCache
 from gpt_index.embeddings.openai import OpenAIEmbedding
+from gpt_index.embeddings.scheduler import EmbeddingScheduler
 from gpt_index.indices.prompt_helper import PromptHelper
 from gpt_index.langchain_helpers.chain_wrapper import LLMPredictor
 from gpt_index.langchain_helpers.text_splitter import TokenTextSplitter
+from gpt_index.llm_predictor.cache import BaseLLMResponseCache
+from gpt_index.llm_predictor.limiter import LLMRequestLimiter
 from gpt_index.logger import LlamaLogger
 from gpt_index.node_parser.interface import NodeParser
 from gpt_index.node_parser.simple import SimpleNodeParser
@@ -21,6 +25,24 @@ def _get_default_node_parser(chunk_size_limit: Optional[int] = None) -> NodePars
     return SimpleNodeParser(text_splitter=token_text_splitter)
 
 
+def _set_shared_attr(obj: Any, attr: str, value: Optional[Any]) -> None:
+    """Set an attribute of an object that may be shared by service contexts.
+
+    Raises a ValueError instead of replacing a different value that is
+    already set, e.g. by another service context.
+
+    """
+    if value is None:
+        return
+    current_value = getattr(obj, attr)
+    if current_value is not None and current_value is not value:
+        raise ValueError(
+            f"{type(obj).__name__} already has a different {attr}. "
+            f"Set {attr} on a separate {type(obj).__name__} instead."
+        )
+    setattr(obj, attr, value)
+
+
 @dataclass
 class ServiceContext:
     """Service Context container.
@@ -55,6 +77,10 @@ class ServiceContext:
         llama_logger: Optional[LlamaLogger] = None,
         callback_manager: Optional[CallbackManager] = None,
         chunk_size_limit: Optional[int] = None,
+        embed_cache: Optional[BaseEmbeddingCache] = None,
+        embed_scheduler: Optional[EmbeddingScheduler] = None,
+        llm_response_cache: Optional[BaseLLMResponseCache] = None,
+        llm_request_limiter: Optional[LLMRequestLimiter] = None,
     ) -> "ServiceContext":
         """Create a ServiceContext from defaults.
         If an argument is specified, then use the argument value provided for that
@@ -67,12 +93,30 @@ class ServiceContext:
             node_parser (Optional[NodeParser]): NodeParser
             llama_logger (Optional[LlamaLogger]): LlamaLogger (deprecated)
             chunk_size_limit (Optional[int]): chunk_size_limit
+            embed_cache (Optional[BaseEmbeddingCache]): embedding cache
+                attached to the embed_model
+            embed_scheduler (Optional[EmbeddingScheduler]): embedding scheduler
+                attached to the embed_model
+            llm_response_cache (Optional[BaseLLMResponseCache]): LLM response
+                cache attached to the llm_predictor
+            llm_request_limiter (Optional[LLMRequestLimiter]): LLM request
+                limiter attached to the llm_predictor, shared by all LLM calls
+                made with this service context
+
+        NOTE: caches, schedulers and limiters are attached to the given
+        llm_predictor and embed_model themselves (so they keep tracking token
+        usage), and so apply wherever these are used. A ValueError is raised
+        if one of them already has a different cache, scheduler or limiter.
 
         """
         callback_manager = callback_manager or CallbackManager([])
         llm_predictor = llm_predictor or LLMPredictor()
+        _set_shared_attr(llm_predictor, "response_cache", llm_response_cache)
+        _set_shared_attr(llm_predictor, "request_limiter", llm_request_limiter)
         # NOTE: the embed_model isn't used in all indices
         embed_model = embed_model or OpenAIEmbedding()
+        _set_shared_attr(embed_model, "embed_cache", embed_cache)
+        _set_shared_attr(embed_model, "embed_scheduler", embed_scheduler)
         prompt_helper = prompt_helper or PromptHelper.from_llm_predictor(
             llm_predictor, chunk_size_limit=chunk_size_limit
         )
@@ -8,7 +8,10 @@ from gpt_index.data_structs.data_structs_v2 import IndexGraph
 from gpt_index.data_structs.node_v2 import Node
 from gpt_index.indices.base import BaseGPTIndex
 from gpt_index.indices.base_retriever import BaseRetriever
-from gpt_index.indices.common_tree.base import GPTTreeIndexBuilder
+from gpt_index.indices.common_tree.base import (
+    DEFAULT_MAX_CONCURRENCY,
+    GPTTreeIndexBuilder,
+)
 from gpt_index.indices.service_context import ServiceContext
 from gpt_index.indices.tree.inserter import GPTTreeIndexInserter
 from gpt_index.prompts.default_prompts import (
@@ -50,6 +53,9 @@ class GPTTreeIndex(BaseGPTIndex[IndexGraph]):
             (see :ref:`Prompt-Templates`).
         num_children (int): The number of children each node should have.
         build_tree (bool): Whether to build the tree during index construction.
+        use_async (bool): Whether to summarize nodes asynchronously.
+        max_concurrency (int): The maximum number of concurrent summaries,
+            if use_async is set.
 
     """
 
@@ -65,6 +71,7 @@ class GPTTreeIndex(BaseGPTIndex[IndexGraph]):
         num_children: int = 10,
         build_tree: bool = True,
         use_async: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
@@ -74,6 +81,7 @@ class GPTTreeIndex(BaseGPTIndex[IndexGraph]):
         self.insert_prompt: TreeInsertPrompt = insert_prompt or DEFAULT_INSERT_PROMPT
         self.build_tree = build_tree
         self._use_async = use_async
+        self._max_concurrency = max_concurrency
         super().__init__(
             nodes=nodes,
             index_struct=index_struct,
@@ -81,6 +89,19 @@ class GPTTreeIndex(BaseGPTIndex[IndexGraph]):
             **kwargs,
         )
 
+    @classmethod
+    def from_documents_with_checkpoints(
+        cls, *args: Any, **kwargs: Any
+    ) -> "GPTTreeIndex":
+        """Checkpointed builds are not supported for tree indices.
+
+        Inserting into a tree index does not build the same tree as a build.
+        To avoid repeating summaries when retrying a failed build, use a
+        persistent `llm_response_cache` in the service context instead.
+
+        """
+        raise ValueError("Checkpointed builds are not supported for tree index.")
+
     def as_retriever(
         self,
         retriever_mode: Union[str, TreeRetrieverMode] = TreeRetrieverMode.SELECT_LEAF,
@@ -122,6 +143,7 @@ class GPTTreeIndex(BaseGPTIndex[IndexGraph]):
             self.summary_template,
             service_context=self._service_context,
             use_async=self._use_async,
+            max_concurrency=self._max_concurrency,
             docstore=self._docstore,
         )
         index_graph = index_builder.build_from_nodes(nodes, build_tree=self.build_tree)
@@ -46,10 +46,7 @@ class TreeSelectLeafEmbeddingRetriever(TreeSelectLeafRetriever):
         level: int = 0,
     ) -> str:
         """Answer a query recursively."""
-        cur_nodes = {
-            index: self._docstore.get_node(node_id)
-            for index, node_id in cur_node_ids.items()
-        }
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
         cur_node_list = get_sorted_node_list(cur_nodes)
 
         # Get the node with the highest similarity to the query
@@ -152,10 +152,7 @@ class TreeSelectLeafRetriever(BaseRetriever):
     ) -> str:
         """Answer a query recursively."""
         query_str = query_bundle.query_str
-        cur_nodes = {
-            index: self._docstore.get_node(node_id)
-            for index, node_id in cur_node_ids.items()
-        }
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
         cur_node_list = get_sorted_node_list(cur_nodes)
 
         if len(cur_node_list) == 1:
@@ -377,10 +374,7 @@ class TreeSelectLeafRetriever(BaseRetriever):
         level: int = 0,
     ) -> List[Node]:
         """Answer a query recursively."""
-        cur_nodes = {
-            index: self._docstore.get_node(node_id)
-            for index, node_id in cur_node_ids.items()
-        }
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
         cur_node_list = get_sorted_node_list(cur_nodes)
 
         if len(cur_node_list) > self.child_branch_factor:
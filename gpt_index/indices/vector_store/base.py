@@ -57,27 +57,36 @@ class GPTVectorStoreIndex(BaseGPTIndex[IndexDict]):
         return VectorIndexRetriever(self, **kwargs)
 
     def _get_node_embedding_results(
-        self, nodes: Sequence[Node], existing_node_ids: Set
+        self,
+        nodes: Sequence[Node],
+        existing_node_ids: Set,
+        embeddings_by_text: Optional[Dict[str, List[float]]] = None,
     ) -> List[NodeEmbeddingResult]:
         """Get tuples of id, node, and embedding.
 
         Allows us to store these nodes in a vector store.
-        Embeddings are called in batches.
+        Embeddings are called in batches. Nodes whose text is in
+        `embeddings_by_text` reuse that embedding, without setting it on
+        the node.
 
         """
         id_to_node_map: Dict[str, Node] = {}
         id_to_embed_map: Dict[str, List[float]] = {}
+        embeddings_by_text = embeddings_by_text or {}
 
         nodes_embedded = 0
         for n in nodes:
             new_id = n.get_doc_id()
-            if n.embedding is None:
+            embedding = n.embedding
+            if embedding is None:
+                embedding = embeddings_by_text.get(n.get_text())
+            if embedding is None:
                 nodes_embedded += 1
                 self._service_context.embed_model.queue_text_for_embedding(
                     new_id, n.get_text()
                 )
             else:
-                id_to_embed_map[new_id] = n.embedding
+                id_to_embed_map[new_id] = embedding
 
             id_to_node_map[new_id] = n
         event_id = self._service_context.callback_manager.on_event_start(
@@ -170,7 +179,7 @@ class GPTVectorStoreIndex(BaseGPTIndex[IndexDict]):
             set(),
         )
 
-        new_ids = self._vector_store.add(embedding_results)
+        new_ids = await self._vector_store.aadd(embedding_results)
 
         # if the vector store doesn't store text, we need to add the nodes to the
         # index struct and document store
@@ -183,11 +192,11 @@ class GPTVectorStoreIndex(BaseGPTIndex[IndexDict]):
         self,
         index_struct: IndexDict,
         nodes: Sequence[Node],
+        embeddings_by_text: Optional[Dict[str, List[float]]] = None,
     ) -> None:
         """Add document to index."""
         embedding_results = self._get_node_embedding_results(
-            nodes,
-            set(),
+            nodes, set(), embeddings_by_text=embeddings_by_text
         )
 
         new_ids = self._vector_store.add(embedding_results)
@@ -239,8 +248,53 @@ class GPTVectorStoreIndex(BaseGPTIndex[IndexDict]):
             if vector store does not store text
         """
         self._insert(nodes, **insert_kwargs)
+        self._storage_context.index_store.add_index_struct(self._index_struct)
+
+    @llm_token_counter("insert")
+    def _insert_nodes_with_embeddings(
+        self,
+        nodes: Sequence[Node],
+        embeddings_by_text: Dict[str, List[float]],
+        **insert_kwargs: Any,
+    ) -> None:
+        """Insert nodes, reusing the embeddings of their texts if known."""
+        self._add_nodes_to_index(
+            self._index_struct, nodes, embeddings_by_text=embeddings_by_text
+        )
+        self._storage_context.index_store.add_index_struct(self._index_struct)
+
+    def _get_embeddings_by_text(self, doc_ids: Sequence[str]) -> Dict[str, List[float]]:
+        """Get the embeddings of the nodes of documents, keyed by node text."""
+        # NOTE: only some vector stores support getting embeddings back
+        get_embedding = getattr(self._vector_store, "get", None)
+        if get_embedding is None or self._vector_store.stores_text:
+            return {}
+        text_ids = [
+            text_id
+            for doc_id in doc_ids
+            for text_id in self._index_struct.doc_id_dict.get(doc_id, [])
+        ]
+        nodes = self._docstore.get_nodes(
+            [self._index_struct.nodes_dict[text_id] for text_id in text_ids]
+        )
+        return {
+            node.get_text(): get_embedding(text_id)
+            for text_id, node in zip(text_ids, nodes)
+        }
 
     def _delete(self, doc_id: str, **delete_kwargs: Any) -> None:
         """Delete a document."""
         self._index_struct.delete(doc_id)
         self._vector_store.delete(doc_id)
+
+    def _delete_many(self, doc_ids: Sequence[str], **delete_kwargs: Any) -> None:
+        """Delete documents."""
+        for doc_id in doc_ids:
+            self._index_struct.delete(doc_id)
+        # NOTE: not all vector stores support bulk deletes
+        delete_many = getattr(self._vector_store, "delete_many", None)
+        if delete_many is not None:
+            delete_many(doc_ids)
+        else:
+            for doc_id in doc_ids:
+                self._vector_store.delete(doc_id)
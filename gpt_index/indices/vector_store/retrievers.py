@@ -15,6 +15,7 @@ from gpt_index.token_counter.token_counter import llm_token_counter
 from gpt_index.vector_stores.types import (
     VectorStoreQuery,
     VectorStoreQueryMode,
+    VectorStoreQueryResult,
 )
 
 
@@ -67,7 +68,31 @@ class VectorIndexRetriever(BaseRetriever):
                     CBEventType.EMBEDDING, payload={"num_nodes": 1}, event_id=event_id
                 )
 
-        query = VectorStoreQuery(
+        query_result = self._vector_store.query(self._build_query(query_bundle))
+        return self._build_node_list_from_query_result(query_result)
+
+    @llm_token_counter("aretrieve")
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        embed_model = self._service_context.embed_model
+        if self._vector_store.is_embedding_query:
+            if query_bundle.embedding is None:
+                event_id = self._service_context.callback_manager.on_event_start(
+                    CBEventType.EMBEDDING
+                )
+                query_bundle.embedding = (
+                    await embed_model.aget_agg_embedding_from_queries(
+                        query_bundle.embedding_strs
+                    )
+                )
+                self._service_context.callback_manager.on_event_end(
+                    CBEventType.EMBEDDING, payload={"num_nodes": 1}, event_id=event_id
+                )
+
+        query_result = await self._vector_store.aquery(self._build_query(query_bundle))
+        return self._build_node_list_from_query_result(query_result)
+
+    def _build_query(self, query_bundle: QueryBundle) -> VectorStoreQuery:
+        return VectorStoreQuery(
             query_embedding=query_bundle.embedding,
             similarity_top_k=self._similarity_top_k,
             doc_ids=self._doc_ids,
@@ -75,8 +100,10 @@ class VectorIndexRetriever(BaseRetriever):
             mode=self._vector_store_query_mode,
             alpha=self._alpha,
         )
-        query_result = self._vector_store.query(query)
 
+    def _build_node_list_from_query_result(
+        self, query_result: VectorStoreQueryResult
+    ) -> List[NodeWithScore]:
         if query_result.nodes is None:
             # NOTE: vector store does not keep text and returns node indices.
             # Need to recover all nodes from docstore
@@ -94,10 +121,17 @@ class VectorIndexRetriever(BaseRetriever):
         else:
             # NOTE: vector store keeps text, returns nodes.
             # Only need to recover image or index nodes from docstore
-            for i in range(len(query_result.nodes)):
-                node_id = query_result.nodes[i].get_doc_id()
-                if node_id in self._docstore.docs:
-                    query_result.nodes[i] = self._docstore.get_node(node_id)
+            docstore_nodes = {
+                node.get_doc_id(): node
+                for node in self._docstore.get_nodes(
+                    [node.get_doc_id() for node in query_result.nodes],
+                    raise_error=False,
+                )
+            }
+            query_result.nodes = [
+                docstore_nodes.get(node.get_doc_id(), node)
+                for node in query_result.nodes
+            ]
 
         log_vector_store_query_result(query_result)
 
@@ -1,6 +1,7 @@
 """Text splitter implementations."""
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from langchain.text_splitter import TextSplitter
 from gpt_index.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
@@ -21,8 +22,58 @@ class TextSplit:
     num_char_overlap: Optional[int] = None
 
 
+class TiktokenOffsets:
+    """Token offsets function for a tiktoken encoding.
+
+    A class rather than a closure, so that text splitters can be pickled
+    (e.g. to parse nodes in worker processes).
+
+    """
+
+    def __init__(self, encoding: Any) -> None:
+        """Init params."""
+        self._encoding = encoding
+
+    def __call__(self, text: str) -> List[int]:
+        """Get the start character offset of each token of the text."""
+        _, offsets = self._encoding.decode_with_offsets(self._encoding.encode(text))
+        return offsets
+
+
+def _get_default_token_offsets_fn(
+    tokenizer: Callable,
+) -> Optional[Callable[[str], List[int]]]:
+    """Get a token offsets function for a tiktoken `Encoding.encode` tokenizer."""
+    encoding = getattr(tokenizer, "__self__", None)
+    if encoding is None or not hasattr(encoding, "decode_with_offsets"):
+        return None
+    return TiktokenOffsets(encoding)
+
+
 class TokenTextSplitter(TextSplitter):
-    """Implementation of splitting text that looks at word tokens."""
+    """Implementation of splitting text that looks at word tokens.
+
+    Args:
+        separator (str): separator to split text into words.
+        chunk_size (int): max number of tokens per chunk.
+        chunk_overlap (int): max number of overlapping tokens between chunks.
+        tokenizer (Optional[Callable]): tokenizer, defaults to the global one.
+        backup_separators (Optional[List[str]]): separators used to split
+            words that are larger than the chunk size.
+        tokenize_once (bool): whether to tokenize each text once, and count
+            tokens of words (and windows of words) from the token offsets,
+            instead of re-tokenizing them. Words are counted in context
+            (e.g. " world" rather than "world"), so chunk boundaries can
+            differ from the default mode. These counts are approximate, since
+            tokens can merge across words, so each chunk is tokenized once
+            more and trimmed if it is over `chunk_size`. Chunks still stay
+            within `chunk_size`.
+        token_offsets_fn (Optional[Callable[[str], List[int]]]): function that
+            returns the start character offset of each token of a text.
+            Required for `tokenize_once`, unless the tokenizer is a tiktoken
+            encoding.
+
+    """
 
     def __init__(
         self,
@@ -31,6 +82,8 @@ class TokenTextSplitter(TextSplitter):
         chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
         tokenizer: Optional[Callable] = None,
         backup_separators: Optional[List[str]] = ["\n"],
+        tokenize_once: bool = False,
+        token_offsets_fn: Optional[Callable[[str], List[int]]] = None,
     ):
         """Initialize with parameters."""
         if chunk_overlap > chunk_size:
@@ -43,29 +96,69 @@ class TokenTextSplitter(TextSplitter):
         self._chunk_overlap = chunk_overlap
         self.tokenizer = tokenizer or globals_helper.tokenizer
         self._backup_separators = backup_separators
+        self._token_offsets_fn: Optional[Callable[[str], List[int]]] = None
+        if tokenize_once:
+            self._token_offsets_fn = token_offsets_fn or _get_default_token_offsets_fn(
+                self.tokenizer
+            )
+            if self._token_offsets_fn is None:
+                raise ValueError(
+                    "tokenize_once requires a token_offsets_fn for this tokenizer."
+                )
+
+    @property
+    def chunk_size(self) -> int:
+        """Get the max number of tokens per chunk."""
+        return self._chunk_size
 
     def _reduce_chunk_size(
-        self, start_idx: int, cur_idx: int, splits: List[str]
+        self,
+        start_idx: int,
+        cur_idx: int,
+        splits: List[str],
+        split_token_prefix_sums: Optional[List[int]] = None,
     ) -> int:
         """Reduce the chunk size by reducing cur_idx.
 
+        If prefix sums of split token counts are given, they are used to count
+        tokens instead of the tokenizer.
+
         Return the new cur_idx.
 
         """
-        current_doc_total = len(
-            self.tokenizer(self._separator.join(splits[start_idx:cur_idx]))
-        )
+
+        def get_num_tokens(start_idx: int, cur_idx: int) -> int:
+            if split_token_prefix_sums is not None:
+                return (
+                    split_token_prefix_sums[cur_idx]
+                    - split_token_prefix_sums[start_idx]
+                )
+            return len(self.tokenizer(self._separator.join(splits[start_idx:cur_idx])))
+
+        current_doc_total = get_num_tokens(start_idx, cur_idx)
         while current_doc_total > self._chunk_size:
             percent_to_reduce = (
                 current_doc_total - self._chunk_size
             ) / current_doc_total
             num_to_reduce = int(percent_to_reduce * (cur_idx - start_idx)) + 1
             cur_idx -= num_to_reduce
-            current_doc_total = len(
-                self.tokenizer(self._separator.join(splits[start_idx:cur_idx]))
-            )
+            current_doc_total = get_num_tokens(start_idx, cur_idx)
         return cur_idx
 
+    def _reduce_chunk_size_with_tokenizer(
+        self, start_idx: int, cur_idx: int, splits: List[str]
+    ) -> int:
+        """Reduce cur_idx until the chunk fits, counting tokens with the tokenizer.
+
+        Keeps at least one split in the chunk, so that splitting makes progress.
+
+        Return the new cur_idx.
+
+        """
+        if cur_idx <= start_idx + 1:
+            return cur_idx
+        return max(self._reduce_chunk_size(start_idx, cur_idx, splits), start_idx + 1)
+
     def _preprocess_splits(self, splits: List[str], chunk_size: int) -> List[str]:
         """Process splits.
 
@@ -112,6 +205,65 @@ class TokenTextSplitter(TextSplitter):
                 new_splits.extend(cur_splits2)
         return new_splits
 
+    def _preprocess_splits_with_offsets(
+        self, text: str, chunk_size: int
+    ) -> Tuple[List[str], List[int]]:
+        """Process splits, counting tokens from the offsets of a single tokenization.
+
+        Same as `_preprocess_splits`, but words larger than the chunk size are
+        force chunked by slicing their tokens, and the number of tokens of
+        each split is returned as well.
+
+        A token belongs to the split it ends in (i.e. the separator before a
+        word counts towards that word, as in " world").
+
+        """
+        assert self._token_offsets_fn is not None
+        token_starts = self._token_offsets_fn(text)
+
+        def count_tokens(start_char: int, end_char: int) -> int:
+            return bisect_left(token_starts, end_char) - bisect_left(
+                token_starts, start_char
+            )
+
+        new_splits: List[str] = []
+        split_token_counts: List[int] = []
+        split_start = 0
+        # start of the tokens that belong to the current split
+        tokens_start = 0
+        for split in text.split(self._separator):
+            split_end = split_start + len(split)
+            sub_splits = [(split_start, split_end)]
+            if count_tokens(tokens_start, split_end) > chunk_size:
+                for sep in self._backup_separators or []:
+                    if sep in split:
+                        sub_splits = []
+                        sub_start = split_start
+                        for sub_split in split.split(sep):
+                            sub_splits.append((sub_start, sub_start + len(sub_split)))
+                            sub_start += len(sub_split) + len(sep)
+                        break
+
+            for sub_start, sub_end in sub_splits:
+                num_cur_tokens = count_tokens(tokens_start, sub_end)
+                # split the sub split according to chunk size of the token numbers
+                while num_cur_tokens > chunk_size:
+                    first_token = bisect_left(token_starts, tokens_start)
+                    chunk_end = token_starts[first_token + chunk_size]
+                    if chunk_end <= sub_start:
+                        # NOTE: tokens share offsets when they split a character
+                        chunk_end = sub_start + 1
+                    new_splits.append(text[sub_start:chunk_end])
+                    split_token_counts.append(count_tokens(tokens_start, chunk_end))
+                    sub_start = tokens_start = chunk_end
+                    num_cur_tokens = count_tokens(tokens_start, sub_end)
+                new_splits.append(text[sub_start:sub_end])
+                split_token_counts.append(num_cur_tokens)
+                tokens_start = sub_end
+
+            split_start = split_end + len(self._separator)
+        return new_splits, split_token_counts
+
     def _postprocess_splits(self, docs: List[TextSplit]) -> List[TextSplit]:
         """Post-process splits."""
         # TODO: prune text splits, remove empty spaces
@@ -149,8 +301,28 @@ class TokenTextSplitter(TextSplitter):
             effective_chunk_size = self._chunk_size
 
         # First we naively split the large input into a bunch of smaller ones.
-        splits = text.split(self._separator)
-        splits = self._preprocess_splits(splits, effective_chunk_size)
+        split_token_counts: Optional[List[int]] = None
+        if self._token_offsets_fn is not None:
+            splits, split_token_counts = self._preprocess_splits_with_offsets(
+                text, effective_chunk_size
+            )
+        else:
+            splits = text.split(self._separator)
+            splits = self._preprocess_splits(splits, effective_chunk_size)
+
+        split_token_prefix_sums: Optional[List[int]] = None
+        if split_token_counts is not None:
+            split_token_prefix_sums = [0]
+            for num_tokens in split_token_counts:
+                split_token_prefix_sums.append(
+                    split_token_prefix_sums[-1] + max(num_tokens, 1)
+                )
+
+        def get_num_tokens(idx: int) -> int:
+            if split_token_counts is not None:
+                return max(split_token_counts[idx], 1)
+            return max(len(self.tokenizer(splits[idx])), 1)
+
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
         docs: List[TextSplit] = []
@@ -160,8 +332,7 @@ class TokenTextSplitter(TextSplitter):
         cur_total = 0
         prev_idx = 0  # store the previous end index
         while cur_idx < len(splits):
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
+            num_cur_tokens = get_num_tokens(cur_idx)
             if num_cur_tokens > effective_chunk_size:
                 raise ValueError(
                     "A single term is larger than the allowed chunk size.\n"
@@ -176,7 +347,13 @@ class TokenTextSplitter(TextSplitter):
                 # NOTE: since we use a proxy for counting tokens, we want to
                 # run tokenizer across all of current_doc first. If
                 # the chunk is too big, then we will reduce text in pieces
-                cur_idx = self._reduce_chunk_size(start_idx, cur_idx, splits)
+                cur_idx = self._reduce_chunk_size(
+                    start_idx, cur_idx, splits, split_token_prefix_sums
+                )
+                if split_token_prefix_sums is not None:
+                    cur_idx = self._reduce_chunk_size_with_tokenizer(
+                        start_idx, cur_idx, splits
+                    )
                 overlap = 0
                 # after first round, check if last chunk ended after this chunk begins
                 if prev_idx > 0 and prev_idx > start_idx:
@@ -195,7 +372,7 @@ class TokenTextSplitter(TextSplitter):
                 while cur_total > self._chunk_overlap and start_idx < cur_idx:
                     # # call tokenizer on entire overlap
                     # cur_total = self.tokenizer()
-                    cur_num_tokens = max(len(self.tokenizer(splits[start_idx])), 1)
+                    cur_num_tokens = get_num_tokens(start_idx)
                     cur_total -= cur_num_tokens
                     start_idx += 1
                 # NOTE: This is a hack, make more general
@@ -204,10 +381,8 @@ class TokenTextSplitter(TextSplitter):
             # Build up the current_doc with term d, and update the total counter with
             # the number of the number of tokens in d, wrt self.tokenizer
 
-            # we reassign cur_token and num_cur_tokens, because cur_idx
-            # may have changed
-            cur_token = splits[cur_idx]
-            num_cur_tokens = max(len(self.tokenizer(cur_token)), 1)
+            # we reassign num_cur_tokens, because cur_idx may have changed
+            num_cur_tokens = get_num_tokens(cur_idx)
 
             cur_total += num_cur_tokens
             cur_idx += 1
@@ -217,6 +392,18 @@ class TokenTextSplitter(TextSplitter):
             overlap = sum([len(splits[i]) for i in range(start_idx, prev_idx)]) + len(
                 range(start_idx, prev_idx)
             )
+        if split_token_prefix_sums is not None:
+            # NOTE: the last chunk is only checked against approximate counts,
+            # so it may still have to be split with the tokenizer
+            end_idx = self._reduce_chunk_size_with_tokenizer(start_idx, cur_idx, splits)
+            while end_idx < cur_idx:
+                docs.append(
+                    TextSplit(self._separator.join(splits[start_idx:end_idx]), overlap)
+                )
+                start_idx, overlap = end_idx, 0
+                end_idx = self._reduce_chunk_size_with_tokenizer(
+                    start_idx, cur_idx, splits
+                )
         docs.append(TextSplit(self._separator.join(splits[start_idx:cur_idx]), overlap))
 
         # run postprocessing to remove blank spaces
@@ -1,9 +1,13 @@
 """Wrapper functions around an LLM chain."""
 
+import asyncio
+import json
 import logging
+import threading
 from abc import abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Any, Generator, Optional, Protocol, Tuple
+from typing import Any, Dict, Generator, List, Optional, Protocol, Tuple
 
 import langchain
 import openai
@@ -13,9 +17,16 @@ from langchain.llms import AI21
 from langchain.base_language import BaseLanguageModel
 
 from gpt_index.constants import MAX_CHUNK_SIZE, NUM_OUTPUTS
+from gpt_index.llm_predictor.cache import (
+    BaseLLMResponseCache,
+    get_llm_cache_key,
+    get_prompt_template_id,
+)
+from gpt_index.llm_predictor.limiter import LLMRequestLimiter
 from gpt_index.prompts.base import Prompt
 from gpt_index.utils import (
     ErrorToRetry,
+    aretry_on_exceptions_with_backoff,
     globals_helper,
     retry_on_exceptions_with_backoff,
 )
@@ -157,6 +168,12 @@ class LLMPredictor(BaseLLMPredictor):
             Defaults to true.
 
         cache (Optional[langchain.cache.BaseCache]) : use cached result for LLM
+        response_cache (Optional[BaseLLMResponseCache]): cache of responses
+            used by `predict` and `apredict`, keyed by the LLM, the prompt
+            template and the prompt args. Concurrent identical prompts are
+            also coalesced into a single LLM call.
+        request_limiter (Optional[LLMRequestLimiter]): limits the number of
+            concurrent LLM calls and the requests/tokens sent per minute.
     """
 
     def __init__(
@@ -164,21 +181,179 @@ class LLMPredictor(BaseLLMPredictor):
         llm: Optional[BaseLanguageModel] = None,
         retry_on_throttling: bool = True,
         cache: Optional[BaseCache] = None,
+        response_cache: Optional[BaseLLMResponseCache] = None,
+        request_limiter: Optional[LLMRequestLimiter] = None,
     ) -> None:
         """Initialize params."""
         self._llm = llm or OpenAI(temperature=0, model_name="text-davinci-003")
         if cache is not None:
             langchain.llm_cache = cache
         self.retry_on_throttling = retry_on_throttling
+        self.response_cache = response_cache
+        self.request_limiter = request_limiter
         self._total_tokens_used = 0
         self.flag = True
         self._last_token_usage: Optional[int] = None
+        # NOTE: futures of predictions in flight, to coalesce identical prompts
+        self._inflight: Dict[str, Future] = {}
+        self._ainflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     @property
     def llm(self) -> BaseLanguageModel:
         """Get LLM."""
         return self._llm
 
+    @property
+    def model_id(self) -> str:
+        """Get an identifier of the LLM, used for caching.
+
+        Includes the LLM parameters (e.g. model name and temperature), so
+        that different LLM configurations never share cache entries.
+
+        """
+        llm_params = getattr(self._llm, "_identifying_params", {})
+        return f"{type(self._llm).__name__}/" + json.dumps(
+            dict(llm_params), sort_keys=True, default=str
+        )
+
+    def _get_cache_key(self, prompt: Prompt, prompt_args: Dict[str, Any]) -> str:
+        """Get the response cache key of a prompt."""
+        full_prompt_args = prompt.get_full_format_args(dict(prompt_args))
+        return get_llm_cache_key(
+            self.model_id,
+            get_prompt_template_id(prompt, llm=self._llm),
+            full_prompt_args,
+        )
+
+    def _get_inflight_future(
+        self, cache_key: str, inflight: Dict[str, Future]
+    ) -> Tuple[Future, bool]:
+        """Get the future of an in-flight prediction.
+
+        Returns the future and whether the caller is the first one to make
+        this prediction, in which case it must call the LLM.
+
+        """
+        with self._inflight_lock:
+            future = inflight.get(cache_key)
+            if future is not None:
+                return future, False
+            future = Future()
+            inflight[cache_key] = future
+            return future, True
+
+    def _end_inflight_future(
+        self,
+        cache_key: str,
+        inflight: Dict[str, Future],
+        prediction: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Cache a prediction and resolve its in-flight future.
+
+        Failing to cache the prediction is not fatal: it is logged, and the
+        future still resolves to the prediction.
+
+        """
+        future = inflight[cache_key]
+        try:
+            if error is None:
+                assert self.response_cache is not None and prediction is not None
+                try:
+                    self.response_cache.put(cache_key, prediction)
+                except Exception:
+                    logger.warning("Failed to cache LLM response.", exc_info=True)
+        finally:
+            with self._inflight_lock:
+                del inflight[cache_key]
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(prediction)
+
+    def _get_num_limited_tokens(self, prompt: Prompt, **prompt_args: Any) -> int:
+        """Get the number of prompt tokens counted by the request limiter."""
+        if self.request_limiter is None or not self.request_limiter.limits_tokens:
+            return 0
+        return self._count_tokens(prompt.format(llm=self._llm, **prompt_args))
+
+    def _limited_predict(self, prompt: Prompt, **prompt_args: Any) -> str:
+        """Predict, waiting for the request limiter if there is one."""
+        if self.request_limiter is None:
+            return self._predict(prompt, **prompt_args)
+        num_tokens = self._get_num_limited_tokens(prompt, **prompt_args)
+        with self.request_limiter.limit(num_tokens):
+            return self._predict(prompt, **prompt_args)
+
+    async def _alimited_predict(self, prompt: Prompt, **prompt_args: Any) -> str:
+        """Asynchronously predict, waiting for the request limiter if there is one."""
+        if self.request_limiter is None:
+            return await self._apredict(prompt, **prompt_args)
+        num_tokens = self._get_num_limited_tokens(prompt, **prompt_args)
+        async with self.request_limiter.alimit(num_tokens):
+            return await self._apredict(prompt, **prompt_args)
+
+    def _cached_predict(self, prompt: Prompt, **prompt_args: Any) -> Tuple[str, bool]:
+        """Predict through the response cache.
+
+        Returns the prediction and whether it was made by calling the LLM.
+
+        """
+        if self.response_cache is None:
+            return self._limited_predict(prompt, **prompt_args), True
+
+        cache_key = self._get_cache_key(prompt, prompt_args)
+        cached_prediction = self.response_cache.get(cache_key)
+        if cached_prediction is not None:
+            return cached_prediction, False
+
+        future, is_first = self._get_inflight_future(cache_key, self._inflight)
+        if not is_first:
+            return future.result(), False
+        try:
+            # NOTE: the prediction may have been cached since the first lookup
+            llm_prediction = self.response_cache.get(cache_key, update_stats=False)
+            is_new = llm_prediction is None
+            if llm_prediction is None:
+                llm_prediction = self._limited_predict(prompt, **prompt_args)
+        except BaseException as e:
+            self._end_inflight_future(cache_key, self._inflight, error=e)
+            raise
+        self._end_inflight_future(cache_key, self._inflight, llm_prediction)
+        return llm_prediction, is_new
+
+    async def _acached_predict(
+        self, prompt: Prompt, **prompt_args: Any
+    ) -> Tuple[str, bool]:
+        """Asynchronously predict through the response cache.
+
+        Returns the prediction and whether it was made by calling the LLM.
+
+        """
+        if self.response_cache is None:
+            return await self._alimited_predict(prompt, **prompt_args), True
+
+        cache_key = self._get_cache_key(prompt, prompt_args)
+        cached_prediction = self.response_cache.get(cache_key)
+        if cached_prediction is not None:
+            return cached_prediction, False
+
+        future, is_first = self._get_inflight_future(cache_key, self._ainflight)
+        if not is_first:
+            return await asyncio.wrap_future(future), False
+        try:
+            # NOTE: the prediction may have been cached since the first lookup
+            llm_prediction = self.response_cache.get(cache_key, update_stats=False)
+            is_new = llm_prediction is None
+            if llm_prediction is None:
+                llm_prediction = await self._alimited_predict(prompt, **prompt_args)
+        except BaseException as e:
+            self._end_inflight_future(cache_key, self._ainflight, error=e)
+            raise
+        self._end_inflight_future(cache_key, self._ainflight, llm_prediction)
+        return llm_prediction, is_new
+
     def get_llm_metadata(self) -> LLMMetadata:
         """Get LLM metadata."""
         # TODO: refactor mocks in unit tests, this is a stopgap solution
@@ -187,6 +362,15 @@ class LLMPredictor(BaseLLMPredictor):
         else:
             return LLMMetadata()
 
+    def _get_errors_to_retry(self) -> List[ErrorToRetry]:
+        """Get the errors retried with backoff if retry_on_throttling is true."""
+        return [
+            ErrorToRetry(openai.error.RateLimitError),
+            ErrorToRetry(openai.error.ServiceUnavailableError),
+            ErrorToRetry(openai.error.TryAgain),
+            ErrorToRetry(openai.error.APIConnectionError, lambda e: e.should_retry),
+        ]
+
     def _predict(self, prompt: Prompt, **prompt_args: Any) -> str:
         """Inner predict function.
 
@@ -203,14 +387,7 @@ class LLMPredictor(BaseLLMPredictor):
         if self.retry_on_throttling:
             llm_prediction = retry_on_exceptions_with_backoff(
                 lambda: llm_chain.predict(**full_prompt_args),
-                [
-                    ErrorToRetry(openai.error.RateLimitError),
-                    ErrorToRetry(openai.error.ServiceUnavailableError),
-                    ErrorToRetry(openai.error.TryAgain),
-                    ErrorToRetry(
-                        openai.error.APIConnectionError, lambda e: e.should_retry
-                    ),
-                ],
+                self._get_errors_to_retry(),
             )
         else:
             llm_prediction = llm_chain.predict(**full_prompt_args)
@@ -227,8 +404,10 @@ class LLMPredictor(BaseLLMPredictor):
 
         """
         formatted_prompt = prompt.format(llm=self._llm, **prompt_args)
-        llm_prediction = self._predict(prompt, **prompt_args)
+        llm_prediction, is_new = self._cached_predict(prompt, **prompt_args)
         logger.debug(llm_prediction)
+        if not is_new:
+            return llm_prediction, formatted_prompt
 
         # We assume that the value of formatted_prompt is exactly the thing
         # eventually sent to OpenAI, or whatever LLM downstream
@@ -292,8 +471,13 @@ class LLMPredictor(BaseLLMPredictor):
         # Note: we don't pass formatted_prompt to llm_chain.predict because
         # langchain does the same formatting under the hood
         full_prompt_args = prompt.get_full_format_args(prompt_args)
-        # TODO: support retry on throttling
-        llm_prediction = await llm_chain.apredict(**full_prompt_args)
+        if self.retry_on_throttling:
+            llm_prediction = await aretry_on_exceptions_with_backoff(
+                lambda: llm_chain.apredict(**full_prompt_args),
+                self._get_errors_to_retry(),
+            )
+        else:
+            llm_prediction = await llm_chain.apredict(**full_prompt_args)
         return llm_prediction
 
     async def apredict(self, prompt: Prompt, **prompt_args: Any) -> Tuple[str, str]:
@@ -307,8 +491,10 @@ class LLMPredictor(BaseLLMPredictor):
 
         """
         formatted_prompt = prompt.format(llm=self._llm, **prompt_args)
-        llm_prediction = await self._apredict(prompt, **prompt_args)
+        llm_prediction, is_new = await self._acached_predict(prompt, **prompt_args)
         logger.debug(llm_prediction)
+        if not is_new:
+            return llm_prediction, formatted_prompt
 
         # We assume that the value of formatted_prompt is exactly the thing
         # eventually sent to OpenAI, or whatever LLM downstream
@@ -0,0 +1,164 @@
+"""LLM response caches.
+
+Responses are cached by prompt fingerprint: the key is a hash of the
+identity of the LLM (see `LLMPredictor.model_id`), the prompt template and
+the normalized prompt args, so identical prompts skip the LLM entirely.
+
+"""
+
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from gpt_index.prompts.base import Prompt
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+def _normalize_prompt_arg(value: Any) -> Any:
+    """Normalize the line endings of a prompt arg.
+
+    Other whitespace is kept, as it changes the prompt sent to the LLM.
+
+    """
+    if isinstance(value, str):
+        return value.replace("\r\n", "\n")
+    return value
+
+
+def get_prompt_template_id(prompt: Prompt, llm: Optional[Any] = None) -> str:
+    """Get an identifier of the template a prompt is formatted with."""
+    lc_prompt = prompt.get_langchain_prompt(llm=llm)
+    template = getattr(lc_prompt, "template", None)
+    if template is None:
+        template = repr(lc_prompt)
+    return f"{prompt.prompt_type}:{template}"
+
+
+def get_llm_cache_key(
+    model_id: str, template_id: str, prompt_args: Dict[str, Any]
+) -> str:
+    """Get the cache key of a prompt sent to a given LLM."""
+    fingerprint = json.dumps(
+        {
+            "model": model_id,
+            "template": template_id,
+            "args": {k: _normalize_prompt_arg(v) for k, v in prompt_args.items()},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+class BaseLLMResponseCache(ABC):
+    """Base LLM response cache.
+
+    Keeps track of hits and misses across lookups.
+
+    Args:
+        ttl (Optional[float]): number of seconds a response stays cached.
+            Defaults to no expiration.
+
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        """Init params."""
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Get a response and its expiration time, or None if it is not cached."""
+
+    @abstractmethod
+    def _put(self, key: str, response: str, expires_at: Optional[float]) -> None:
+        """Cache a response until its expiration time."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete a cached response."""
+
+    def get(self, key: str, update_stats: bool = True) -> Optional[str]:
+        """Get a response, or None if it is not cached or has expired.
+
+        Args:
+            key (str): cache key.
+            update_stats (bool): whether to count the lookup as a hit or miss.
+
+        """
+        response = None
+        value = self._get(key)
+        if value is not None:
+            if value[1] is None or value[1] > time.time():
+                response = value[0]
+            else:
+                self.delete(key)
+        if update_stats:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Cache a response."""
+        expires_at = time.time() + self._ttl if self._ttl is not None else None
+        self._put(key, response, expires_at)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that were cache hits."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset hit and miss counts."""
+        self.hits = 0
+        self.misses = 0
+
+
+class SimpleLLMResponseCache(BaseLLMResponseCache):
+    """In-memory LRU LLM response cache.
+
+    Args:
+        max_size (int): max number of cached responses.
+        ttl (Optional[float]): number of seconds a response stays cached.
+
+    """
+
+    def __init__(
+        self, max_size: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = None
+    ) -> None:
+        """Init params."""
+        super().__init__(ttl=ttl)
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self._max_size = max_size
+        self._data: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def _put(self, key: str, response: str, expires_at: Optional[float]) -> None:
+        """Cache a response, evicting the least recently used one if full."""
+        self._data[key] = (response, expires_at)
+        self._data.move_to_end(key)
+        if len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Delete a cached response."""
+        self._data.pop(key, None)
@@ -3,7 +3,6 @@
 import logging
 from typing import Any, List, Optional, Union
 
-import openai
 from langchain import LLMChain
 from langchain.chat_models import ChatOpenAI
 from langchain.prompts.base import BasePromptTemplate
@@ -17,7 +16,10 @@ from langchain.base_language import BaseLanguageModel, BaseMessage
 
 from gpt_index.llm_predictor.base import LLMPredictor
 from gpt_index.prompts.base import Prompt
-from gpt_index.utils import ErrorToRetry, retry_on_exceptions_with_backoff
+from gpt_index.utils import (
+    aretry_on_exceptions_with_backoff,
+    retry_on_exceptions_with_backoff,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +47,7 @@ class ChatGPTLLMPredictor(LLMPredictor):
         prepend_messages: Optional[
             List[Union[BaseMessagePromptTemplate, BaseMessage]]
         ] = None,
-        **kwargs: Any
+        **kwargs: Any,
     ) -> None:
         """Initialize params."""
         super().__init__(
@@ -53,6 +55,11 @@ class ChatGPTLLMPredictor(LLMPredictor):
         )
         self.prepend_messages = prepend_messages
 
+    @property
+    def model_id(self) -> str:
+        """Get an identifier of the LLM and prepended messages, used for caching."""
+        return f"{super().model_id}/{self.prepend_messages!r}"
+
     def _get_langchain_prompt(
         self, prompt: Prompt
     ) -> Union[ChatPromptTemplate, BasePromptTemplate]:
@@ -84,14 +91,7 @@ class ChatGPTLLMPredictor(LLMPredictor):
         if self.retry_on_throttling:
             llm_prediction = retry_on_exceptions_with_backoff(
                 lambda: llm_chain.predict(**full_prompt_args),
-                [
-                    ErrorToRetry(openai.error.RateLimitError),
-                    ErrorToRetry(openai.error.ServiceUnavailableError),
-                    ErrorToRetry(openai.error.TryAgain),
-                    ErrorToRetry(
-                        openai.error.APIConnectionError, lambda e: e.should_retry
-                    ),
-                ],
+                self._get_errors_to_retry(),
             )
         else:
             llm_prediction = llm_chain.predict(**full_prompt_args)
@@ -109,6 +109,11 @@ class ChatGPTLLMPredictor(LLMPredictor):
         # Note: we don't pass formatted_prompt to llm_chain.predict because
         # langchain does the same formatting under the hood
         full_prompt_args = prompt.get_full_format_args(prompt_args)
-        # TODO: support retry on throttling
-        llm_prediction = await llm_chain.apredict(**full_prompt_args)
+        if self.retry_on_throttling:
+            llm_prediction = await aretry_on_exceptions_with_backoff(
+                lambda: llm_chain.apredict(**full_prompt_args),
+                self._get_errors_to_retry(),
+            )
+        else:
+            llm_prediction = await llm_chain.apredict(**full_prompt_args)
         return llm_prediction
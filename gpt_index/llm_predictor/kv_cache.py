@@ -0,0 +1,79 @@
+"""Key-value store backed LLM response cache."""
+
+from typing import Optional, Tuple
+
+from gpt_index.llm_predictor.cache import BaseLLMResponseCache
+from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from gpt_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+from gpt_index.storage.kvstore.types import BaseInMemoryKVStore, BaseKVStore
+
+DEFAULT_NAMESPACE = "llm_cache"
+
+
+class KVLLMResponseCache(BaseLLMResponseCache):
+    """LLM response cache backed by a key-value store.
+
+    Any BaseKVStore can be used, e.g. a SQLiteKVStore or a MongoDBKVStore,
+    so that cached responses survive across runs and are shared across
+    processes.
+
+    Args:
+        kvstore (Optional[BaseKVStore]): key-value store.
+            Defaults to a SimpleKVStore.
+        namespace (Optional[str]): namespace for the cache.
+        ttl (Optional[float]): number of seconds a response stays cached.
+
+    """
+
+    def __init__(
+        self,
+        kvstore: Optional[BaseKVStore] = None,
+        namespace: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Init params."""
+        super().__init__(ttl=ttl)
+        self._kvstore = kvstore or SimpleKVStore()
+        self._collection = f"{namespace or DEFAULT_NAMESPACE}/data"
+
+    def _get(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        value = self._kvstore.get(key, collection=self._collection)
+        if value is None:
+            return None
+        return value["response"], value.get("expires_at")
+
+    def _put(self, key: str, response: str, expires_at: Optional[float]) -> None:
+        self._kvstore.put(
+            key,
+            {"response": response, "expires_at": expires_at},
+            collection=self._collection,
+        )
+
+    def delete(self, key: str) -> None:
+        """Delete a cached response."""
+        self._kvstore.delete(key, collection=self._collection)
+
+    def persist(self, persist_path: str) -> None:
+        """Persist the cache, if the key-value store is in-memory."""
+        if isinstance(self._kvstore, BaseInMemoryKVStore):
+            self._kvstore.persist(persist_path)
+
+    @classmethod
+    def from_persist_path(
+        cls,
+        persist_path: str,
+        namespace: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> "KVLLMResponseCache":
+        """Load a KVLLMResponseCache persisted with a SimpleKVStore."""
+        return cls(SimpleKVStore.from_persist_path(persist_path), namespace, ttl)
+
+    @classmethod
+    def from_sqlite_path(
+        cls,
+        persist_path: str,
+        namespace: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> "KVLLMResponseCache":
+        """Create a KVLLMResponseCache backed by a SQLite database."""
+        return cls(SQLiteKVStore(persist_path), namespace, ttl)
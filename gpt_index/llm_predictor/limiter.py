@@ -0,0 +1,158 @@
+"""LLM request limiter.
+
+Bounds the number of in-flight LLM calls and the request/token budgets per
+minute, so that concurrent index builds and queries don't hammer the provider.
+
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Deque, Generator, Optional, Tuple
+
+from gpt_index.utils import RateLimiter
+
+
+class LLMRequestLimiter:
+    """LLM request limiter.
+
+    Shared by all LLM calls of an LLMPredictor (and of the indices and query
+    engines using its ServiceContext), in both the sync and the async path.
+    `max_concurrency` caps all in-flight calls together: sync calls from any
+    thread and async calls from any event loop.
+
+    Args:
+        max_concurrency (Optional[int]): max number of in-flight LLM calls.
+        max_requests_per_minute (Optional[int]): request budget.
+        max_tokens_per_minute (Optional[int]): prompt token budget.
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_requests_per_minute: Optional[int] = None,
+        max_tokens_per_minute: Optional[int] = None,
+    ) -> None:
+        """Init params."""
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        self.max_concurrency = max_concurrency
+        self._request_limiter = (
+            RateLimiter(max_requests_per_minute) if max_requests_per_minute else None
+        )
+        self._token_limiter = (
+            RateLimiter(max_tokens_per_minute) if max_tokens_per_minute else None
+        )
+
+        # NOTE: a single semaphore for both paths. Async calls never block
+        # their event loop on it: they wait on a future, which is resolved
+        # (from any thread) when a slot is released.
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        self._async_waiters: Deque[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limits_tokens(self) -> bool:
+        """Whether calls need to pass their number of prompt tokens."""
+        return self._token_limiter is not None
+
+    def _release(self) -> None:
+        """Release a slot, waking up an async waiter if there is one."""
+        assert self._semaphore is not None
+        with self._lock:
+            self._semaphore.release()
+        self._wake_async_waiter()
+
+    def _wake_async_waiter(self) -> None:
+        """Wake up the first async waiter, to retry acquiring a slot."""
+        with self._lock:
+            if not self._async_waiters:
+                return
+            loop, future = self._async_waiters.popleft()
+        try:
+            loop.call_soon_threadsafe(self._resolve_waiter, future)
+        except RuntimeError:
+            # the loop of the waiter is closed, wake up the next one
+            self._wake_async_waiter()
+
+    def _resolve_waiter(self, future: asyncio.Future) -> None:
+        """Resolve the future of a waiter, in its event loop."""
+        if future.cancelled():
+            # NOTE: pass the wake up on, so that it isn't lost
+            self._wake_async_waiter()
+        elif not future.done():
+            future.set_result(None)
+
+    async def _aacquire(self) -> None:
+        """Asynchronously acquire a slot, without blocking the event loop."""
+        assert self._semaphore is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._semaphore.acquire(blocking=False):
+                    return
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, future) in self._async_waiters:
+                        self._async_waiters.remove((loop, future))
+                if future.done() and not future.cancelled():
+                    self._wake_async_waiter()
+                raise
+
+    def _reserve(self, num_tokens: int) -> float:
+        """Reserve request and token budgets, returning the seconds to wait."""
+        wait_secs = 0.0
+        if self._request_limiter is not None:
+            wait_secs = self._request_limiter.reserve()
+        if self._token_limiter is not None and num_tokens > 0:
+            wait_secs = max(wait_secs, self._token_limiter.reserve(num_tokens))
+        return wait_secs
+
+    @contextmanager
+    def limit(self, num_tokens: int = 0) -> Generator[None, None, None]:
+        """Wait for a slot and the budgets before making an LLM call."""
+        if self._semaphore is None:
+            self._wait(num_tokens)
+            yield
+            return
+        self._semaphore.acquire()
+        try:
+            self._wait(num_tokens)
+            yield
+        finally:
+            self._release()
+
+    def _wait(self, num_tokens: int) -> None:
+        wait_secs = self._reserve(num_tokens)
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+
+    @asynccontextmanager
+    async def alimit(self, num_tokens: int = 0) -> AsyncGenerator[None, None]:
+        """Asynchronously wait for a slot and the budgets before an LLM call."""
+        if self._semaphore is None:
+            await self._await(num_tokens)
+            yield
+            return
+        await self._aacquire()
+        try:
+            await self._await(num_tokens)
+            yield
+        finally:
+            self._release()
+
+    async def _await(self, num_tokens: int) -> None:
+        wait_secs = self._reserve(num_tokens)
+        if wait_secs > 0:
+            await asyncio.sleep(wait_secs)
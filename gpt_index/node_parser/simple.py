@@ -1,11 +1,35 @@
 """Simple node parser."""
-from typing import List, Optional, Sequence
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Generator, Iterable, List, Optional, Sequence
 
 from gpt_index.data_structs.node_v2 import Node
 from gpt_index.langchain_helpers.text_splitter import TextSplitter, TokenTextSplitter
 from gpt_index.node_parser.node_utils import get_nodes_from_document
 from gpt_index.readers.schema.base import Document
 from gpt_index.node_parser.interface import NodeParser
+from gpt_index.utils import iter_batch
+
+DEFAULT_PARSE_BATCH_SIZE = 64
+
+
+def _get_nodes_from_documents_batch(
+    documents: List[Document],
+    text_splitter: TextSplitter,
+    include_extra_info: bool,
+    include_prev_next_rel: bool,
+) -> List[Node]:
+    """Parse a batch of documents into nodes (in a worker process)."""
+    return [
+        node
+        for document in documents
+        for node in get_nodes_from_document(
+            document,
+            text_splitter,
+            include_extra_info,
+            include_prev_next_rel=include_prev_next_rel,
+        )
+    ]
 
 
 class SimpleNodeParser(NodeParser):
@@ -17,6 +41,10 @@ class SimpleNodeParser(NodeParser):
         text_splitter (Optional[TextSplitter]): text splitter
         include_extra_info (bool): whether to include extra info in nodes
         include_prev_next_rel (bool): whether to include prev/next relationships
+        num_workers (int): number of processes used to split documents.
+            Documents are split in the calling process if 1.
+        batch_size (int): number of documents submitted to a worker process
+            at a time.
 
     """
 
@@ -25,11 +53,62 @@ class SimpleNodeParser(NodeParser):
         text_splitter: Optional[TextSplitter] = None,
         include_extra_info: bool = True,
         include_prev_next_rel: bool = True,
+        num_workers: int = 1,
+        batch_size: int = DEFAULT_PARSE_BATCH_SIZE,
     ) -> None:
         """Init params."""
+        if num_workers <= 0:
+            raise ValueError("num_workers must be > 0")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
         self._text_splitter = text_splitter or TokenTextSplitter()
         self._include_extra_info = include_extra_info
         self._include_prev_next_rel = include_prev_next_rel
+        self._num_workers = num_workers
+        self._batch_size = batch_size
+
+    def iter_nodes_from_documents(
+        self,
+        documents: Iterable[Document],
+    ) -> Generator[Node, None, None]:
+        """Parse documents into nodes, yielding nodes as they are produced.
+
+        Nodes are yielded in the same order as the serial path, regardless
+        of `num_workers`. With multiple workers, at most two batches per
+        worker are in flight, so `documents` can be a lazy iterable.
+
+        Args:
+            documents (Iterable[Document]): documents to parse
+
+        """
+        if self._num_workers == 1:
+            for document in documents:
+                yield from get_nodes_from_document(
+                    document,
+                    self._text_splitter,
+                    self._include_extra_info,
+                    include_prev_next_rel=self._include_prev_next_rel,
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=self._num_workers) as executor:
+            futures: Deque[Future] = deque()
+            for batch in iter_batch(documents, self._batch_size):
+                futures.append(
+                    executor.submit(
+                        _get_nodes_from_documents_batch,
+                        batch,
+                        self._text_splitter,
+                        self._include_extra_info,
+                        self._include_prev_next_rel,
+                    )
+                )
+                # NOTE: results are consumed in submission order, to keep the
+                # output deterministic
+                if len(futures) >= 2 * self._num_workers:
+                    yield from futures.popleft().result()
+            while futures:
+                yield from futures.popleft().result()
 
     def get_nodes_from_documents(
         self,
@@ -42,13 +121,4 @@ class SimpleNodeParser(NodeParser):
             include_extra_info (bool): whether to include extra info in nodes
 
         """
-        all_nodes: List[Node] = []
-        for document in documents:
-            nodes = get_nodes_from_document(
-                document,
-                self._text_splitter,
-                self._include_extra_info,
-                include_prev_next_rel=self._include_prev_next_rel,
-            )
-            all_nodes.extend(nodes)
-        return all_nodes
+        return list(self.iter_nodes_from_documents(documents))
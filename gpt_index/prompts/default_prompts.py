@@ -271,6 +271,28 @@ DEFAULT_KG_TRIPLET_EXTRACT_PROMPT = KnowledgeGraphPrompt(
     DEFAULT_KG_TRIPLET_EXTRACT_TMPL
 )
 
+DEFAULT_KG_TRIPLET_EXTRACT_MULTI_TMPL = (
+    "Some numbered texts are provided below. Given each text, extract up to "
+    "{max_knowledge_triplets} "
+    "knowledge triplets in the form of (subject, predicate, object). Avoid stopwords.\n"
+    "Prefix each triplet with the number of the text it was extracted from.\n"
+    "---------------------\n"
+    "Example:\n"
+    "[1] Alice is Bob's mother.\n"
+    "[2] Philz is a coffee shop founded in Berkeley in 1982.\n"
+    "Triplets:\n"
+    "[1] (Alice, is mother of, Bob)\n"
+    "[2] (Philz, is, coffee shop)\n"
+    "[2] (Philz, founded in, Berkeley)\n"
+    "[2] (Philz, founded in, 1982)\n"
+    "---------------------\n"
+    "{text}\n"
+    "Triplets:\n"
+)
+DEFAULT_KG_TRIPLET_EXTRACT_MULTI_PROMPT = KnowledgeGraphPrompt(
+    DEFAULT_KG_TRIPLET_EXTRACT_MULTI_TMPL
+)
+
 ############################################
 # HYDE
 ##############################################
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional, Tuple
 
 from gpt_index.data_structs.node_v2 import IndexNode, Node, NodeWithScore
@@ -6,6 +10,45 @@ from gpt_index.indices.query.base import BaseQueryEngine
 from gpt_index.indices.query.schema import QueryBundle
 from gpt_index.response.schema import RESPONSE_TYPE
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class _QueryCancelledError(Exception):
+    """Raised in a child query that was cancelled after its level timed out."""
+
+
+class _CancelScope:
+    """Cancellation flag of a child query, set when it or its parent is cancelled.
+
+    Threads can't be interrupted, so the flag is checked before each
+    retrieve/synthesize call: a call that is already running completes,
+    but no new call is made for a cancelled query.
+
+    """
+
+    def __init__(self, parent: Optional["_CancelScope"] = None) -> None:
+        """Init params."""
+        self._event = threading.Event()
+        self._parent = parent
+
+    def cancel(self) -> None:
+        """Cancel the query, and all queries to its children."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the query or one of its parents was cancelled."""
+        if self._event.is_set():
+            return True
+        return self._parent is not None and self._parent.cancelled
+
+    def check(self) -> None:
+        """Raise if the query was cancelled."""
+        if self.cancelled:
+            raise _QueryCancelledError()
+
 
 class ComposableGraphQueryEngine(BaseQueryEngine):
     """Composable graph query engine.
@@ -13,11 +56,23 @@ class ComposableGraphQueryEngine(BaseQueryEngine):
     This query engine can operate over a ComposableGraph.
     It can take in custom query engines for its sub-indices.
 
+    When querying recursively, the child indices retrieved at each level are
+    queried concurrently: with a thread pool in `query`, and with asyncio
+    in `aquery`.
+
     Args:
         graph (ComposableGraph): A ComposableGraph object.
         custom_query_engines (Optional[Dict[str, BaseQueryEngine]]): A dictionary of
             custom query engines.
         recursive (bool): Whether to recursively query the graph.
+        max_concurrency (int): Max number of retrieve/synthesize calls
+            running at once, across all levels of the graph.
+        timeout (Optional[float]): Max number of seconds to wait for the child
+            indices of a level. Child indices that have not answered by then
+            fall back to the text of their index node (e.g. the index summary).
+            In `query`, a timed out child query makes no new retrieve or
+            synthesize calls, but a call that is already running completes in
+            the background (at most one per timed out child and descendant).
 
     """
 
@@ -26,59 +81,231 @@ class ComposableGraphQueryEngine(BaseQueryEngine):
         graph: ComposableGraph,
         custom_query_engines: Optional[Dict[str, BaseQueryEngine]] = None,
         recursive: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
     ) -> None:
         """Init params."""
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         self._graph = graph
         self._custom_query_engines = custom_query_engines or {}
 
         # additional configs
         self._recursive = recursive
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
 
     async def _aquery(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
-        return self._query_index(query_bundle, index_id=None, level=0)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        return await self._aquery_index(
+            query_bundle, index_id=None, level=0, semaphore=semaphore
+        )
 
     def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
-        return self._query_index(query_bundle, index_id=None, level=0)
+        semaphore = threading.BoundedSemaphore(self._max_concurrency)
+        return self._query_index(
+            query_bundle,
+            index_id=None,
+            level=0,
+            semaphore=semaphore,
+            cancel_scope=_CancelScope(),
+        )
+
+    def _get_query_engine(self, index_id: str) -> BaseQueryEngine:
+        if index_id in self._custom_query_engines:
+            return self._custom_query_engines[index_id]
+        return self._graph.get_index(index_id).as_query_engine()
 
     def _query_index(
         self,
         query_bundle: QueryBundle,
         index_id: Optional[str] = None,
         level: int = 0,
+        semaphore: Optional[threading.BoundedSemaphore] = None,
+        cancel_scope: Optional[_CancelScope] = None,
     ) -> RESPONSE_TYPE:
         """Query a single index."""
         index_id = index_id or self._graph.root_id
+        semaphore = semaphore or threading.BoundedSemaphore(self._max_concurrency)
+        cancel_scope = cancel_scope or _CancelScope()
 
         # get query engine
-        if index_id in self._custom_query_engines:
-            query_engine = self._custom_query_engines[index_id]
-        else:
-            query_engine = self._graph.get_index(index_id).as_query_engine()
-        nodes = query_engine.retrieve(query_bundle)
+        query_engine = self._get_query_engine(index_id)
+        # NOTE: the semaphore is only held around calls to the sub-index,
+        # never while waiting on child indices, so nested levels can't deadlock
+        with semaphore:
+            cancel_scope.check()
+            nodes = query_engine.retrieve(query_bundle)
 
         if self._recursive:
             # do recursion here
+            results = self._fetch_all_recursive_nodes(
+                nodes, query_bundle, level, semaphore, cancel_scope
+            )
             nodes_for_synthesis = []
             additional_source_nodes = []
-            for node_with_score in nodes:
-                node_with_score, source_nodes = self._fetch_recursive_nodes(
-                    node_with_score, query_bundle, level
-                )
+            for node_with_score, source_nodes in results:
                 nodes_for_synthesis.append(node_with_score)
                 additional_source_nodes.extend(source_nodes)
-            response = query_engine.synthesize(
-                query_bundle, nodes_for_synthesis, additional_source_nodes
+            with semaphore:
+                cancel_scope.check()
+                response = query_engine.synthesize(
+                    query_bundle, nodes_for_synthesis, additional_source_nodes
+                )
+        else:
+            with semaphore:
+                cancel_scope.check()
+                response = query_engine.synthesize(query_bundle, nodes)
+
+        return response
+
+    async def _aquery_index(
+        self,
+        query_bundle: QueryBundle,
+        index_id: Optional[str] = None,
+        level: int = 0,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> RESPONSE_TYPE:
+        """Asynchronously query a single index."""
+        index_id = index_id or self._graph.root_id
+        semaphore = semaphore or asyncio.Semaphore(self._max_concurrency)
+
+        # get query engine
+        query_engine = self._get_query_engine(index_id)
+        async with semaphore:
+            nodes = await query_engine.aretrieve(query_bundle)
+
+        if self._recursive:
+            # do recursion here
+            results = await self._afetch_all_recursive_nodes(
+                nodes, query_bundle, level, semaphore
             )
+            nodes_for_synthesis = []
+            additional_source_nodes = []
+            for node_with_score, source_nodes in results:
+                nodes_for_synthesis.append(node_with_score)
+                additional_source_nodes.extend(source_nodes)
+            async with semaphore:
+                response = await query_engine.asynthesize(
+                    query_bundle, nodes_for_synthesis, additional_source_nodes
+                )
         else:
-            response = query_engine.synthesize(query_bundle, nodes)
+            async with semaphore:
+                response = await query_engine.asynthesize(query_bundle, nodes)
 
         return response
 
+    def _fetch_all_recursive_nodes(
+        self,
+        nodes: List[NodeWithScore],
+        query_bundle: QueryBundle,
+        level: int,
+        semaphore: threading.BoundedSemaphore,
+        cancel_scope: _CancelScope,
+    ) -> List[Tuple[NodeWithScore, List[NodeWithScore]]]:
+        """Fetch nodes of a level, querying child indices in a thread pool."""
+        num_index_nodes = sum(isinstance(n.node, IndexNode) for n in nodes)
+        if num_index_nodes <= 1 and self._timeout is None:
+            return [
+                self._fetch_recursive_nodes(
+                    node_with_score, query_bundle, level, semaphore, cancel_scope
+                )
+                for node_with_score in nodes
+            ]
+
+        # each child query can be cancelled on its own, if it times out
+        child_cancel_scopes = [_CancelScope(cancel_scope) for _ in nodes]
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, max(num_index_nodes, 1))
+        )
+        try:
+            futures: List[Optional[Future]] = [
+                executor.submit(
+                    self._fetch_recursive_nodes,
+                    node_with_score,
+                    query_bundle,
+                    level,
+                    semaphore,
+                    child_cancel_scope,
+                )
+                if isinstance(node_with_score.node, IndexNode)
+                else None
+                for node_with_score, child_cancel_scope in zip(
+                    nodes, child_cancel_scopes
+                )
+            ]
+            done, not_done = wait(
+                [f for f in futures if f is not None], timeout=self._timeout
+            )
+        finally:
+            # NOTE: don't block on child indices that timed out
+            executor.shutdown(wait=False)
+
+        results: List[Tuple[NodeWithScore, List[NodeWithScore]]] = []
+        for node_with_score, future, child_cancel_scope in zip(
+            nodes, futures, child_cancel_scopes
+        ):
+            if future is None:
+                results.append((node_with_score, []))
+            elif future in done:
+                results.append(future.result())
+            else:
+                # NOTE: stops the child query (and its children) from making new
+                # calls, if it is already running
+                child_cancel_scope.cancel()
+                future.cancel()
+                results.append(self._get_timeout_result(node_with_score, level))
+        return results
+
+    async def _afetch_all_recursive_nodes(
+        self,
+        nodes: List[NodeWithScore],
+        query_bundle: QueryBundle,
+        level: int,
+        semaphore: asyncio.Semaphore,
+    ) -> List[Tuple[NodeWithScore, List[NodeWithScore]]]:
+        """Fetch nodes of a level, querying child indices concurrently."""
+        tasks = [
+            asyncio.ensure_future(
+                self._afetch_recursive_nodes(
+                    node_with_score, query_bundle, level, semaphore
+                )
+            )
+            for node_with_score in nodes
+        ]
+        if not tasks:
+            return []
+        _, pending = await asyncio.wait(tasks, timeout=self._timeout)
+        for task in pending:
+            task.cancel()
+
+        results: List[Tuple[NodeWithScore, List[NodeWithScore]]] = []
+        for node_with_score, task in zip(nodes, tasks):
+            if task in pending:
+                results.append(self._get_timeout_result(node_with_score, level))
+            else:
+                results.append(task.result())
+        return results
+
+    def _get_timeout_result(
+        self, node_with_score: NodeWithScore, level: int
+    ) -> Tuple[NodeWithScore, List[NodeWithScore]]:
+        """Fall back to the index node itself when its index timed out."""
+        logger.warning(
+            f"> Query to index {getattr(node_with_score.node, 'index_id', None)} "
+            f"at level {level + 1} timed out after {self._timeout}s, "
+            "using index node text instead."
+        )
+        return node_with_score, []
+
     def _fetch_recursive_nodes(
         self,
         node_with_score: NodeWithScore,
         query_bundle: QueryBundle,
         level: int,
+        semaphore: Optional[threading.BoundedSemaphore] = None,
+        cancel_scope: Optional[_CancelScope] = None,
     ) -> Tuple[NodeWithScore, List[NodeWithScore]]:
         """Fetch nodes.
 
@@ -89,7 +316,37 @@ class ComposableGraphQueryEngine(BaseQueryEngine):
         if isinstance(node_with_score.node, IndexNode):
             index_node = node_with_score.node
             # recursive call
-            response = self._query_index(query_bundle, index_node.index_id, level + 1)
+            response = self._query_index(
+                query_bundle, index_node.index_id, level + 1, semaphore, cancel_scope
+            )
+
+            new_node = Node(text=str(response))
+            new_node_with_score = NodeWithScore(
+                node=new_node, score=node_with_score.score
+            )
+            return new_node_with_score, response.source_nodes
+        else:
+            return node_with_score, []
+
+    async def _afetch_recursive_nodes(
+        self,
+        node_with_score: NodeWithScore,
+        query_bundle: QueryBundle,
+        level: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[NodeWithScore, List[NodeWithScore]]:
+        """Asynchronously fetch nodes.
+
+        Uses existing node if it's not an index node.
+        Otherwise fetch response from corresponding index.
+
+        """
+        if isinstance(node_with_score.node, IndexNode):
+            index_node = node_with_score.node
+            # recursive call
+            response = await self._aquery_index(
+                query_bundle, index_node.index_id, level + 1, semaphore
+            )
 
             new_node = Node(text=str(response))
             new_node_with_score = NodeWithScore(
@@ -107,6 +107,9 @@ class RetrieverQueryEngine(BaseQueryEngine):
     def retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         return self._retriever.retrieve(query_bundle)
 
+    async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        return await self._retriever.aretrieve(query_bundle)
+
     def synthesize(
         self,
         query_bundle: QueryBundle,
@@ -158,7 +161,7 @@ class RetrieverQueryEngine(BaseQueryEngine):
         query_id = self._callback_manager.on_event_start(CBEventType.QUERY)
 
         retrieve_id = self._callback_manager.on_event_start(CBEventType.RETRIEVE)
-        nodes = self._retriever.retrieve(query_bundle)
+        nodes = await self._retriever.aretrieve(query_bundle)
         self._callback_manager.on_event_end(
             CBEventType.RETRIEVE, payload={"nodes": nodes}, event_id=retrieve_id
         )
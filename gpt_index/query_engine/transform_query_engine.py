@@ -36,6 +36,12 @@ class TransformQueryEngine(BaseQueryEngine):
         )
         return self._query_engine.retrieve(query_bundle)
 
+    async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        query_bundle = self._query_transform.run(
+            query_bundle, extra_info=self._transform_extra_info
+        )
+        return await self._query_engine.aretrieve(query_bundle)
+
     def synthesize(
         self,
         query_bundle: QueryBundle,
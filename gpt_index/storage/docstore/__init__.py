@@ -1,7 +1,9 @@
 from gpt_index.storage.docstore.types import BaseDocumentStore
+from gpt_index.storage.docstore.cache import DocumentCache
 from gpt_index.storage.docstore.simple_docstore import SimpleDocumentStore
 from gpt_index.storage.docstore.mongo_docstore import MongoDocumentStore
 from gpt_index.storage.docstore.keyval_docstore import KVDocumentStore
+from gpt_index.storage.docstore.sqlite_docstore import SQLiteDocumentStore
 
 # alias for backwards compatibility
 from gpt_index.storage.docstore.simple_docstore import DocumentStore
@@ -9,8 +11,10 @@ from gpt_index.storage.docstore.simple_docstore import DocumentStore
 
 __all__ = [
     "BaseDocumentStore",
+    "DocumentCache",
     "DocumentStore",
     "SimpleDocumentStore",
     "MongoDocumentStore",
     "KVDocumentStore",
+    "SQLiteDocumentStore",
 ]
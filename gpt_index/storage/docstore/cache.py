@@ -0,0 +1,107 @@
+"""Cache of deserialized documents."""
+import copy
+import sys
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from gpt_index.data_structs.node_v2 import ImageNode
+from gpt_index.schema import BaseDocument
+
+DEFAULT_CACHE_SIZE_BYTES = 256 * 1024 * 1024
+# rough size of a document object, without its text and embedding
+DOC_OVERHEAD_BYTES = 1024
+FLOAT_SIZE_BYTES = 32
+
+
+def get_doc_size(doc: BaseDocument) -> int:
+    """Estimate the memory size of a deserialized document, in bytes."""
+    size = DOC_OVERHEAD_BYTES
+    if doc.text is not None:
+        size += sys.getsizeof(doc.text)
+    if doc.embedding is not None:
+        # NOTE: embeddings are lists of python floats
+        size += len(doc.embedding) * FLOAT_SIZE_BYTES
+    if isinstance(doc, ImageNode) and doc.image is not None:
+        size += sys.getsizeof(doc.image)
+    return size
+
+
+class DocumentCache:
+    """LRU cache of deserialized documents, bounded by memory size.
+
+    Documents are evicted (least recently used first) once the estimated
+    size of the cached documents exceeds `max_size_bytes`. Documents are
+    deep copied into and out of the cache, so modifying a returned document
+    (including nested fields like `extra_info`) does not affect the cache.
+
+    Args:
+        max_size_bytes (int): max estimated size of the cached documents.
+
+    """
+
+    def __init__(self, max_size_bytes: int = DEFAULT_CACHE_SIZE_BYTES) -> None:
+        """Init params."""
+        if max_size_bytes <= 0:
+            raise ValueError("max_size_bytes must be > 0")
+        self._max_size_bytes = max_size_bytes
+        self._size_bytes = 0
+        self._data: "OrderedDict[str, BaseDocument]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._data
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the estimated size of the cached documents."""
+        return self._size_bytes
+
+    def get(self, doc_id: str) -> Optional[BaseDocument]:
+        """Get a document, or None if it is not cached."""
+        doc = self._data.get(doc_id)
+        if doc is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(doc_id)
+        return copy.deepcopy(doc)
+
+    def put(self, doc_id: str, doc: BaseDocument) -> None:
+        """Cache a document, evicting least recently used ones if full."""
+        self.delete(doc_id)
+        doc_size = get_doc_size(doc)
+        if doc_size > self._max_size_bytes:
+            return
+        self._data[doc_id] = copy.deepcopy(doc)
+        self._sizes[doc_id] = doc_size
+        self._size_bytes += doc_size
+        while self._size_bytes > self._max_size_bytes:
+            evicted_id, _ = self._data.popitem(last=False)
+            self._size_bytes -= self._sizes.pop(evicted_id)
+
+    def delete(self, doc_id: str) -> None:
+        """Invalidate a document, if it is cached."""
+        if self._data.pop(doc_id, None) is not None:
+            self._size_bytes -= self._sizes.pop(doc_id)
+
+    def clear(self) -> None:
+        """Invalidate all documents."""
+        self._data.clear()
+        self._sizes.clear()
+        self._size_bytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that were cache hits."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset hit and miss counts."""
+        self.hits = 0
+        self.misses = 0
@@ -1,9 +1,11 @@
 """Document store."""
 
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from gpt_index.storage.docstore.cache import DocumentCache
 from gpt_index.storage.docstore.types import BaseDocumentStore
 from gpt_index.storage.docstore.utils import doc_to_json, json_to_doc
+from gpt_index.data_structs.node_v2 import Node
 from gpt_index.schema import BaseDocument
 from gpt_index.storage.kvstore.types import (
     BaseKVStore,
@@ -40,6 +42,8 @@ class KVDocumentStore(BaseDocumentStore):
     Args:
         kvstore (BaseKVStore): key-value store
         namespace (str): namespace for the docstore
+        doc_cache (Optional[DocumentCache]): cache of deserialized documents,
+            so that frequently retrieved nodes are not deserialized again.
 
     """
 
@@ -47,12 +51,14 @@ class KVDocumentStore(BaseDocumentStore):
         self,
         kvstore: BaseKVStore,
         namespace: Optional[str] = None,
+        doc_cache: Optional[DocumentCache] = None,
     ) -> None:
         """Init a KVDocumentStore."""
         self._kvstore = kvstore
         namespace = namespace or DEFAULT_NAMESPACE
         self._collection = f"{namespace}/data"
         self._metadata_collection = f"{namespace}/metadata"
+        self.doc_cache = doc_cache
 
     @property
     def docs(self) -> Dict[str, BaseDocument]:
@@ -75,6 +81,8 @@ class KVDocumentStore(BaseDocumentStore):
             allow_update (bool): allow update of docstore from document
 
         """
+        data_pairs: List[Tuple[str, dict]] = []
+        metadata_pairs: List[Tuple[str, dict]] = []
         for doc in docs:
             if doc.is_doc_id_none:
                 raise ValueError("doc_id not set")
@@ -86,10 +94,14 @@ class KVDocumentStore(BaseDocumentStore):
                     "Set allow_update to True to overwrite."
                 )
             key = doc.get_doc_id()
-            data = doc_to_json(doc)
-            metadata = {"doc_hash": doc.get_doc_hash()}
-            self._kvstore.put(key, data, collection=self._collection)
-            self._kvstore.put(key, metadata, collection=self._metadata_collection)
+            data_pairs.append((key, doc_to_json(doc)))
+            metadata_pairs.append((key, {"doc_hash": doc.get_doc_hash()}))
+        # NOTE: write in bulk, so that durable key-value stores commit once
+        self._kvstore.put_many(data_pairs, collection=self._collection)
+        self._kvstore.put_many(metadata_pairs, collection=self._metadata_collection)
+        if self.doc_cache is not None:
+            for key, _ in data_pairs:
+                self.doc_cache.delete(key)
 
     def get_document(
         self, doc_id: str, raise_error: bool = True
@@ -101,20 +113,71 @@ class KVDocumentStore(BaseDocumentStore):
             raise_error (bool): raise error if doc_id not found
 
         """
+        if self.doc_cache is not None:
+            cached_doc = self.doc_cache.get(doc_id)
+            if cached_doc is not None:
+                return cached_doc
+
         json = self._kvstore.get(doc_id, collection=self._collection)
         if json is None:
             if raise_error:
                 raise ValueError(f"doc_id {doc_id} not found.")
             else:
                 return None
-        return json_to_doc(json)
+        doc = json_to_doc(json)
+        if self.doc_cache is not None:
+            self.doc_cache.put(doc_id, doc)
+        return doc
+
+    def get_nodes(self, node_ids: List[str], raise_error: bool = True) -> List[Node]:
+        """Get nodes from the store, with a single bulk read.
+
+        Only the requested nodes are deserialized.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found.
+                Otherwise, nodes that are not found are skipped.
+
+        """
+        cached_docs: Dict[str, BaseDocument] = {}
+        if self.doc_cache is not None:
+            for node_id in node_ids:
+                cached_doc = self.doc_cache.get(node_id)
+                if cached_doc is not None:
+                    cached_docs[node_id] = cached_doc
+
+        json_dict = self._kvstore.get_many(
+            [node_id for node_id in node_ids if node_id not in cached_docs],
+            collection=self._collection,
+        )
+        nodes = []
+        for node_id in node_ids:
+            doc = cached_docs.get(node_id)
+            if doc is None:
+                json = json_dict.get(node_id)
+                if json is None:
+                    if raise_error:
+                        raise ValueError(f"doc_id {node_id} not found.")
+                    continue
+                doc = json_to_doc(json)
+                if self.doc_cache is not None:
+                    self.doc_cache.put(node_id, doc)
+            if not isinstance(doc, Node):
+                raise ValueError(f"Document {node_id} is not a Node.")
+            nodes.append(doc)
+        return nodes
 
     def document_exists(self, doc_id: str) -> bool:
         """Check if document exists."""
+        if self.doc_cache is not None and doc_id in self.doc_cache:
+            return True
         return self._kvstore.get(doc_id, self._collection) is not None
 
     def delete_document(self, doc_id: str, raise_error: bool = True) -> None:
         """Delete a document from the store."""
+        if self.doc_cache is not None:
+            self.doc_cache.delete(doc_id)
         delete_success = self._kvstore.delete(doc_id, collection=self._collection)
         _ = self._kvstore.delete(doc_id, collection=self._metadata_collection)
         if not delete_success and raise_error:
@@ -132,3 +195,21 @@ class KVDocumentStore(BaseDocumentStore):
             return metadata.get("doc_hash", None)
         else:
             return None
+
+    def set_document_hashes(self, doc_hashes: Dict[str, str]) -> None:
+        """Set the hashes for a mapping of doc_id to hash, with a single bulk write."""
+        metadata_pairs = [
+            (doc_id, {"doc_hash": doc_hash}) for doc_id, doc_hash in doc_hashes.items()
+        ]
+        self._kvstore.put_many(metadata_pairs, collection=self._metadata_collection)
+
+    def get_document_hashes(self, doc_ids: Sequence[str]) -> Dict[str, str]:
+        """Get the stored hashes for documents, with a single bulk read."""
+        metadata_dict = self._kvstore.get_many(
+            doc_ids, collection=self._metadata_collection
+        )
+        return {
+            doc_id: metadata["doc_hash"]
+            for doc_id, metadata in metadata_dict.items()
+            if metadata.get("doc_hash") is not None
+        }
@@ -1,4 +1,5 @@
 from typing import Optional
+from gpt_index.storage.docstore.cache import DocumentCache
 from gpt_index.storage.docstore.keyval_docstore import KVDocumentStore
 from gpt_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
 
@@ -11,6 +12,7 @@ class MongoDocumentStore(KVDocumentStore):
     Args:
         mongo_kvstore (MongoDBKVStore): MongoDB key-value store
         namespace (str): namespace for the docstore
+        doc_cache (Optional[DocumentCache]): cache of deserialized documents
 
     """
 
@@ -18,9 +20,10 @@ class MongoDocumentStore(KVDocumentStore):
         self,
         mongo_kvstore: MongoDBKVStore,
         namespace: Optional[str] = None,
+        doc_cache: Optional[DocumentCache] = None,
     ) -> None:
         """Init a MongoDocumentStore."""
-        super().__init__(mongo_kvstore, namespace)
+        super().__init__(mongo_kvstore, namespace, doc_cache=doc_cache)
 
     @classmethod
     def from_uri(
@@ -1,5 +1,6 @@
 import os
 from typing import Optional
+from gpt_index.storage.docstore.cache import DocumentCache
 from gpt_index.storage.docstore.keyval_docstore import KVDocumentStore
 from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
 from gpt_index.storage.kvstore.types import BaseInMemoryKVStore
@@ -18,6 +19,7 @@ class SimpleDocumentStore(KVDocumentStore):
     Args:
         simple_kvstore (SimpleKVStore): simple key-value store
         name_space (str): namespace for the docstore
+        doc_cache (Optional[DocumentCache]): cache of deserialized documents
 
     """
 
@@ -25,10 +27,11 @@ class SimpleDocumentStore(KVDocumentStore):
         self,
         simple_kvstore: Optional[SimpleKVStore] = None,
         name_space: Optional[str] = None,
+        doc_cache: Optional[DocumentCache] = None,
     ) -> None:
         """Init a SimpleDocumentStore."""
         simple_kvstore = simple_kvstore or SimpleKVStore()
-        super().__init__(simple_kvstore, name_space)
+        super().__init__(simple_kvstore, name_space, doc_cache=doc_cache)
 
     @classmethod
     def from_persist_dir(
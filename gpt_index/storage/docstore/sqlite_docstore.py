@@ -0,0 +1,58 @@
+import os
+from typing import Optional
+from gpt_index.storage.docstore.cache import DocumentCache
+from gpt_index.storage.docstore.keyval_docstore import KVDocumentStore
+from gpt_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+from gpt_index.storage.docstore.types import DEFAULT_PERSIST_DIR, DEFAULT_PERSIST_PATH
+
+DEFAULT_SQLITE_PERSIST_FNAME = "docstore.db"
+
+
+class SQLiteDocumentStore(KVDocumentStore):
+    """SQLite Document (Node) store.
+
+    A durable store for Document and Node objects, backed by a local SQLite
+    database. Unlike SimpleDocumentStore, every update is written to disk
+    right away, so adding a document never rewrites the whole store.
+
+    Args:
+        sqlite_kvstore (SQLiteKVStore): SQLite key-value store
+        namespace (str): namespace for the docstore
+        doc_cache (Optional[DocumentCache]): cache of deserialized documents
+
+    """
+
+    def __init__(
+        self,
+        sqlite_kvstore: SQLiteKVStore,
+        namespace: Optional[str] = None,
+        doc_cache: Optional[DocumentCache] = None,
+    ) -> None:
+        """Init a SQLiteDocumentStore."""
+        super().__init__(sqlite_kvstore, namespace, doc_cache=doc_cache)
+
+    @classmethod
+    def from_persist_dir(
+        cls,
+        persist_dir: str = DEFAULT_PERSIST_DIR,
+        namespace: Optional[str] = None,
+    ) -> "SQLiteDocumentStore":
+        """Load (or create) a SQLiteDocumentStore in a persist directory."""
+        persist_path = os.path.join(persist_dir, DEFAULT_SQLITE_PERSIST_FNAME)
+        return cls.from_persist_path(persist_path, namespace=namespace)
+
+    @classmethod
+    def from_persist_path(
+        cls,
+        persist_path: str,
+        namespace: Optional[str] = None,
+    ) -> "SQLiteDocumentStore":
+        """Load (or create) a SQLiteDocumentStore at a database path."""
+        return cls(SQLiteKVStore(persist_path), namespace)
+
+    def persist(self, persist_path: str = DEFAULT_PERSIST_PATH) -> None:
+        """Persist the store.
+
+        NOTE: this is a no-op, since updates are written as they happen.
+
+        """
@@ -52,16 +52,49 @@ class BaseDocumentStore(ABC):
     def get_document_hash(self, doc_id: str) -> Optional[str]:
         ...
 
+    def set_document_hashes(self, doc_hashes: Dict[str, str]) -> None:
+        """Set the hashes for a mapping of doc_id to hash.
+
+        By default, this sets hashes one at a time.
+        Meant to be overriden for bulk writes.
+
+        """
+        for doc_id, doc_hash in doc_hashes.items():
+            self.set_document_hash(doc_id, doc_hash)
+
+    def get_document_hashes(self, doc_ids: Sequence[str]) -> Dict[str, str]:
+        """Get the stored hashes for documents, skipping those without one.
+
+        By default, this gets hashes one at a time.
+        Meant to be overriden for bulk reads.
+
+        """
+        doc_hashes = {}
+        for doc_id in doc_ids:
+            doc_hash = self.get_document_hash(doc_id)
+            if doc_hash is not None:
+                doc_hashes[doc_id] = doc_hash
+        return doc_hashes
+
     # ===== Nodes =====
     def get_nodes(self, node_ids: List[str], raise_error: bool = True) -> List[Node]:
         """Get nodes from docstore.
 
         Args:
             node_ids (List[str]): node ids
-            raise_error (bool): raise error if node_id not found
+            raise_error (bool): raise error if node_id not found.
+                Otherwise, nodes that are not found are skipped.
 
         """
-        return [self.get_node(node_id, raise_error=raise_error) for node_id in node_ids]
+        nodes = []
+        for node_id in node_ids:
+            doc = self.get_document(node_id, raise_error=raise_error)
+            if doc is None:
+                continue
+            if not isinstance(doc, Node):
+                raise ValueError(f"Document {node_id} is not a Node.")
+            nodes.append(doc)
+        return nodes
 
     def get_node(self, node_id: str, raise_error: bool = True) -> Node:
         """Get node from docstore.
@@ -83,6 +116,5 @@ class BaseDocumentStore(ABC):
             node_id_dict (Dict[int, str]): mapping of index to node ids
 
         """
-        return {
-            index: self.get_node(node_id) for index, node_id in node_id_dict.items()
-        }
+        nodes = self.get_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
@@ -0,0 +1,57 @@
+import os
+from typing import Optional
+from gpt_index.storage.index_store.keyval_index_store import KVIndexStore
+from gpt_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+from gpt_index.storage.index_store.types import (
+    DEFAULT_PERSIST_DIR,
+    DEFAULT_PERSIST_PATH,
+)
+
+DEFAULT_SQLITE_PERSIST_FNAME = "index_store.db"
+
+
+class SQLiteIndexStore(KVIndexStore):
+    """SQLite Index store.
+
+    A durable index store backed by a local SQLite database. Every update is
+    written to disk right away.
+
+    Args:
+        sqlite_kvstore (SQLiteKVStore): SQLite key-value store
+        namespace (str): namespace for the index store
+
+    """
+
+    def __init__(
+        self,
+        sqlite_kvstore: SQLiteKVStore,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """Init a SQLiteIndexStore."""
+        super().__init__(sqlite_kvstore, namespace=namespace)
+
+    @classmethod
+    def from_persist_dir(
+        cls,
+        persist_dir: str = DEFAULT_PERSIST_DIR,
+        namespace: Optional[str] = None,
+    ) -> "SQLiteIndexStore":
+        """Load (or create) a SQLiteIndexStore in a persist directory."""
+        persist_path = os.path.join(persist_dir, DEFAULT_SQLITE_PERSIST_FNAME)
+        return cls.from_persist_path(persist_path, namespace=namespace)
+
+    @classmethod
+    def from_persist_path(
+        cls,
+        persist_path: str,
+        namespace: Optional[str] = None,
+    ) -> "SQLiteIndexStore":
+        """Load (or create) a SQLiteIndexStore at a database path."""
+        return cls(SQLiteKVStore(persist_path), namespace)
+
+    def persist(self, persist_path: str = DEFAULT_PERSIST_PATH) -> None:
+        """Persist the store.
+
+        NOTE: this is a no-op, since updates are written as they happen.
+
+        """
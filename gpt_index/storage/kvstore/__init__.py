@@ -1,4 +1,5 @@
 from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
 from gpt_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
+from gpt_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
 
-__all__ = ["SimpleKVStore", "MongoDBKVStore"]
+__all__ = ["SimpleKVStore", "MongoDBKVStore", "SQLiteKVStore"]
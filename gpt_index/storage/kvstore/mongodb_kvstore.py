@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Optional, Sequence, cast
 from gpt_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
 
@@ -129,6 +129,23 @@ class MongoDBKVStore(BaseKVStore):
             return result
         return None
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values from the store, skipping keys that are not found.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        results = self._db[collection].find({"_id": {"$in": list(keys)}})
+        output = {}
+        for result in results:
+            key = result.pop("_id")
+            output[key] = result
+        return output
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store.
 
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 import logging
 
 from gpt_index.storage.kvstore.types import (
@@ -41,6 +41,15 @@ class SimpleKVStore(BaseInMemoryKVStore):
             return None
         return collection_data[key].copy()
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values from the store, skipping keys that are not found."""
+        collection_data = self._data.get(collection, {})
+        return {
+            key: collection_data[key].copy() for key in keys if key in collection_data
+        }
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store."""
         return self._data.get(collection, {}).copy()
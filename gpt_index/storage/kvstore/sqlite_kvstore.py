@@ -0,0 +1,119 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+from gpt_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
+
+logger = logging.getLogger(__name__)
+
+# max number of keys per `IN (...)` query
+MAX_KEYS_PER_QUERY = 500
+
+
+class SQLiteKVStore(BaseKVStore):
+    """SQLite Key-Value store.
+
+    A durable, embedded key-value store. Every write is committed to the
+    database file right away (a bulk `put_many` in a single transaction),
+    and values are only read (and deserialized) when requested, so large
+    stores are neither loaded nor rewritten as a whole.
+
+    Args:
+        persist_path (str): path to the SQLite database file.
+            Use ":memory:" for a non-persistent store.
+
+    """
+
+    def __init__(self, persist_path: str) -> None:
+        """Init a SQLiteKVStore."""
+        if persist_path != ":memory:":
+            dirpath = os.path.dirname(persist_path)
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+        self._persist_path = persist_path
+        # NOTE: the connection is shared across threads, guarded by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(persist_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS kvstore ("
+                "collection TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (collection, key)) WITHOUT ROWID"
+            )
+
+    @property
+    def persist_path(self) -> str:
+        """Get the path to the SQLite database file."""
+        return self._persist_path
+
+    def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
+        """Put a key-value pair into the store."""
+        self.put_many([(key, val)], collection=collection)
+
+    def put_many(
+        self, kv_pairs: Sequence[Tuple[str, dict]], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Put key-value pairs into the store, in a single transaction."""
+        rows = [(collection, key, json.dumps(val)) for key, val in kv_pairs]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO kvstore (collection, key, value) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
+        """Get a value from the store."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM kvstore WHERE collection = ? AND key = ?",
+                (collection, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values from the store, skipping keys that are not found."""
+        rows = []
+        with self._lock:
+            for start in range(0, len(keys), MAX_KEYS_PER_QUERY):
+                batch_keys = list(keys[start : start + MAX_KEYS_PER_QUERY])
+                placeholders = ", ".join("?" * len(batch_keys))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT key, value FROM kvstore "
+                        f"WHERE collection = ? AND key IN ({placeholders})",
+                        [collection] + batch_keys,
+                    ).fetchall()
+                )
+        return {key: json.loads(value) for key, value in rows}
+
+    def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Get all values from the store."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM kvstore WHERE collection = ?", (collection,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Delete a value from the store."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM kvstore WHERE collection = ? AND key = ?",
+                (collection, key),
+            )
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 DEFAULT_COLLECTION = "data"
 
@@ -11,10 +11,38 @@ class BaseKVStore(ABC):
     def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
         pass
 
+    def put_many(
+        self, kv_pairs: Sequence[Tuple[str, dict]], collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Put key-value pairs into the store.
+
+        By default, this is a wrapper around put.
+        Meant to be overriden for bulk writes.
+
+        """
+        for key, val in kv_pairs:
+            self.put(key, val, collection=collection)
+
     @abstractmethod
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         pass
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> Dict[str, dict]:
+        """Get values from the store, skipping keys that are not found.
+
+        By default, this is a wrapper around get.
+        Meant to be overriden for bulk reads.
+
+        """
+        vals: Dict[str, dict] = {}
+        for key in keys:
+            val = self.get(key, collection=collection)
+            if val is not None:
+                vals[key] = val
+        return vals
+
     @abstractmethod
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         pass
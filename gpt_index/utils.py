@@ -1,7 +1,9 @@
 """General utils functions."""
 
+import asyncio
 import random
 import sys
+import threading
 import time
 import traceback
 import uuid
@@ -11,6 +13,7 @@ from itertools import islice
 from typing import (
     Any,
     Callable,
+    Dict,
     Generator,
     List,
     Optional,
@@ -140,6 +143,17 @@ class ErrorToRetry:
     check_fn: Optional[Callable[[Any], bool]] = None
 
 
+def _get_check_fn(
+    error_checks: Dict[Type[Exception], Optional[Callable[[Any], bool]]],
+    e: Exception,
+) -> Optional[Callable[[Any], bool]]:
+    """Get the check function of the closest retried class of an exception."""
+    for exception_cls in type(e).__mro__:
+        if exception_cls in error_checks:
+            return error_checks[exception_cls]
+    return None
+
+
 def retry_on_exceptions_with_backoff(
     lambda_fn: Callable,
     errors_to_retry: List[ErrorToRetry],
@@ -180,13 +194,107 @@ def retry_on_exceptions_with_backoff(
             tries += 1
             if tries >= max_tries:
                 raise
-            check_fn = error_checks.get(e.__class__)
+            check_fn = _get_check_fn(error_checks, e)
             if check_fn and not check_fn(e):
                 raise
             time.sleep(backoff_secs)
             backoff_secs = min(backoff_secs * 2, max_backoff_secs)
 
 
+async def aretry_on_exceptions_with_backoff(
+    async_fn: Callable,
+    errors_to_retry: List[ErrorToRetry],
+    max_tries: int = 10,
+    min_backoff_secs: float = 0.5,
+    max_backoff_secs: float = 60.0,
+) -> Any:
+    """Await async function with retries and exponential backoff.
+
+    Async version of `retry_on_exceptions_with_backoff`; `async_fn` is called
+    without arguments and must return an awaitable.
+
+    """
+    if not errors_to_retry:
+        raise ValueError("At least one error to retry needs to be provided")
+
+    error_checks = {
+        error_to_retry.exception_cls: error_to_retry.check_fn
+        for error_to_retry in errors_to_retry
+    }
+    exception_class_tuples = tuple(error_checks.keys())
+
+    backoff_secs = min_backoff_secs
+    tries = 0
+
+    while True:
+        try:
+            return await async_fn()
+        except exception_class_tuples as e:
+            traceback.print_exc()
+            tries += 1
+            if tries >= max_tries:
+                raise
+            check_fn = _get_check_fn(error_checks, e)
+            if check_fn and not check_fn(e):
+                raise
+            await asyncio.sleep(backoff_secs)
+            backoff_secs = min(backoff_secs * 2, max_backoff_secs)
+
+
+class RateLimiter:
+    """Token bucket rate limiter.
+
+    Allows up to `max_per_minute` units (e.g. requests or tokens) per minute,
+    with bursts of up to `max_per_minute` units. Units are reserved ahead of
+    time, so concurrent callers are served in order. Thread-safe.
+
+    Args:
+        max_per_minute (float): max number of units per minute.
+
+    """
+
+    def __init__(self, max_per_minute: float) -> None:
+        """Init params."""
+        if max_per_minute <= 0:
+            raise ValueError("max_per_minute must be > 0")
+        self._capacity = float(max_per_minute)
+        self._rate = self._capacity / 60.0
+        self._available = self._capacity
+        self._last_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Reserve units, returning the number of seconds to wait before use.
+
+        NOTE: amounts larger than the bucket are capped to the bucket size,
+        so that they wait for a full bucket instead of forever.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._available = min(
+                self._capacity,
+                self._available + (now - self._last_time) * self._rate,
+            )
+            self._last_time = now
+            self._available -= min(amount, self._capacity)
+            if self._available >= 0:
+                return 0.0
+            return -self._available / self._rate
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Reserve units, blocking until they are available."""
+        wait_secs = self.reserve(amount)
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+
+    async def aacquire(self, amount: float = 1.0) -> None:
+        """Reserve units, sleeping asynchronously until they are available."""
+        wait_secs = self.reserve(amount)
+        if wait_secs > 0:
+            await asyncio.sleep(wait_secs)
+
+
 def truncate_text(text: str, max_length: int) -> str:
     """Truncate text to a maximum length."""
     return text[: max_length - 3] + "..."
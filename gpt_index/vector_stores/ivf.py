@@ -0,0 +1,267 @@
+"""Inverted file (IVF) index for approximate nearest neighbor search.
+
+A pure-NumPy IVF index: embeddings are clustered with (spherical) k-means,
+and each embedding is assigned to the inverted list of its nearest centroid.
+At query time, only the lists of the `nprobe` centroids closest to the query
+are searched.
+
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# max number of embedding x centroid scores materialized at once
+ASSIGN_CHUNK_SIZE = 2**24
+# number of training embeddings per list
+MIN_TRAIN_SIZE_PER_LIST = 39
+MAX_TRAIN_SIZE_PER_LIST = 64
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Normalize rows to unit length."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.where(norms > 0, norms, 1.0)
+
+
+class IVFIndex:
+    """Inverted file index over cosine similarity.
+
+    The index only stores the assignment of rows of an embedding matrix to
+    inverted lists; the embeddings themselves are stored and scored by the
+    owner of the index (e.g. SimpleVectorStore), over the candidate rows
+    returned by `get_candidate_rows`. The owner must mirror the deletions
+    that move rows of its matrix with `swap_delete`.
+
+    `nlist` and `nprobe` trade off recall against latency: each query scores
+    roughly `nprobe / nlist` of all embeddings.
+
+    Args:
+        nlist (int): number of inverted lists (k-means clusters).
+        nprobe (int): number of lists searched per query.
+        num_iterations (int): number of k-means iterations.
+        min_train_size (Optional[int]): number of embeddings required before
+            the index is trained. Defaults to `39 * nlist`.
+        seed (int): random seed for k-means.
+
+    """
+
+    def __init__(
+        self,
+        nlist: int = 100,
+        nprobe: int = 10,
+        num_iterations: int = 10,
+        min_train_size: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        """Init params."""
+        if nlist <= 0 or nprobe <= 0:
+            raise ValueError("nlist and nprobe must be > 0")
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.num_iterations = num_iterations
+        self.min_train_size = min_train_size or MIN_TRAIN_SIZE_PER_LIST * nlist
+        self.seed = seed
+
+        self._centroids: Optional[np.ndarray] = None
+        # rows in each list, in the first `_list_sizes[list_no]` slots
+        self._lists: List[np.ndarray] = []
+        self._list_sizes = np.zeros(0, dtype=np.int64)
+        # list of each row and its position in the list, -1 if not indexed
+        self._row_lists = np.zeros(0, dtype=np.int64)
+        self._row_positions = np.zeros(0, dtype=np.int64)
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the centroids have been trained."""
+        return self._centroids is not None
+
+    def _assign(self, embeddings: np.ndarray) -> np.ndarray:
+        """Get the nearest centroid of each embedding."""
+        centroids = self._centroids
+        assert centroids is not None
+        chunk_size = max(1, ASSIGN_CHUNK_SIZE // len(centroids))
+        assignments = [
+            np.argmax(
+                _normalize(embeddings[start : start + chunk_size]) @ centroids.T,
+                axis=1,
+            )
+            for start in range(0, len(embeddings), chunk_size)
+        ]
+        return np.concatenate(assignments) if assignments else np.zeros(0, int)
+
+    def _reset_lists(self) -> None:
+        """Empty all inverted lists."""
+        self._lists = [np.zeros(0, dtype=np.int64) for _ in range(self.nlist)]
+        self._list_sizes = np.zeros(self.nlist, dtype=np.int64)
+        self._row_lists = np.zeros(0, dtype=np.int64)
+        self._row_positions = np.zeros(0, dtype=np.int64)
+
+    def _reserve_rows(self, capacity: int) -> None:
+        """Grow the row arrays to hold at least `capacity` rows."""
+        old_capacity = len(self._row_lists)
+        if capacity <= old_capacity:
+            return
+        new_capacity = max(capacity, 2 * old_capacity)
+        row_lists = np.full(new_capacity, -1, dtype=np.int64)
+        row_lists[:old_capacity] = self._row_lists
+        row_positions = np.full(new_capacity, -1, dtype=np.int64)
+        row_positions[:old_capacity] = self._row_positions
+        self._row_lists = row_lists
+        self._row_positions = row_positions
+
+    def _append(self, list_no: int, row: int) -> None:
+        """Append a row to an inverted list."""
+        size = int(self._list_sizes[list_no])
+        rows = self._lists[list_no]
+        if size == len(rows):
+            rows = np.resize(rows, max(4, 2 * len(rows)))
+            self._lists[list_no] = rows
+        rows[size] = row
+        self._list_sizes[list_no] = size + 1
+        self._row_lists[row] = list_no
+        self._row_positions[row] = size
+
+    def _remove(self, row: int) -> None:
+        """Remove a row from its inverted list, moving the last row of the list."""
+        if row >= len(self._row_lists) or self._row_lists[row] < 0:
+            return
+        list_no = int(self._row_lists[row])
+        position = int(self._row_positions[row])
+        last_position = int(self._list_sizes[list_no]) - 1
+        rows = self._lists[list_no]
+        moved_row = int(rows[last_position])
+        rows[position] = moved_row
+        self._row_positions[moved_row] = position
+        self._list_sizes[list_no] = last_position
+        self._row_lists[row] = -1
+        self._row_positions[row] = -1
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """Train centroids with spherical k-means on (a sample of) embeddings.
+
+        NOTE: this resets the inverted lists, all embeddings need to be
+        added again after training.
+
+        """
+        if len(embeddings) < self.nlist:
+            raise ValueError(
+                f"Need at least nlist={self.nlist} embeddings to train, "
+                f"got {len(embeddings)}."
+            )
+        rng = np.random.default_rng(self.seed)
+        num_samples = min(len(embeddings), MAX_TRAIN_SIZE_PER_LIST * self.nlist)
+        sample_idxs = np.sort(rng.choice(len(embeddings), num_samples, replace=False))
+        data = _normalize(np.asarray(embeddings[sample_idxs], dtype=np.float32))
+
+        self._centroids = data[rng.choice(num_samples, self.nlist, replace=False)]
+        for _ in range(self.num_iterations):
+            assignments = self._assign(data)
+            sums = np.zeros_like(self._centroids)
+            np.add.at(sums, assignments, data)
+            counts = np.bincount(assignments, minlength=self.nlist)
+            # re-seed empty clusters with random embeddings
+            empty = np.flatnonzero(counts == 0)
+            sums[empty] = data[rng.choice(num_samples, len(empty), replace=False)]
+            self._centroids = _normalize(sums)
+
+        self._reset_lists()
+        logger.debug(f"> Trained IVF index with {self.nlist} lists.")
+
+    def add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        """Add (or reassign) rows to the inverted lists nearest their embeddings."""
+        if not self.is_trained:
+            raise ValueError("IVF index must be trained before adding embeddings.")
+        if len(rows) == 0:
+            return
+        self._reserve_rows(int(np.max(rows)) + 1)
+        for row, list_no in zip(rows.tolist(), self._assign(embeddings).tolist()):
+            self._remove(row)
+            self._append(list_no, row)
+
+    def swap_delete(self, row: int, last_row: int) -> None:
+        """Delete a row, and move the last row into its slot.
+
+        Mirrors a deletion from an embedding matrix that moves its last row
+        into the freed one (see EmbeddingMatrix.delete).
+
+        """
+        self._remove(row)
+        if row == last_row or last_row >= len(self._row_lists):
+            return
+        list_no = int(self._row_lists[last_row])
+        if list_no < 0:
+            return
+        position = int(self._row_positions[last_row])
+        self._lists[list_no][position] = row
+        self._row_lists[row] = list_no
+        self._row_positions[row] = position
+        self._row_lists[last_row] = -1
+        self._row_positions[last_row] = -1
+
+    def get_candidate_rows(
+        self, query_embeddings: np.ndarray, nprobe: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """Get the sorted rows in the `nprobe` lists closest to each query."""
+        if self._centroids is None:
+            raise ValueError("IVF index is not trained.")
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        scores = (
+            _normalize(np.asarray(query_embeddings, np.float32)) @ self._centroids.T
+        )
+        probes = np.argpartition(-scores, nprobe - 1, axis=1)[:, :nprobe]
+        return [
+            np.sort(
+                np.concatenate(
+                    [
+                        self._lists[list_no][: self._list_sizes[list_no]]
+                        for list_no in row
+                    ]
+                )
+            )
+            for row in probes.tolist()
+        ]
+
+    def persist(self, persist_path: str) -> None:
+        """Persist the index as a `.npz` file."""
+        centroids = self._centroids
+        indexed_rows = np.flatnonzero(self._row_lists >= 0)
+        num_rows = int(indexed_rows[-1]) + 1 if len(indexed_rows) > 0 else 0
+        np.savez(
+            persist_path,
+            config=np.array(
+                [self.nlist, self.nprobe, self.num_iterations, self.min_train_size]
+                + [self.seed]
+            ),
+            centroids=centroids if centroids is not None else np.zeros((0, 0)),
+            row_lists=self._row_lists[:num_rows],
+        )
+
+    @classmethod
+    def from_persist_path(cls, persist_path: str) -> "IVFIndex":
+        """Load an IVFIndex persisted with `persist`."""
+        if not os.path.exists(persist_path):
+            raise ValueError(f"No existing {__name__} found at {persist_path}.")
+
+        with np.load(persist_path, allow_pickle=False) as data:
+            nlist, nprobe, num_iterations, min_train_size, seed = data["config"]
+            index = cls(
+                nlist=int(nlist),
+                nprobe=int(nprobe),
+                num_iterations=int(num_iterations),
+                min_train_size=int(min_train_size),
+                seed=int(seed),
+            )
+            if data["centroids"].size > 0:
+                index._centroids = data["centroids"]
+                index._reset_lists()
+                row_lists = data["row_lists"]
+                index._reserve_rows(len(row_lists))
+                for row, list_no in enumerate(row_lists.tolist()):
+                    if list_no >= 0:
+                        index._append(list_no, row)
+        return index
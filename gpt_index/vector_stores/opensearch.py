@@ -62,6 +62,7 @@ class OpensearchVectorClient:
 
         if auth is None:
             self._client = httpx.Client(base_url=endpoint)
+            self._aclient = httpx.AsyncClient(base_url=endpoint)
         else:
             if "verify" not in auth:
                 # "Open search" docker image for Dev/Test requires SSL verification
@@ -74,6 +75,9 @@ class OpensearchVectorClient:
             self._client = httpx.Client(
                 base_url=endpoint, verify=auth["verify"], auth=auth["basic_auth"]
             )
+            self._aclient = httpx.AsyncClient(
+                base_url=endpoint, verify=auth["verify"], auth=auth["basic_auth"]
+            )
 
         self._endpoint = endpoint
         self._dim = dim
@@ -96,8 +100,8 @@ class OpensearchVectorClient:
         # will 400 if the index already existed, so allow 400 errors right here
         assert res.status_code == 200 or res.status_code == 400
 
-    def index_results(self, results: List[NodeEmbeddingResult]) -> List[str]:
-        """Store results in the index."""
+    def _build_bulk_request(self, results: List[NodeEmbeddingResult]) -> str:
+        """Build the ndjson body of a bulk index request."""
         bulk_req: List[Dict[Any, Any]] = []
         for result in results:
             bulk_req.append({"index": {"_index": self._index, "_id": result.id}})
@@ -107,9 +111,25 @@ class OpensearchVectorClient:
                     self._embedding_field: result.embedding,
                 }
             )
-        bulk = "\n".join([json.dumps(v) for v in bulk_req]) + "\n"
+        return "\n".join([json.dumps(v) for v in bulk_req]) + "\n"
+
+    def index_results(self, results: List[NodeEmbeddingResult]) -> List[str]:
+        """Store results in the index."""
         res = self._client.post(
-            "/_bulk", headers={"Content-Type": "application/x-ndjson"}, content=bulk
+            "/_bulk",
+            headers={"Content-Type": "application/x-ndjson"},
+            content=self._build_bulk_request(results),
+        )
+        assert res.status_code == 200
+        assert not res.json()["errors"], "expected no errors while indexing docs"
+        return [r.id for r in results]
+
+    async def aindex_results(self, results: List[NodeEmbeddingResult]) -> List[str]:
+        """Asynchronously store results in the index."""
+        res = await self._aclient.post(
+            "/_bulk",
+            headers={"Content-Type": "application/x-ndjson"},
+            content=self._build_bulk_request(results),
         )
         assert res.status_code == 200
         assert not res.json()["errors"], "expected no errors while indexing docs"
@@ -123,23 +143,21 @@ class OpensearchVectorClient:
         """
         self._client.delete(f"{self._index}/_doc/{doc_id}")
 
-    def do_approx_knn(
-        self, query_embedding: List[float], k: int
-    ) -> VectorStoreQueryResult:
-        """Do approximate knn."""
-        res = self._client.post(
-            f"{self._index}/_search",
-            json={
-                "size": k,
-                "query": {
-                    "knn": {self._embedding_field: {"vector": query_embedding, "k": k}}
-                },
+    def _build_knn_query(self, query_embedding: List[float], k: int) -> dict:
+        """Build an approximate knn search request."""
+        return {
+            "size": k,
+            "query": {
+                "knn": {self._embedding_field: {"vector": query_embedding, "k": k}}
             },
-        )
+        }
+
+    def _parse_knn_response(self, res_json: dict) -> VectorStoreQueryResult:
+        """Convert search hits to a query result."""
         nodes = []
         ids = []
         scores = []
-        for hit in res.json()["hits"]["hits"]:
+        for hit in res_json["hits"]["hits"]:
             source = hit["_source"]
             text = source[self._text_field]
             doc_id = hit["_id"]
@@ -149,6 +167,26 @@ class OpensearchVectorClient:
             scores.append(hit["_score"])
         return VectorStoreQueryResult(nodes=nodes, ids=ids, similarities=scores)
 
+    def do_approx_knn(
+        self, query_embedding: List[float], k: int
+    ) -> VectorStoreQueryResult:
+        """Do approximate knn."""
+        res = self._client.post(
+            f"{self._index}/_search",
+            json=self._build_knn_query(query_embedding, k),
+        )
+        return self._parse_knn_response(res.json())
+
+    async def ado_approx_knn(
+        self, query_embedding: List[float], k: int
+    ) -> VectorStoreQueryResult:
+        """Asynchronously do approximate knn."""
+        res = await self._aclient.post(
+            f"{self._index}/_search",
+            json=self._build_knn_query(query_embedding, k),
+        )
+        return self._parse_knn_response(res.json())
+
 
 class OpensearchVectorStore(VectorStore):
     """Elasticsearch/Opensearch vector store.
@@ -191,6 +229,19 @@ class OpensearchVectorStore(VectorStore):
         self._client.index_results(embedding_results)
         return [result.id for result in embedding_results]
 
+    async def aadd(
+        self,
+        embedding_results: List[NodeEmbeddingResult],
+    ) -> List[str]:
+        """Asynchronously add embedding results to index.
+
+        Args
+            embedding_results: List[NodeEmbeddingResult]: list of embedding results
+
+        """
+        await self._client.aindex_results(embedding_results)
+        return [result.id for result in embedding_results]
+
     def delete(self, doc_id: str, **delete_kwargs: Any) -> None:
         """Delete a document.
 
@@ -210,3 +261,16 @@ class OpensearchVectorStore(VectorStore):
         """
         query_embedding = cast(List[float], query.query_embedding)
         return self._client.do_approx_knn(query_embedding, query.similarity_top_k)
+
+    async def aquery(self, query: VectorStoreQuery) -> VectorStoreQueryResult:
+        """Asynchronously query index for top k most similar nodes.
+
+        Args:
+            query_embedding (List[float]): query embedding
+            similarity_top_k (int): top k most similar nodes
+
+        """
+        query_embedding = cast(List[float], query.query_embedding)
+        return await self._client.ado_approx_knn(
+            query_embedding, query.similarity_top_k
+        )
@@ -4,13 +4,16 @@ An index that that is built on top of an existing vector store.
 
 """
 
+import json
 import logging
 import os
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, cast
 
 from gpt_index.data_structs.node_v2 import DocumentRelationship, Node
+from gpt_index.utils import ErrorToRetry, iter_batch, retry_on_exceptions_with_backoff
 from gpt_index.vector_stores.types import (
     NodeEmbeddingResult,
     VectorStore,
@@ -21,6 +24,13 @@ from gpt_index.vector_stores.types import (
 
 _logger = logging.getLogger(__name__)
 
+# NOTE: Pinecone recommends upserting at most 100 vectors per request,
+# and rejects requests larger than 2MB
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_BYTES = 2 * 1024 * 1024 - 64 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_TRIES = 5
+
 
 def get_metadata_from_node_info(
     node_info: Dict[str, Any], field_prefix: str
@@ -99,6 +109,42 @@ def get_default_tokenizer() -> Callable:
     return tokenizer
 
 
+class PartialUpsertError(Exception):
+    """Raised when only part of an upsert batch was applied."""
+
+
+def _is_retryable_status(e: Exception) -> bool:
+    """Check if a failed API request should be retried, given its status.
+
+    Client errors (e.g. a dimension mismatch) are not retried, except for
+    rate limiting. Server errors are.
+
+    """
+    status = getattr(e, "status", None)
+    if not isinstance(status, int):
+        return False
+    return status == 429 or status >= 500
+
+
+def _get_upsert_errors_to_retry() -> List[ErrorToRetry]:
+    """Get the errors of failed upserts that are retried.
+
+    Only Pinecone API errors (see `_is_retryable_status`), connection errors
+    and partially applied upserts are retried; any other error is raised on
+    the first failure.
+
+    """
+    import pinecone
+    from urllib3.exceptions import HTTPError
+
+    return [
+        ErrorToRetry(pinecone.ApiException, _is_retryable_status),
+        ErrorToRetry(pinecone.PineconeProtocolError),
+        ErrorToRetry(HTTPError),
+        ErrorToRetry(PartialUpsertError),
+    ]
+
+
 class PineconeVectorStore(VectorStore):
     """Pinecone Vector Store.
 
@@ -118,6 +164,11 @@ class PineconeVectorStore(VectorStore):
         delete_kwargs (Optional[Dict]): delete kwargs during `delete` call.
         add_sparse_vector (bool): whether to add sparse vector to index.
         tokenizer (Optional[Callable]): tokenizer to use to generate sparse
+        batch_size (int): max number of vectors per upsert request.
+        max_batch_bytes (int): max (estimated) payload size of an upsert request.
+        max_concurrency (int): max number of upsert requests in flight.
+        max_tries (int): max number of tries per upsert request. Failed
+            requests are retried with backoff; upserts are idempotent.
 
     """
 
@@ -136,9 +187,17 @@ class PineconeVectorStore(VectorStore):
         delete_kwargs: Optional[Dict] = None,
         add_sparse_vector: bool = False,
         tokenizer: Optional[Callable] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_tries: int = DEFAULT_MAX_TRIES,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be > 0")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         import_err_msg = (
             "`pinecone` package not found, please run `pip install pinecone-client`"
         )
@@ -187,6 +246,92 @@ class PineconeVectorStore(VectorStore):
         if tokenizer is None:
             tokenizer = get_default_tokenizer()
         self._tokenizer = tokenizer
+        self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._max_concurrency = max_concurrency
+        self._max_tries = max_tries
+
+    def _get_entry(self, result: NodeEmbeddingResult) -> Dict[str, Any]:
+        """Get the upsert entry of an embedding result."""
+        node = result.node
+        metadata = {
+            "text": node.get_text(),
+            # NOTE: this is the reference to source doc
+            "doc_id": result.doc_id,
+            "id": result.id,
+        }
+        if node.extra_info:
+            # TODO: check if overlap with default metadata keys
+            metadata.update(get_metadata_from_node_info(node.extra_info, "extra_info"))
+        if node.node_info:
+            # TODO: check if overlap with default metadata keys
+            metadata.update(get_metadata_from_node_info(node.node_info, "node_info"))
+        # if additional metadata keys overlap with the default keys,
+        # then throw an error
+        intersecting_keys = set(metadata.keys()).intersection(
+            self._metadata_filters.keys()
+        )
+        if intersecting_keys:
+            raise ValueError(
+                "metadata_filters keys overlap with default "
+                f"metadata keys: {intersecting_keys}"
+            )
+        metadata.update(self._metadata_filters)
+
+        return {
+            "id": result.id,
+            "values": result.embedding,
+            "metadata": metadata,
+        }
+
+    def _iter_batches(
+        self, embedding_results: List[NodeEmbeddingResult]
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Build upsert batches, sized by number of vectors and payload bytes.
+
+        Sparse vectors are generated with one tokenizer call per batch.
+
+        """
+        for results in iter_batch(embedding_results, self._batch_size):
+            entries = [self._get_entry(result) for result in results]
+            if self._add_sparse_vector:
+                sparse_vectors = generate_sparse_vectors(
+                    [result.node.get_text() for result in results], self._tokenizer
+                )
+                for entry, sparse_vector in zip(entries, sparse_vectors):
+                    entry["sparse_values"] = sparse_vector
+
+            cur_batch: List[Dict[str, Any]] = []
+            cur_batch_bytes = 0
+            for entry in entries:
+                num_bytes = len(json.dumps(entry, default=str))
+                if cur_batch and cur_batch_bytes + num_bytes > self._max_batch_bytes:
+                    yield cur_batch
+                    cur_batch = []
+                    cur_batch_bytes = 0
+                cur_batch.append(entry)
+                cur_batch_bytes += num_bytes
+            if cur_batch:
+                yield cur_batch
+
+    def _upsert_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Upsert a batch, retrying failed or partially applied requests."""
+
+        def _upsert() -> None:
+            response = self._pinecone_index.upsert(
+                batch, namespace=self._namespace, **self._insert_kwargs
+            )
+            upserted_count = getattr(response, "upserted_count", None)
+            if isinstance(upserted_count, int) and upserted_count < len(batch):
+                raise PartialUpsertError(
+                    f"Upserted {upserted_count} of {len(batch)} vectors."
+                )
+
+        retry_on_exceptions_with_backoff(
+            _upsert,
+            _get_upsert_errors_to_retry(),
+            max_tries=self._max_tries,
+        )
 
     def add(
         self,
@@ -194,59 +339,31 @@ class PineconeVectorStore(VectorStore):
     ) -> List[str]:
         """Add embedding results to index.
 
+        Upserts are batched, and up to `max_concurrency` batches are sent at
+        once while the next batches are being built.
+
         Args
             embedding_results: List[NodeEmbeddingResult]: list of embedding results
 
         """
-        ids = []
-        for result in embedding_results:
-            new_id = result.id
-            node = result.node
-            text_embedding = result.embedding
-
-            metadata = {
-                "text": node.get_text(),
-                # NOTE: this is the reference to source doc
-                "doc_id": result.doc_id,
-                "id": new_id,
-            }
-            if node.extra_info:
-                # TODO: check if overlap with default metadata keys
-                metadata.update(
-                    get_metadata_from_node_info(node.extra_info, "extra_info")
-                )
-            if node.node_info:
-                # TODO: check if overlap with default metadata keys
-                metadata.update(
-                    get_metadata_from_node_info(node.node_info, "node_info")
-                )
-            # if additional metadata keys overlap with the default keys,
-            # then throw an error
-            intersecting_keys = set(metadata.keys()).intersection(
-                self._metadata_filters.keys()
-            )
-            if intersecting_keys:
-                raise ValueError(
-                    "metadata_filters keys overlap with default "
-                    f"metadata keys: {intersecting_keys}"
-                )
-            metadata.update(self._metadata_filters)
-
-            entry = {
-                "id": new_id,
-                "values": text_embedding,
-                "metadata": metadata,
-            }
-            if self._add_sparse_vector:
-                sparse_vector = generate_sparse_vectors(
-                    [node.get_text()], self._tokenizer
-                )[0]
-                entry.update({"sparse_values": sparse_vector})
-            self._pinecone_index.upsert(
-                [entry], namespace=self._namespace, **self._pinecone_kwargs
-            )
-            ids.append(new_id)
-        return ids
+        batches = self._iter_batches(embedding_results)
+        if self._max_concurrency == 1:
+            for batch in batches:
+                self._upsert_batch(batch)
+            return [result.id for result in embedding_results]
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            pending: Set[Future] = set()
+            for batch in batches:
+                # NOTE: bound the number of queued batches
+                if len(pending) >= 2 * self._max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(self._upsert_batch, batch))
+            for future in pending:
+                future.result()
+        return [result.id for result in embedding_results]
 
     def delete(self, doc_id: str, **delete_kwargs: Any) -> None:
         """Delete a document.
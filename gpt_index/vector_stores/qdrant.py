@@ -3,6 +3,7 @@
 An index that is built on top of an existing Qdrant collection.
 
 """
+import asyncio
 import logging
 from typing import Any, List, Optional, cast
 
@@ -17,6 +18,8 @@ from gpt_index.vector_stores.types import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 class QdrantVectorStore(VectorStore):
     """Qdrant Vector Store.
@@ -30,14 +33,25 @@ class QdrantVectorStore(VectorStore):
     Args:
         collection_name: (str): name of the Qdrant collection
         client (Optional[Any]): QdrantClient instance from `qdrant-client` package
+        aclient (Optional[Any]): AsyncQdrantClient instance from `qdrant-client`
+            package, used by `aadd` and `aquery`. If not provided, async calls
+            fall back to running the sync client in a worker thread.
+        max_concurrency (int): max number of upsert requests in flight in `aadd`.
     """
 
     stores_text: bool = True
 
     def __init__(
-        self, collection_name: str, client: Optional[Any] = None, **kwargs: Any
+        self,
+        collection_name: str,
+        client: Optional[Any] = None,
+        aclient: Optional[Any] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs: Any,
     ) -> None:
         """Init params."""
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         import_err_msg = (
             "`qdrant-client` package not found, please run `pip install qdrant-client`"
         )
@@ -50,10 +64,32 @@ class QdrantVectorStore(VectorStore):
             raise ValueError("Missing Qdrant client!")
 
         self._client = cast(qdrant_client.QdrantClient, client)
+        self._aclient = aclient
         self._collection_name = collection_name
         self._collection_initialized = self._collection_exists(collection_name)
 
         self._batch_size = kwargs.get("batch_size", 100)
+        self._max_concurrency = max_concurrency
+
+    def _build_points(self, embedding_results: List[NodeEmbeddingResult]) -> Any:
+        """Build a batch of Qdrant points from embedding results."""
+        from qdrant_client.http import models as rest
+
+        new_ids = []
+        vectors = []
+        payloads = []
+        for result in embedding_results:
+            new_ids.append(result.id)
+            vectors.append(result.embedding)
+            node = result.node
+            payloads.append(
+                {
+                    "doc_id": result.doc_id,
+                    "text": node.get_text(),
+                    "extra_info": node.extra_info,
+                }
+            )
+        return rest.Batch.construct(ids=new_ids, vectors=vectors, payloads=payloads)
 
     def add(self, embedding_results: List[NodeEmbeddingResult]) -> List[str]:
         """Add embedding results to index.
@@ -62,8 +98,6 @@ class QdrantVectorStore(VectorStore):
             embedding_results: List[NodeEmbeddingResult]: list of embedding results
 
         """
-        from qdrant_client.http import models as rest
-
         if len(embedding_results) > 0 and not self._collection_initialized:
             self._create_collection(
                 collection_name=self._collection_name,
@@ -72,32 +106,47 @@ class QdrantVectorStore(VectorStore):
 
         ids = []
         for result_batch in iter_batch(embedding_results, self._batch_size):
-            new_ids = []
-            vectors = []
-            payloads = []
-            for result in result_batch:
-                new_ids.append(result.id)
-                vectors.append(result.embedding)
-                node = result.node
-                payloads.append(
-                    {
-                        "doc_id": result.doc_id,
-                        "text": node.get_text(),
-                        "extra_info": node.extra_info,
-                    }
-                )
-
             self._client.upsert(
                 collection_name=self._collection_name,
-                points=rest.Batch.construct(
-                    ids=new_ids,
-                    vectors=vectors,
-                    payloads=payloads,
-                ),
+                points=self._build_points(result_batch),
             )
-            ids.extend(new_ids)
+            ids.extend([result.id for result in result_batch])
         return ids
 
+    async def aadd(self, embedding_results: List[NodeEmbeddingResult]) -> List[str]:
+        """Asynchronously add embedding results to index.
+
+        Args
+            embedding_results: List[NodeEmbeddingResult]: list of embedding results
+
+        """
+        aclient = self._aclient
+        if aclient is None:
+            return await super().aadd(embedding_results)
+
+        if len(embedding_results) > 0 and not self._collection_initialized:
+            await self._acreate_collection(
+                collection_name=self._collection_name,
+                vector_size=len(embedding_results[0].embedding),
+            )
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _aupsert(result_batch: List[NodeEmbeddingResult]) -> None:
+            async with semaphore:
+                await aclient.upsert(
+                    collection_name=self._collection_name,
+                    points=self._build_points(result_batch),
+                )
+
+        await asyncio.gather(
+            *[
+                _aupsert(result_batch)
+                for result_batch in iter_batch(embedding_results, self._batch_size)
+            ]
+        )
+        return [result.id for result in embedding_results]
+
     def delete(self, doc_id: str, **delete_kwargs: Any) -> None:
         """Delete a document.
 
@@ -136,6 +185,20 @@ class QdrantVectorStore(VectorStore):
         )
         self._collection_initialized = True
 
+    async def _acreate_collection(self, collection_name: str, vector_size: int) -> None:
+        """Asynchronously create a Qdrant collection, with the async client."""
+        from qdrant_client.http import models as rest
+
+        assert self._aclient is not None
+        await self._aclient.recreate_collection(
+            collection_name=collection_name,
+            vectors_config=rest.VectorParams(
+                size=vector_size,
+                distance=rest.Distance.COSINE,
+            ),
+        )
+        self._collection_initialized = True
+
     def _collection_exists(self, collection_name: str) -> bool:
         """Check if a collection exists."""
         from grpc import RpcError
@@ -156,7 +219,7 @@ class QdrantVectorStore(VectorStore):
         Args:
             query (VectorStoreQuery): query
         """
-        from qdrant_client.http.models import Payload, Filter
+        from qdrant_client.http.models import Filter
 
         query_embedding = cast(List[float], query.query_embedding)
 
@@ -166,6 +229,35 @@ class QdrantVectorStore(VectorStore):
             limit=cast(int, query.similarity_top_k),
             query_filter=cast(Filter, self._build_query_filter(query)),
         )
+        return self._parse_query_response(response)
+
+    async def aquery(
+        self,
+        query: VectorStoreQuery,
+    ) -> VectorStoreQueryResult:
+        """Asynchronously query index for top k most similar nodes.
+
+        Args:
+            query (VectorStoreQuery): query
+        """
+        if self._aclient is None:
+            return await super().aquery(query)
+
+        from qdrant_client.http.models import Filter
+
+        query_embedding = cast(List[float], query.query_embedding)
+
+        response = await self._aclient.search(
+            collection_name=self._collection_name,
+            query_vector=query_embedding,
+            limit=cast(int, query.similarity_top_k),
+            query_filter=cast(Filter, self._build_query_filter(query)),
+        )
+        return self._parse_query_response(response)
+
+    def _parse_query_response(self, response: List[Any]) -> VectorStoreQueryResult:
+        """Convert Qdrant search results to a query result."""
+        from qdrant_client.http.models import Payload
 
         logger.debug(f"> Top {len(response)} nodes:")
 
@@ -3,14 +3,17 @@
 from dataclasses import dataclass, field
 import json
 import os
-from typing import Any, Dict, List, cast, Optional
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
+import numpy as np
 from dataclasses_json import DataClassJsonMixin
 
 from gpt_index.indices.query.embedding_utils import (
     get_top_k_embeddings,
+    get_top_k_embeddings_batch,
     get_top_k_embeddings_learner,
 )
+from gpt_index.vector_stores.ivf import IVFIndex
 from gpt_index.vector_stores.types import (
     DEFAULT_PERSIST_DIR,
     DEFAULT_PERSIST_FNAME,
@@ -25,6 +28,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# suffixes of the binary persist format, relative to the json persist path
+MATRIX_SUFFIX = ".npy"
+NORMS_SUFFIX = ".norms.npy"
+IDS_SUFFIX = ".ids.json"
+IVF_SUFFIX = ".ivf.npz"
+
 LEARNER_MODES = {
     VectorStoreQueryMode.SVM,
     VectorStoreQueryMode.LINEAR_REGRESSION,
@@ -39,11 +48,215 @@ class SimpleVectorStoreData(DataClassJsonMixin):
     Args:
         embedding_dict (Optional[dict]): dict mapping doc_ids to embeddings.
         text_id_to_doc_id (Optional[dict]): dict mapping text_ids to doc_ids.
+        doc_id_to_text_ids (Optional[dict]): reverse index of text_id_to_doc_id.
+            Rebuilt on load if missing.
 
     """
 
     embedding_dict: Dict[str, List[float]] = field(default_factory=dict)
     text_id_to_doc_id: Dict[str, str] = field(default_factory=dict)
+    doc_id_to_text_ids: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Rebuild the reverse index for data persisted without it."""
+        if not self.doc_id_to_text_ids:
+            for text_id, doc_id in self.text_id_to_doc_id.items():
+                self.doc_id_to_text_ids.setdefault(doc_id, set()).add(text_id)
+
+    def add_text_id(self, text_id: str, doc_id: str) -> None:
+        """Map a text_id to its doc_id."""
+        old_doc_id = self.text_id_to_doc_id.get(text_id)
+        if old_doc_id is not None and old_doc_id != doc_id:
+            self.doc_id_to_text_ids[old_doc_id].discard(text_id)
+        self.text_id_to_doc_id[text_id] = doc_id
+        self.doc_id_to_text_ids.setdefault(doc_id, set()).add(text_id)
+
+    def delete_doc_id(self, doc_id: str) -> Set[str]:
+        """Remove all text_ids of a doc_id, and return them."""
+        text_ids = self.doc_id_to_text_ids.pop(doc_id, set())
+        for text_id in text_ids:
+            del self.text_id_to_doc_id[text_id]
+        return text_ids
+
+
+class EmbeddingMatrix:
+    """Contiguous float32 storage for embeddings.
+
+    Embeddings are kept as rows of a single preallocated matrix that grows
+    geometrically, alongside a parallel list of ids and the precomputed
+    norm of every row. Deleting an id moves the last row into the freed slot,
+    so the first `size` rows are always the live embeddings.
+
+    Args:
+        dim (Optional[int]): embedding dimension. Inferred from the first
+            added embedding if not set.
+
+    """
+
+    def __init__(self, dim: Optional[int] = None) -> None:
+        """Init params."""
+        self._dim = dim
+        self._ids: List[str] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._matrix = np.zeros((0, dim or 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+
+    @property
+    def size(self) -> int:
+        """Get the number of stored embeddings."""
+        return len(self._ids)
+
+    @property
+    def ids(self) -> List[str]:
+        """Get ids, in row order."""
+        return self._ids
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Get a (size x dim) view of the stored embeddings."""
+        return self._matrix[: self.size]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Get the precomputed norms of the stored embeddings."""
+        return self._norms[: self.size]
+
+    def __contains__(self, text_id: str) -> bool:
+        return text_id in self._id_to_row
+
+    @classmethod
+    def from_arrays(
+        cls, ids: List[str], embeddings: np.ndarray, norms: np.ndarray
+    ) -> "EmbeddingMatrix":
+        """Create an EmbeddingMatrix that adopts existing arrays without copying.
+
+        Used to wrap memory-mapped arrays: rows are only read from disk when
+        touched, and the arrays are copied into memory on the first add
+        that needs to grow them.
+
+        """
+        if embeddings.shape[0] != len(ids) or norms.shape[0] != len(ids):
+            raise ValueError("Expected one embedding and norm per id.")
+        matrix = cls(dim=embeddings.shape[1] if len(ids) > 0 else None)
+        matrix._ids = list(ids)
+        matrix._id_to_row = {text_id: row for row, text_id in enumerate(ids)}
+        matrix._matrix = embeddings
+        matrix._norms = norms
+        return matrix
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the underlying buffers to hold at least `capacity` rows."""
+        old_capacity = self._matrix.shape[0]
+        if capacity <= old_capacity:
+            return
+        new_capacity = max(capacity, 2 * old_capacity)
+        matrix = np.zeros((new_capacity, cast(int, self._dim)), dtype=np.float32)
+        matrix[:old_capacity] = self._matrix
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[:old_capacity] = self._norms
+        self._matrix = matrix
+        self._norms = norms
+
+    def add(
+        self, ids: Sequence[str], embeddings: Sequence[Sequence[float]]
+    ) -> np.ndarray:
+        """Add (or overwrite) embeddings, and return their rows."""
+        if len(ids) == 0:
+            return np.zeros(0, dtype=np.int64)
+        embeddings_np = np.asarray(embeddings, dtype=np.float32)
+        if embeddings_np.ndim != 2 or embeddings_np.shape[0] != len(ids):
+            raise ValueError("Expected one embedding per id.")
+        if self._dim is None:
+            self._dim = embeddings_np.shape[1]
+            self._matrix = np.zeros((0, self._dim), dtype=np.float32)
+        elif embeddings_np.shape[1] != self._dim:
+            raise ValueError(
+                f"Embedding dimension {embeddings_np.shape[1]} does not match "
+                f"store dimension {self._dim}."
+            )
+
+        rows = np.empty(len(ids), dtype=np.int64)
+        for i, text_id in enumerate(ids):
+            row = self._id_to_row.get(text_id)
+            if row is None:
+                row = len(self._ids)
+                self._id_to_row[text_id] = row
+                self._ids.append(text_id)
+            rows[i] = row
+
+        self._reserve(self.size)
+        self._matrix[rows] = embeddings_np
+        self._norms[rows] = np.linalg.norm(embeddings_np, axis=1)
+        return rows
+
+    def delete(self, ids: Sequence[str]) -> List[Tuple[int, int]]:
+        """Delete embeddings, ignoring ids that are not stored.
+
+        Returns:
+            List[Tuple[int, int]]: the row of each deleted embedding, and the
+                (last) row moved into it, in order.
+
+        """
+        moves: List[Tuple[int, int]] = []
+        for text_id in ids:
+            row = self._id_to_row.pop(text_id, None)
+            if row is None:
+                continue
+            last_row = self.size - 1
+            last_id = self._ids.pop()
+            if row != last_row:
+                self._matrix[row] = self._matrix[last_row]
+                self._norms[row] = self._norms[last_row]
+                self._ids[row] = last_id
+                self._id_to_row[last_id] = row
+            moves.append((row, last_row))
+        return moves
+
+    def get(self, text_id: str) -> List[float]:
+        """Get embedding."""
+        return self._matrix[self._id_to_row[text_id]].tolist()
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """Get a dict mapping ids to embeddings."""
+        embeddings = self.embeddings.tolist()
+        return dict(zip(self._ids, embeddings))
+
+    def get_top_k(
+        self,
+        query_embeddings: List[List[float]],
+        similarity_top_k: Optional[int] = None,
+        candidate_rows: Optional[List[np.ndarray]] = None,
+    ) -> Tuple[List[List[float]], List[List[str]]]:
+        """Get top ids by cosine similarity for a batch of queries.
+
+        Scores every row with a single matrix product against the stored
+        embeddings and their precomputed norms. If `candidate_rows` are given
+        (one array per query), only those rows are scored.
+
+        """
+        if candidate_rows is None:
+            return get_top_k_embeddings_batch(
+                query_embeddings,
+                self.embeddings,
+                similarity_top_k=similarity_top_k,
+                embedding_ids=self._ids,
+                embedding_norms=self.norms,
+            )
+
+        result_similarities: List[List[float]] = []
+        result_ids: List[List[str]] = []
+        for query_embedding, rows in zip(query_embeddings, candidate_rows):
+            # NOTE: only the top rows are mapped back to ids
+            similarities, top_positions = get_top_k_embeddings_batch(
+                [query_embedding],
+                self._matrix[rows],
+                similarity_top_k=similarity_top_k,
+                embedding_norms=self._norms[rows],
+            )
+            result_similarities.extend(similarities)
+            top_rows = rows[np.asarray(top_positions[0], dtype=np.int64)]
+            result_ids.append([self._ids[row] for row in top_rows.tolist()])
+        return result_similarities, result_ids
 
 
 class SimpleVectorStore(VectorStore):
@@ -51,10 +264,30 @@ class SimpleVectorStore(VectorStore):
 
     In this vector store, embeddings are stored within a simple, in-memory dictionary.
 
+    If `use_matrix` is set, embeddings are instead stored in a contiguous
+    float32 matrix (see EmbeddingMatrix), and default-mode queries are answered
+    with one matrix-vector product, which is much faster for large stores.
+    Matrix-backed stores are persisted in a binary format: a raw `.npy`
+    matrix (and norms), plus a json id table. On load, the matrix is
+    memory-mapped, so loading is near-instant and only touched rows are
+    read into memory.
+
+    For large stores, an IVFIndex can be set for approximate nearest neighbor
+    search: default-mode queries then only score the embeddings in the
+    `nprobe` inverted lists closest to the query. The index is trained with
+    k-means when an add brings the store to `min_train_size` embeddings
+    (or explicitly, with `train_ivf_index`); before that, queries are exact.
+
     Args:
         simple_vector_store_data_dict (Optional[dict]): data dict
             containing the embeddings and doc_ids. See SimpleVectorStoreData
             for more details.
+        use_matrix (bool): whether to store embeddings in a contiguous matrix.
+            Defaults to False.
+        embedding_matrix (Optional[EmbeddingMatrix]): existing embedding
+            matrix. Implies `use_matrix`.
+        ivf_index (Optional[IVFIndex]): inverted file index used for approximate
+            search. Implies `use_matrix`.
     """
 
     stores_text: bool = False
@@ -62,25 +295,71 @@ class SimpleVectorStore(VectorStore):
     def __init__(
         self,
         data: Optional[SimpleVectorStoreData] = None,
+        use_matrix: bool = False,
+        embedding_matrix: Optional[EmbeddingMatrix] = None,
+        ivf_index: Optional[IVFIndex] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
         self._data = data or SimpleVectorStoreData()
+        self._matrix: Optional[EmbeddingMatrix] = embedding_matrix
+        self._ivf_index = ivf_index
+        if use_matrix or self._matrix is not None or self._ivf_index is not None:
+            self._matrix = self._matrix or EmbeddingMatrix()
+            embeddings = list(self._data.embedding_dict.values())
+            rows = self._matrix.add(list(self._data.embedding_dict.keys()), embeddings)
+            # NOTE: the matrix is the only copy of the embeddings
+            self._data.embedding_dict = {}
+            self._add_to_ivf_index(rows, embeddings)
 
     @classmethod
     def from_persist_dir(
-        cls, persist_dir: str = DEFAULT_PERSIST_DIR
+        cls, persist_dir: str = DEFAULT_PERSIST_DIR, use_matrix: bool = False
     ) -> "SimpleVectorStore":
         persist_path = os.path.join(persist_dir, DEFAULT_PERSIST_FNAME)
-        return cls.from_persist_path(persist_path)
+        return cls.from_persist_path(persist_path, use_matrix=use_matrix)
 
     @property
     def client(self) -> None:
         """Get client."""
         return None
 
+    @property
+    def ivf_index(self) -> Optional[IVFIndex]:
+        """Get the IVF index used for approximate search, if any."""
+        return self._ivf_index
+
+    def train_ivf_index(self) -> None:
+        """Train (or retrain) the IVF index on all stored embeddings.
+
+        Training happens automatically once there are `min_train_size`
+        embeddings; call this to train earlier, or to retrain after the
+        embeddings have drifted from the trained centroids.
+
+        """
+        if self._ivf_index is None or self._matrix is None:
+            raise ValueError("Vector store has no IVF index to train.")
+        matrix = self._matrix
+        self._ivf_index.train(matrix.embeddings)
+        self._ivf_index.add(np.arange(matrix.size), matrix.embeddings)
+
+    def _add_to_ivf_index(
+        self, rows: np.ndarray, embeddings: Sequence[Sequence[float]]
+    ) -> None:
+        """Add rows to the IVF index, training it once there are enough."""
+        ivf_index = self._ivf_index
+        matrix = self._matrix
+        if ivf_index is None or matrix is None:
+            return
+        if ivf_index.is_trained:
+            ivf_index.add(rows, np.asarray(embeddings))
+        elif matrix.size >= ivf_index.min_train_size:
+            self.train_ivf_index()
+
     def get(self, text_id: str) -> List[float]:
         """Get embedding."""
+        if self._matrix is not None:
+            return self._matrix.get(text_id)
         return self._data.embedding_dict[text_id]
 
     def add(
@@ -88,35 +367,60 @@ class SimpleVectorStore(VectorStore):
         embedding_results: List[NodeEmbeddingResult],
     ) -> List[str]:
         """Add embedding_results to index."""
+        if self._matrix is not None:
+            text_ids = [result.id for result in embedding_results]
+            embeddings = [result.embedding for result in embedding_results]
+            rows = self._matrix.add(text_ids, embeddings)
+            self._add_to_ivf_index(rows, embeddings)
         for result in embedding_results:
             text_id = result.id
-            self._data.embedding_dict[text_id] = result.embedding
-            self._data.text_id_to_doc_id[text_id] = result.doc_id
+            if self._matrix is None:
+                self._data.embedding_dict[text_id] = result.embedding
+            self._data.add_text_id(text_id, result.doc_id)
         return [result.id for result in embedding_results]
 
     def delete(self, doc_id: str, **delete_kwargs: Any) -> None:
         """Delete a document."""
-        text_ids_to_delete = set()
-        for text_id, doc_id_ in self._data.text_id_to_doc_id.items():
-            if doc_id == doc_id_:
-                text_ids_to_delete.add(text_id)
+        self.delete_many([doc_id], **delete_kwargs)
+
+    def delete_many(self, doc_ids: Sequence[str], **delete_kwargs: Any) -> None:
+        """Delete documents.
+
+        Uses the doc_id -> text_ids reverse index, so the cost is proportional
+        to the number of deleted nodes rather than the size of the store.
+
+        """
+        text_ids_to_delete: List[str] = []
+        for doc_id in doc_ids:
+            text_ids_to_delete.extend(self._data.delete_doc_id(doc_id))
 
-        for text_id in text_ids_to_delete:
-            del self._data.embedding_dict[text_id]
-            del self._data.text_id_to_doc_id[text_id]
+        if self._matrix is not None:
+            moves = self._matrix.delete(text_ids_to_delete)
+            if self._ivf_index is not None and self._ivf_index.is_trained:
+                for row, last_row in moves:
+                    self._ivf_index.swap_delete(row, last_row)
+        else:
+            for text_id in text_ids_to_delete:
+                del self._data.embedding_dict[text_id]
 
     def query(
         self,
         query: VectorStoreQuery,
     ) -> VectorStoreQueryResult:
         """Get nodes for response."""
-        # TODO: consolidate with get_query_text_embedding_similarities
-        items = self._data.embedding_dict.items()
-        node_ids = [t[0] for t in items]
-        embeddings = [t[1] for t in items]
-
         query_embedding = cast(List[float], query.query_embedding)
 
+        if self._matrix is not None:
+            if query.mode == VectorStoreQueryMode.DEFAULT:
+                return self.batch_query([query])[0]
+            node_ids = self._matrix.ids
+            embeddings = self._matrix.embeddings.tolist()
+        else:
+            # TODO: consolidate with get_query_text_embedding_similarities
+            items = self._data.embedding_dict.items()
+            node_ids = [t[0] for t in items]
+            embeddings = [t[1] for t in items]
+
         if query.mode in LEARNER_MODES:
             top_similarities, top_ids = get_top_k_embeddings_learner(
                 query_embedding,
@@ -136,18 +440,144 @@ class SimpleVectorStore(VectorStore):
 
         return VectorStoreQueryResult(similarities=top_similarities, ids=top_ids)
 
+    def batch_query(
+        self,
+        queries: List[VectorStoreQuery],
+    ) -> List[VectorStoreQueryResult]:
+        """Get nodes for a batch of queries.
+
+        Default-mode queries sharing the same `similarity_top_k` are scored
+        together in one vectorized pass, which is much faster than calling
+        `query` in a loop (e.g. for offline evaluation).
+
+        """
+        results: List[Optional[VectorStoreQueryResult]] = [None] * len(queries)
+        groups: Dict[int, List[int]] = {}
+        for i, query in enumerate(queries):
+            if query.mode == VectorStoreQueryMode.DEFAULT:
+                groups.setdefault(query.similarity_top_k, []).append(i)
+            else:
+                results[i] = self.query(query)
+
+        for similarity_top_k, idxs in groups.items():
+            query_embeddings = [
+                cast(List[float], queries[i].query_embedding) for i in idxs
+            ]
+            if self._matrix is not None:
+                candidate_rows = None
+                if self._ivf_index is not None and self._ivf_index.is_trained:
+                    candidate_rows = self._ivf_index.get_candidate_rows(
+                        np.asarray(query_embeddings)
+                    )
+                batch_similarities, batch_ids = self._matrix.get_top_k(
+                    query_embeddings,
+                    similarity_top_k=similarity_top_k,
+                    candidate_rows=candidate_rows,
+                )
+            else:
+                batch_similarities, batch_ids = get_top_k_embeddings_batch(
+                    query_embeddings,
+                    list(self._data.embedding_dict.values()),
+                    similarity_top_k=similarity_top_k,
+                    embedding_ids=list(self._data.embedding_dict.keys()),
+                )
+            for i, similarities, ids in zip(idxs, batch_similarities, batch_ids):
+                results[i] = VectorStoreQueryResult(similarities=similarities, ids=ids)
+
+        return cast(List[VectorStoreQueryResult], results)
+
     def persist(self, persist_path: str) -> None:
-        """Persist the SimpleVectorStore to a directory."""
+        """Persist the SimpleVectorStore to a directory.
+
+        Matrix-backed stores are written in the binary format, next to
+        `persist_path`. Files of the other format are removed, so that the
+        loaded store is never stale.
+
+        """
         dirpath = os.path.dirname(persist_path)
         if not os.path.exists(dirpath):
             os.makedirs(dirpath)
 
-        with open(persist_path, "w+") as f:
-            json.dump(self._data.to_dict(), f)
+        binary_paths = _get_binary_paths(persist_path)
+        ivf_path = os.path.splitext(persist_path)[0] + IVF_SUFFIX
+        if self._matrix is not None:
+            self._persist_binary(*binary_paths)
+            stale_paths: Sequence[str] = [persist_path]
+            if self._ivf_index is not None:
+                self._ivf_index.persist(ivf_path)
+            else:
+                stale_paths = [persist_path, ivf_path]
+        else:
+            with open(persist_path, "w+") as f:
+                json.dump(self._data.to_dict(), f)
+            stale_paths = [*binary_paths, ivf_path]
+
+        for path in stale_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _persist_binary(self, matrix_path: str, norms_path: str, ids_path: str) -> None:
+        """Persist embeddings as raw float32 arrays plus an id table."""
+        matrix = cast(EmbeddingMatrix, self._matrix)
+        # NOTE: write to a temporary file and swap it in, since the current
+        # matrix may be memory-mapped from the same path
+        for path, array in [
+            (matrix_path, matrix.embeddings),
+            (norms_path, matrix.norms),
+        ]:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+
+        id_table = {
+            "ids": matrix.ids,
+            "doc_ids": [
+                self._data.text_id_to_doc_id[text_id] for text_id in matrix.ids
+            ],
+        }
+        with open(ids_path, "w+") as f:
+            json.dump(id_table, f)
 
     @classmethod
-    def from_persist_path(cls, persist_path: str) -> "SimpleVectorStore":
-        """Create a SimpleKVStore from a persist directory."""
+    def _from_binary(
+        cls, matrix_path: str, norms_path: str, ids_path: str
+    ) -> "SimpleVectorStore":
+        """Load a matrix-backed store, memory-mapping the embeddings."""
+        with open(ids_path, "r+") as f:
+            id_table = json.load(f)
+        ids = id_table["ids"]
+        # NOTE: copy-on-write, so that updates never modify the persisted files
+        embeddings = np.load(matrix_path, mmap_mode="c")
+        norms = np.load(norms_path, mmap_mode="c")
+        data = SimpleVectorStoreData(
+            text_id_to_doc_id=dict(zip(ids, id_table["doc_ids"]))
+        )
+        ivf_path = matrix_path[: -len(MATRIX_SUFFIX)] + IVF_SUFFIX
+        ivf_index = None
+        if os.path.exists(ivf_path):
+            ivf_index = IVFIndex.from_persist_path(ivf_path)
+        return cls(
+            data,
+            embedding_matrix=EmbeddingMatrix.from_arrays(ids, embeddings, norms),
+            ivf_index=ivf_index,
+        )
+
+    @classmethod
+    def from_persist_path(
+        cls, persist_path: str, use_matrix: bool = False
+    ) -> "SimpleVectorStore":
+        """Create a SimpleKVStore from a persist directory.
+
+        If the store was persisted in the binary format, it is detected and
+        loaded as a matrix-backed store.
+
+        """
+        binary_paths = _get_binary_paths(persist_path)
+        if all(os.path.exists(path) for path in binary_paths):
+            logger.debug(f"Loading {__name__} from {binary_paths[0]}.")
+            return cls._from_binary(*binary_paths)
+
         if not os.path.exists(persist_path):
             raise ValueError(
                 f"No existing {__name__} found at {persist_path}, skipping load."
@@ -157,4 +587,10 @@ class SimpleVectorStore(VectorStore):
         with open(persist_path, "r+") as f:
             data_dict = json.load(f)
             data = SimpleVectorStoreData.from_dict(data_dict)
-        return cls(data)
+        return cls(data, use_matrix=use_matrix)
+
+
+def _get_binary_paths(persist_path: str) -> Tuple[str, str, str]:
+    """Get the matrix, norms and id table paths for a json persist path."""
+    stem = os.path.splitext(persist_path)[0]
+    return stem + MATRIX_SUFFIX, stem + NORMS_SUFFIX, stem + IDS_SUFFIX
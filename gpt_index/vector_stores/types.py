@@ -1,7 +1,9 @@
 """Vector store index types."""
 
 
+import asyncio
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, List, Optional, Protocol, runtime_checkable
 
 from enum import Enum
@@ -88,6 +90,19 @@ class VectorStore(Protocol):
         """Add embedding results to vector store."""
         ...
 
+    async def aadd(
+        self,
+        embedding_results: List[NodeEmbeddingResult],
+    ) -> List[str]:
+        """Asynchronously add embedding results to vector store.
+
+        By default, this runs `add` in a worker thread.
+        Meant to be overriden if the client has a true async implementation.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.add, embedding_results))
+
     def delete(self, doc_id: str, **delete_kwargs: Any) -> None:
         """Delete doc."""
         ...
@@ -99,5 +114,18 @@ class VectorStore(Protocol):
         """Query vector store."""
         ...
 
+    async def aquery(
+        self,
+        query: VectorStoreQuery,
+    ) -> VectorStoreQueryResult:
+        """Asynchronously query vector store.
+
+        By default, this runs `query` in a worker thread.
+        Meant to be overriden if the client has a true async implementation.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.query, query))
+
     def persist(self, persist_path: str) -> None:
         return None
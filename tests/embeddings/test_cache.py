@@ -0,0 +1,132 @@
+"""Test embedding caches."""
+import asyncio
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+from gpt_index.embeddings.cache import SimpleEmbeddingCache
+from gpt_index.embeddings.kv_cache import KVEmbeddingCache
+from gpt_index.embeddings.openai import OpenAIEmbedding
+from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from tests.embeddings.test_base import mock_get_text_embeddings
+
+TEXTS = ["Hello world.", "This is a test.", "Hello world.", "This is another test."]
+
+
+def test_simple_embedding_cache() -> None:
+    """Test LRU eviction and hit/miss stats."""
+    cache = SimpleEmbeddingCache(max_size=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    assert cache.get("a") == [1.0]
+    # "b" is the least recently used
+    cache.put("c", [3.0])
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+    assert cache.hits == 3
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.75
+
+    # modifying a returned embedding doesn't modify the cached one
+    embedding = cache.get("a")
+    assert embedding is not None
+    embedding.append(0.0)
+    assert cache.get("a") == [1.0]
+
+
+def test_kv_embedding_cache_persist(tmp_path: Path) -> None:
+    """Test persisting a key-value store backed cache."""
+    cache = KVEmbeddingCache()
+    cache.put_many(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+    persist_path = str(tmp_path / "embed_cache.json")
+    cache.persist(persist_path)
+
+    loaded_cache = KVEmbeddingCache.from_persist_path(persist_path)
+    assert loaded_cache.get_many(["a", "b", "c"]) == [[1.0, 0.0], [0.0, 1.0], None]
+
+
+def test_kv_embedding_cache_bulk() -> None:
+    """Test bulk lookups and writes use bulk kvstore calls."""
+    kvstore = SimpleKVStore()
+    cache = KVEmbeddingCache(kvstore)
+    with patch.object(kvstore, "put_many", wraps=kvstore.put_many) as mock_put:
+        cache.put_many(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        assert mock_put.call_count == 1
+    with patch.object(kvstore, "get_many", wraps=kvstore.get_many) as mock_get:
+        embeddings = cache.get_many(["a", "c", "b"])
+        assert mock_get.call_count == 1
+    assert embeddings == [[1.0, 0.0], None, [0.0, 1.0]]
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+    # modifying a returned embedding doesn't modify the cached one
+    embeddings[0].append(0.0)  # type: ignore
+    assert cache.get("a") == [1.0, 0.0]
+
+
+@patch.object(
+    OpenAIEmbedding, "_get_text_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_queued_embeddings_cache(_mock_get_text_embeddings: Any) -> None:
+    """Test that cached texts are not embedded again."""
+    embed_model = OpenAIEmbedding(embed_batch_size=2)
+    embed_model.embed_cache = SimpleEmbeddingCache()
+    for i, text in enumerate(TEXTS):
+        embed_model.queue_text_for_embedding(str(i), text)
+    result_ids, result_embeddings = embed_model.get_queued_text_embeddings()
+    assert result_ids == ["0", "1", "2", "3"]
+    assert result_embeddings == mock_get_text_embeddings(TEXTS)
+    tokens_used = embed_model.total_tokens_used
+
+    _mock_get_text_embeddings.reset_mock()
+    embed_model.queue_text_for_embedding("4", "This is a test v2.")
+    for i, text in enumerate(TEXTS):
+        embed_model.queue_text_for_embedding(str(i), text)
+    result_ids, result_embeddings = embed_model.get_queued_text_embeddings()
+    assert result_ids == ["4", "0", "1", "2", "3"]
+    assert result_embeddings == mock_get_text_embeddings(["This is a test v2."] + TEXTS)
+    # only the new text is embedded (and counted)
+    _mock_get_text_embeddings.assert_called_once_with(["This is a test v2."])
+    assert embed_model.total_tokens_used - tokens_used == len(
+        embed_model._tokenizer("This is a test v2.")
+    )
+
+
+def test_async_queued_embeddings_cache() -> None:
+    """Test that cached texts are not embedded again in the async path."""
+    embed_model = OpenAIEmbedding()
+    embed_model.embed_cache = SimpleEmbeddingCache()
+    text_queue = [(str(i), text) for i, text in enumerate(TEXTS)]
+
+    async def mock_aget_text_embeddings(texts: List[str]) -> List[List[float]]:
+        return mock_get_text_embeddings(texts)
+
+    with patch.object(
+        embed_model, "_aget_text_embeddings", side_effect=mock_aget_text_embeddings
+    ) as mock_aget:
+        result_ids, result_embeddings = asyncio.run(
+            embed_model.aget_queued_text_embeddings(text_queue)
+        )
+        assert result_ids == ["0", "1", "2", "3"]
+        assert result_embeddings == mock_get_text_embeddings(TEXTS)
+        assert mock_aget.call_count == 1
+
+        result_ids, result_embeddings = asyncio.run(
+            embed_model.aget_queued_text_embeddings(text_queue)
+        )
+        assert result_embeddings == mock_get_text_embeddings(TEXTS)
+        assert mock_aget.call_count == 1
+
+
+@patch.object(OpenAIEmbedding, "_get_query_embedding", return_value=[1.0, 0.0])
+def test_query_embedding_cache(_mock_get_query_embedding: Any) -> None:
+    """Test query embedding cache is separate from the text embedding cache."""
+    embed_cache = SimpleEmbeddingCache()
+    embed_model = OpenAIEmbedding(embed_cache=embed_cache)
+    assert embed_model.get_query_embedding("Hello world.") == [1.0, 0.0]
+    assert embed_model.get_query_embedding("Hello world.") == [1.0, 0.0]
+    assert _mock_get_query_embedding.call_count == 1
+    assert embed_cache.hits == 1
+
+    other_model = OpenAIEmbedding(model="text-embedding-ada-002", mode="similarity")
+    assert other_model.model_id != embed_model.model_id
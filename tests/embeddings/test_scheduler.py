@@ -0,0 +1,176 @@
+"""Test embedding scheduler."""
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+import tenacity
+
+from gpt_index.embeddings.scheduler import DEFAULT_MAX_BATCH_TOKENS, EmbeddingScheduler
+from gpt_index.utils import ErrorToRetry
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+
+def _mock_embed_fn(texts: List[str]) -> List[List[float]]:
+    return [[float(len(text))] for text in texts]
+
+
+def test_get_batches() -> None:
+    """Test batching by number of texts and number of tokens."""
+    scheduler = EmbeddingScheduler(max_batch_tokens=10)
+    assert scheduler.get_batches([3, 3, 3, 3, 20, 1], 3) == [
+        [0, 1, 2],
+        [3],
+        [4],
+        [5],
+    ]
+    scheduler = EmbeddingScheduler(max_batch_size=2)
+    assert scheduler.get_batches([3, 3, 3], 10) == [[0, 1], [2]]
+    assert scheduler.get_batches([], 10) == []
+
+
+def test_embed_concurrency() -> None:
+    """Test concurrent embedding is capped and preserves order."""
+    lock = threading.Lock()
+    num_in_flight = 0
+    max_in_flight = 0
+
+    def embed_fn(texts: List[str]) -> List[List[float]]:
+        nonlocal num_in_flight, max_in_flight
+        with lock:
+            num_in_flight += 1
+            max_in_flight = max(max_in_flight, num_in_flight)
+        time.sleep(0.01)
+        with lock:
+            num_in_flight -= 1
+        return _mock_embed_fn(texts)
+
+    texts = ["a" * i for i in range(1, 21)]
+    scheduler = EmbeddingScheduler(max_concurrency=3)
+    embeddings = scheduler.embed(embed_fn, texts, [1] * len(texts), 2)
+    assert embeddings == _mock_embed_fn(texts)
+    assert max_in_flight == 3
+
+
+def test_aembed_concurrency() -> None:
+    """Test async embedding is capped and preserves order."""
+    num_in_flight = 0
+    max_in_flight = 0
+
+    async def aembed_fn(texts: List[str]) -> List[List[float]]:
+        nonlocal num_in_flight, max_in_flight
+        num_in_flight += 1
+        max_in_flight = max(max_in_flight, num_in_flight)
+        await asyncio.sleep(0.01)
+        num_in_flight -= 1
+        return _mock_embed_fn(texts)
+
+    texts = ["a" * i for i in range(1, 21)]
+    scheduler = EmbeddingScheduler(max_concurrency=2)
+    embeddings = asyncio.run(scheduler.aembed(aembed_fn, texts, [1] * 20, 3))
+    assert embeddings == _mock_embed_fn(texts)
+    assert max_in_flight == 2
+
+
+def test_embed_retry() -> None:
+    """Test throttled requests are retried."""
+    num_calls = 0
+
+    def flaky_embed_fn(texts: List[str]) -> List[List[float]]:
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 1:
+            raise ValueError("throttled")
+        return _mock_embed_fn(texts)
+
+    scheduler = EmbeddingScheduler(errors_to_retry=[ErrorToRetry(ValueError)])
+    assert scheduler.embed(flaky_embed_fn, ["a", "bb"], [1, 1], 10) == [[1.0], [2.0]]
+    assert num_calls == 2
+
+    scheduler = EmbeddingScheduler(
+        errors_to_retry=[ErrorToRetry(ValueError)], max_tries=1
+    )
+    num_calls = 0
+    with pytest.raises(ValueError):
+        scheduler.embed(flaky_embed_fn, ["a"], [1], 10)
+
+
+def test_embed_model_scheduler() -> None:
+    """Test embedding models use their scheduler for queued texts."""
+    scheduler = EmbeddingScheduler(max_concurrency=2, max_tokens_per_minute=10**6)
+    embed_model = MockEmbedding(embed_batch_size=1, embed_scheduler=scheduler)
+    texts = ["Hello world.", "This is a test.", "This is another test."]
+    for i, text in enumerate(texts):
+        embed_model.queue_text_for_embedding(str(i), text)
+    result_ids, result_embeddings = embed_model.get_queued_text_embeddings()
+    assert result_ids == ["0", "1", "2"]
+    assert result_embeddings == [embed_model.get_text_embedding(t) for t in texts]
+
+    text_queue = [(str(i), text) for i, text in enumerate(texts)]
+    _, async_embeddings = asyncio.run(
+        embed_model.aget_queued_text_embeddings(text_queue)
+    )
+    assert async_embeddings == result_embeddings
+
+
+def test_embed_retry_reserves_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test each try of a request reserves rate limit budget."""
+    num_calls = 0
+
+    def flaky_embed_fn(texts: List[str]) -> List[List[float]]:
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 1:
+            raise ValueError("throttled")
+        return _mock_embed_fn(texts)
+
+    scheduler = EmbeddingScheduler(
+        errors_to_retry=[ErrorToRetry(ValueError)],
+        max_requests_per_minute=100,
+        max_tokens_per_minute=1000,
+    )
+    reserved: List[int] = []
+
+    def mock_get_wait_secs(num_tokens: int) -> float:
+        reserved.append(num_tokens)
+        return 0.0
+
+    monkeypatch.setattr(scheduler, "_get_wait_secs", mock_get_wait_secs)
+    assert scheduler.embed(flaky_embed_fn, ["a", "bb"], [1, 2], 10) == [[1.0], [2.0]]
+    assert reserved == [3, 3]
+
+
+def test_embed_retry_tenacity() -> None:
+    """Test errors of embedding functions retrying with tenacity are retried."""
+    num_calls = 0
+
+    @tenacity.retry(stop=tenacity.stop_after_attempt(1))
+    def flaky_embed_fn(texts: List[str]) -> List[List[float]]:
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls == 1:
+            raise ValueError("throttled")
+        return _mock_embed_fn(texts)
+
+    @tenacity.retry(stop=tenacity.stop_after_attempt(1))
+    async def aflaky_embed_fn(texts: List[str]) -> List[List[float]]:
+        return flaky_embed_fn.__wrapped__(texts)  # type: ignore
+
+    scheduler = EmbeddingScheduler(errors_to_retry=[ErrorToRetry(ValueError)])
+    assert scheduler.embed(flaky_embed_fn, ["a"], [1], 10) == [[1.0]]
+    assert num_calls == 2
+
+    num_calls = 0
+    assert asyncio.run(scheduler.aembed(aflaky_embed_fn, ["a"], [1], 10)) == [[1.0]]
+    assert num_calls == 2
+
+
+def test_default_max_batch_tokens() -> None:
+    """Test batches are split by number of tokens by default."""
+    scheduler = EmbeddingScheduler()
+    assert scheduler.max_batch_tokens == DEFAULT_MAX_BATCH_TOKENS
+    assert scheduler.get_batches([DEFAULT_MAX_BATCH_TOKENS // 2] * 4, 10) == [
+        [0, 1],
+        [2, 3],
+    ]
@@ -191,3 +191,75 @@ def test_build_kg(
         "Jane",
         "Bob",
     }
+
+
+def test_build_kg_multi_chunk_prompt(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test build knowledge graph, packing several chunks per prompt."""
+    index = GPTKnowledgeGraphIndex.from_documents(
+        documents, service_context=mock_service_context, num_chunks_per_prompt=2
+    )
+    nodes = index.docstore.get_nodes(list(index.index_struct.node_ids))
+    assert [len(batch) for batch in index._get_node_batches(nodes)] == [2, 1]
+
+    # NOTE: the mock LLM echoes the numbered chunks, i.e. the triplets
+    assert index.index_struct.table.keys() == {
+        "foo",
+        "bar",
+        "hello",
+        "world",
+        "Jane",
+        "Bob",
+    }
+    # each triplet is mapped back to the chunk it was extracted from
+    for keyword, text in [
+        ("foo", "(foo, is, bar)"),
+        ("Bob", "(Jane, is mother of, Bob)"),
+    ]:
+        (node_id,) = index.index_struct.table[keyword]
+        assert index.docstore.get_node(node_id).get_text() == text
+
+
+def test_build_kg_async(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test build knowledge graph with async calls and embeddings."""
+    mock_service_context.embed_model = MockEmbedding()
+    index = GPTKnowledgeGraphIndex.from_documents(
+        documents,
+        include_embeddings=True,
+        service_context=mock_service_context,
+        use_async=True,
+        max_concurrency=2,
+        num_chunks_per_prompt=2,
+    )
+    assert index.index_struct.rel_map == {
+        "foo": [("bar", "is")],
+        "hello": [("world", "is not")],
+        "Jane": [("Bob", "is mother of")],
+    }
+    rel_text_embeddings = index.index_struct.embedding_dict
+    assert len(rel_text_embeddings) == 3
+    for rel_text, embedding in rel_text_embeddings.items():
+        assert embedding == MockEmbedding().get_text_embedding(rel_text)
+
+
+def test_parse_numbered_triplet_response() -> None:
+    """Test demultiplexing triplets extracted from several chunks."""
+    response = (
+        "[1] (foo, is, bar)\n"
+        "[3] (Jane, is mother of, Bob)\n"
+        "(hello, is not, world)\n"
+        "[4] (out of, range, text)\n"
+        "[1] (invalid triplet)\n"
+        " [1]  (hello, is not, world) \n"
+    )
+    triplets = GPTKnowledgeGraphIndex._parse_numbered_triplet_response(response, 3)
+    assert triplets == [
+        [("foo", "is", "bar"), ("hello", "is not", "world")],
+        [],
+        [("Jane", "is mother of", "Bob")],
+    ]
@@ -1,5 +1,9 @@
 from typing import Any, List
 from unittest.mock import patch
+
+import pytest
+from gpt_index.data_structs.data_structs_v2 import KG
+from gpt_index.data_structs.node_v2 import Node
 from gpt_index.indices.knowledge_graph.base import GPTKnowledgeGraphIndex
 from gpt_index.indices.knowledge_graph.retrievers import KGTableRetriever
 from gpt_index.indices.query.schema import QueryBundle
@@ -109,3 +113,63 @@ def test_retrieve_similarity(
     # uses hyrbid query by default
     nodes = retriever.retrieve(QueryBundle("foo"))
     assert len(nodes) == 2
+
+
+def test_kg_traversal(mock_service_context: ServiceContext) -> None:
+    """Test multi-hop traversal of the knowledge graph."""
+    index = GPTKnowledgeGraphIndex([], service_context=mock_service_context)
+    triplets = [
+        ("foo", "is", "bar"),
+        ("foo", "is not", "baz"),
+        ("bar", "is", "qux"),
+        ("qux", "is", "foo"),
+    ]
+    for triplet in triplets:
+        index.upsert_triplet_and_node(triplet, Node(str(triplet)))
+    index_struct = index.index_struct
+
+    assert index_struct.get_triplets("foo") == triplets[:2]
+    # cycles are only traversed once
+    assert index_struct.get_triplets("foo", depth=5) == triplets
+    assert index_struct.get_triplets("foo", depth=5, max_fan_out=1) == [
+        ("foo", "is", "bar"),
+        ("bar", "is", "qux"),
+        ("qux", "is", "foo"),
+    ]
+    assert len(set(index_struct.get_node_ids("bar"))) == 3
+    assert len(set(index_struct.get_node_ids("bar", depth=2))) == 4
+
+    retriever = KGTableRetriever(
+        index,
+        query_keyword_extract_template=MOCK_QUERY_KEYWORD_EXTRACT_PROMPT,
+        include_text=False,
+        graph_traversal_depth=2,
+        max_fan_out=1,
+    )
+    nodes = retriever.retrieve(QueryBundle("foo"))
+    assert nodes[0].node.get_text().split("\n")[1:] == [
+        "('foo', 'is', 'bar')",
+        "('bar', 'is', 'qux')",
+    ]
+
+
+def test_kg_embedding_matrix() -> None:
+    """Test that the triplet embedding matrix is updated incrementally."""
+    index_struct = KG()
+    index_struct.add_to_embedding_dict("('foo', 'is', 'bar')", [1, 0, 0])
+    index_struct.add_to_embedding_dict("('Jane', 'is', 'Bob')", [0, 1, 0])
+    embedding_matrix = index_struct.embedding_matrix
+    assert embedding_matrix.size == 2
+
+    index_struct.add_to_embedding_dict("('hello', 'is', 'world')", [0, 0.8, 0.6])
+    assert index_struct.embedding_matrix is embedding_matrix
+    similarities, rel_texts = index_struct.get_top_k_rel_texts([0, 0.6, 0.8], 2)
+    assert rel_texts == ["('hello', 'is', 'world')", "('Jane', 'is', 'Bob')"]
+    assert similarities == pytest.approx([0.96, 0.6])
+
+    # the matrix isn't serialized, and is rebuilt after loading
+    loaded_struct = KG.from_dict(index_struct.to_dict())
+    assert "_embedding_matrix" not in index_struct.to_dict()
+    assert loaded_struct.get_top_k_rel_texts([0, 0.6, 0.8], 1)[1] == [
+        "('hello', 'is', 'world')"
+    ]
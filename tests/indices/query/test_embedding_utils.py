@@ -0,0 +1,79 @@
+"""Test embedding utils."""
+from functools import partial
+
+import numpy as np
+
+from gpt_index.embeddings.base import SimilarityMode, similarity
+from gpt_index.indices.query.embedding_utils import (
+    get_top_k_embeddings,
+    get_top_k_embeddings_batch,
+)
+
+
+def test_get_top_k_embeddings_batch() -> None:
+    """Test batched top k matches the per-query implementation."""
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(50, 8)).tolist()
+    query_embeddings = rng.normal(size=(5, 8)).tolist()
+    embedding_ids = [f"id_{i}" for i in range(50)]
+
+    batch_similarities, batch_ids = get_top_k_embeddings_batch(
+        query_embeddings,
+        embeddings,
+        similarity_top_k=3,
+        embedding_ids=embedding_ids,
+    )
+    for query, similarities, ids in zip(
+        query_embeddings, batch_similarities, batch_ids
+    ):
+        expected_similarities, expected_ids = get_top_k_embeddings(
+            query,
+            embeddings,
+            similarity_fn=similarity,
+            similarity_top_k=3,
+            embedding_ids=embedding_ids,
+        )
+        assert ids == expected_ids
+        assert np.allclose(similarities, expected_similarities)
+
+    # dot product
+    batch_similarities, batch_ids = get_top_k_embeddings_batch(
+        query_embeddings,
+        embeddings,
+        similarity_top_k=3,
+        mode=SimilarityMode.DOT_PRODUCT,
+    )
+    _, expected_idxs = get_top_k_embeddings(
+        query_embeddings[0],
+        embeddings,
+        similarity_fn=partial(similarity, mode=SimilarityMode.DOT_PRODUCT),
+        similarity_top_k=3,
+    )
+    assert batch_ids[0] == expected_idxs
+
+    # euclidean returns the closest embeddings first
+    batch_distances, batch_ids = get_top_k_embeddings_batch(
+        [embeddings[7]],
+        embeddings,
+        similarity_top_k=2,
+        mode=SimilarityMode.EUCLIDEAN,
+    )
+    assert batch_ids[0][0] == 7
+    assert np.isclose(batch_distances[0][0], 0.0, atol=1e-6)
+    assert batch_distances[0][1] > 0
+
+
+def test_get_top_k_embeddings_ties_and_cutoff() -> None:
+    """Test ties keep their original order and cutoff is applied."""
+    embeddings = [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 0.0]]
+    embeddings.append([1.0, 1.0, 0.0])
+    similarities, ids = get_top_k_embeddings(
+        [0.0, 1.0, 0.0], embeddings, similarity_top_k=2
+    )
+    assert ids == [0, 2]
+    assert similarities == [1.0, 1.0]
+
+    similarities, ids = get_top_k_embeddings(
+        [0.0, 1.0, 0.0], embeddings, similarity_cutoff=0.5
+    )
+    assert ids == [0, 2, 3, 4]
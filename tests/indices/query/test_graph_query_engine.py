@@ -0,0 +1,196 @@
+"""Test composable graph query engine."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from gpt_index.data_structs.node_v2 import IndexNode, Node, NodeWithScore
+from gpt_index.indices.composability.graph import ComposableGraph
+from gpt_index.indices.query.base import BaseQueryEngine
+from gpt_index.indices.query.schema import QueryBundle
+from gpt_index.query_engine.graph_query_engine import ComposableGraphQueryEngine
+from gpt_index.response.schema import RESPONSE_TYPE, Response
+
+
+class ConcurrencyTracker:
+    """Track the max number of concurrent calls."""
+
+    def __init__(self) -> None:
+        self.num_running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            self.num_running += 1
+            self.max_running = max(self.max_running, self.num_running)
+
+    def end(self) -> None:
+        with self._lock:
+            self.num_running -= 1
+
+
+class MockQueryEngine(BaseQueryEngine):
+    """Query engine over a fixed list of nodes, sleeping on retrieve."""
+
+    def __init__(
+        self,
+        nodes: List[Node],
+        tracker: ConcurrencyTracker,
+        delay: float = 0.0,
+    ) -> None:
+        self._nodes = nodes
+        self._tracker = tracker
+        self._delay = delay
+        self.calls: List[str] = []
+
+    def retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        self.calls.append("retrieve")
+        self._tracker.start()
+        time.sleep(self._delay)
+        self._tracker.end()
+        return [NodeWithScore(node=node) for node in self._nodes]
+
+    async def aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        self._tracker.start()
+        await asyncio.sleep(self._delay)
+        self._tracker.end()
+        return [NodeWithScore(node=node) for node in self._nodes]
+
+    def synthesize(
+        self,
+        query_bundle: QueryBundle,
+        nodes: List[NodeWithScore],
+        additional_source_nodes: Optional[Sequence[NodeWithScore]] = None,
+    ) -> RESPONSE_TYPE:
+        self.calls.append("synthesize")
+        text = ",".join(n.node.get_text() for n in nodes)
+        return Response(text, source_nodes=list(nodes))
+
+    async def asynthesize(
+        self,
+        query_bundle: QueryBundle,
+        nodes: List[NodeWithScore],
+        additional_source_nodes: Optional[Sequence[NodeWithScore]] = None,
+    ) -> RESPONSE_TYPE:
+        return self.synthesize(query_bundle, nodes, additional_source_nodes)
+
+    def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        return self.synthesize(query_bundle, self.retrieve(query_bundle))
+
+    async def _aquery(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        return self._query(query_bundle)
+
+
+def _get_query_engines(
+    tracker: ConcurrencyTracker,
+    num_children: int,
+    delay: float,
+    slow_child_delay: Optional[float] = None,
+) -> Dict[str, BaseQueryEngine]:
+    root = MockQueryEngine(
+        [
+            IndexNode(text=f"summary{i}", index_id=f"child{i}")
+            for i in range(num_children)
+        ],
+        tracker,
+    )
+    query_engines: Dict[str, BaseQueryEngine] = {"root": root}
+    for i in range(num_children):
+        child_delay = delay
+        if i == 0 and slow_child_delay is not None:
+            child_delay = slow_child_delay
+        query_engines[f"child{i}"] = MockQueryEngine(
+            [Node(text=f"answer{i}")], tracker, delay=child_delay
+        )
+    return query_engines
+
+
+def test_query_children_concurrently() -> None:
+    """Test that child indices are queried concurrently, in order."""
+    query_engines = _get_query_engines(ConcurrencyTracker(), num_children=4, delay=0.2)
+    graph = ComposableGraph(all_indices={}, root_id="root")
+    query_engine = ComposableGraphQueryEngine(
+        graph, custom_query_engines=query_engines, max_concurrency=4
+    )
+
+    start = time.time()
+    response = query_engine.query("query")
+    assert time.time() - start < 0.6
+    assert str(response) == "answer0,answer1,answer2,answer3"
+
+    start = time.time()
+    response = asyncio.run(query_engine.aquery("query"))
+    assert time.time() - start < 0.6
+    assert str(response) == "answer0,answer1,answer2,answer3"
+
+
+def test_query_max_concurrency() -> None:
+    """Test that at most max_concurrency sub-index calls run at once."""
+    tracker = ConcurrencyTracker()
+    query_engines = _get_query_engines(tracker, num_children=6, delay=0.05)
+    graph = ComposableGraph(all_indices={}, root_id="root")
+    query_engine = ComposableGraphQueryEngine(
+        graph, custom_query_engines=query_engines, max_concurrency=2
+    )
+
+    response = query_engine.query("query")
+    assert str(response) == ",".join(f"answer{i}" for i in range(6))
+    assert tracker.max_running == 2
+
+    tracker.max_running = 0
+    response = asyncio.run(query_engine.aquery("query"))
+    assert str(response) == ",".join(f"answer{i}" for i in range(6))
+    assert tracker.max_running == 2
+
+
+def test_query_timeout() -> None:
+    """Test that timed out child indices fall back to their index node."""
+    query_engines = _get_query_engines(
+        ConcurrencyTracker(), num_children=3, delay=0.0, slow_child_delay=1.0
+    )
+    graph = ComposableGraph(all_indices={}, root_id="root")
+    query_engine = ComposableGraphQueryEngine(
+        graph, custom_query_engines=query_engines, timeout=0.3
+    )
+
+    start = time.time()
+    response = query_engine.query("query")
+    assert time.time() - start < 0.9
+    assert str(response) == "summary0,answer1,answer2"
+
+    start = time.time()
+    response = asyncio.run(query_engine.aquery("query"))
+    assert time.time() - start < 0.9
+    assert str(response) == "summary0,answer1,answer2"
+
+
+def test_query_timeout_stops_child_queries() -> None:
+    """Test that timed out child queries make no new calls after the timeout."""
+    tracker = ConcurrencyTracker()
+    root = MockQueryEngine([IndexNode(text="summary0", index_id="child0")], tracker)
+    child = MockQueryEngine(
+        [IndexNode(text="child summary", index_id="grandchild")], tracker, delay=0.5
+    )
+    grandchild = MockQueryEngine([Node(text="answer")], tracker)
+    graph = ComposableGraph(all_indices={}, root_id="root")
+    query_engine = ComposableGraphQueryEngine(
+        graph,
+        custom_query_engines={
+            "root": root,
+            "child0": child,
+            "grandchild": grandchild,
+        },
+        timeout=0.2,
+    )
+
+    response = query_engine.query("query")
+    assert str(response) == "summary0"
+
+    # let the running retrieve call of the child finish
+    time.sleep(0.6)
+    assert tracker.num_running == 0
+    assert root.calls == ["retrieve", "synthesize"]
+    assert child.calls == ["retrieve"]
+    assert grandchild.calls == []
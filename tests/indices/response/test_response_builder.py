@@ -1,6 +1,9 @@
 """Test response utils."""
 
-from typing import List
+import asyncio
+
+import pytest
+from typing import Any, List, Tuple
 
 from gpt_index.constants import MAX_CHUNK_OVERLAP, MAX_CHUNK_SIZE, NUM_OUTPUTS
 from gpt_index.indices.prompt_helper import PromptHelper
@@ -9,8 +12,11 @@ from gpt_index.indices.response.response_builder import (
     get_response_builder,
 )
 from gpt_index.indices.service_context import ServiceContext
+from gpt_index.llm_predictor.base import LLMPredictor
+from gpt_index.prompts.base import Prompt
 from gpt_index.prompts.prompts import QuestionAnswerPrompt, RefinePrompt
 from gpt_index.readers.schema.base import Document
+from tests.indices.vector_store.mock_services import MockEmbedding
 from tests.mock_utils.mock_prompts import MOCK_REFINE_PROMPT, MOCK_TEXT_QA_PROMPT
 
 
@@ -134,3 +140,90 @@ def test_tree_summarize_response(mock_service_context: ServiceContext) -> None:
     )
     # TODO: fix this output, the \n join appends unnecessary results at the end
     assert str(response) == "What is?:This:is:a:bar:This:is:another:test"
+
+
+def test_async_refine_response(mock_service_context: ServiceContext) -> None:
+    """Test async refine and compact responses match sync responses."""
+    mock_refine_prompt_tmpl = "{query_str}{existing_answer}{context_msg}"
+    mock_refine_prompt = RefinePrompt(mock_refine_prompt_tmpl)
+
+    mock_qa_prompt_tmpl = "{context_str}{query_str}"
+    mock_qa_prompt = QuestionAnswerPrompt(mock_qa_prompt_tmpl)
+
+    query_str = "What is?"
+    texts = [
+        "This\n\nis\n\na\n\nbar",
+        "This\n\nis\n\na\n\ntest",
+        "This\n\nis\n\nanother\n\ntest",
+    ]
+    for chunk_size_limit in (None, 2):
+        prompt_helper = PromptHelper(
+            20,
+            0,
+            0,
+            tokenizer=mock_tokenizer,
+            separator="\n\n",
+            chunk_size_limit=chunk_size_limit,
+        )
+        service_context = mock_service_context
+        service_context.prompt_helper = prompt_helper
+
+        for mode in (ResponseMode.REFINE, ResponseMode.COMPACT):
+            builder = get_response_builder(
+                service_context=service_context,
+                text_qa_template=mock_qa_prompt,
+                refine_template=mock_refine_prompt,
+                mode=mode,
+            )
+            response = builder.get_response(text_chunks=texts, query_str=query_str)
+            aresponse = asyncio.run(
+                builder.aget_response(text_chunks=texts, query_str=query_str)
+            )
+            assert str(aresponse) == str(response)
+
+
+def _mock_count_predict(
+    self: Any, prompt: Prompt, **prompt_args: Any
+) -> Tuple[str, str]:
+    """Mock predict counting words, where numbers count as their value."""
+    context_str = prompt_args["context_str"]
+    count = sum(int(t) if t.isdigit() else 1 for t in context_str.split())
+    return str(count), prompt.format(**prompt_args)
+
+
+async def _mock_count_apredict(
+    self: Any, prompt: Prompt, **prompt_args: Any
+) -> Tuple[str, str]:
+    return _mock_count_predict(self, prompt, **prompt_args)
+
+
+def test_map_reduce_response(
+    patch_llm_predictor: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test map-reduce response."""
+    monkeypatch.setattr(LLMPredictor, "predict", _mock_count_predict)
+    monkeypatch.setattr(LLMPredictor, "apredict", _mock_count_apredict)
+
+    # max input size is 6, prompt is one token (the query) --> 5 tokens
+    # --> padding is 1 --> 4 tokens per packed chunk
+    prompt_helper = PromptHelper(6, 0, 0, tokenizer=mock_tokenizer, separator="\n\n")
+    service_context = ServiceContext.from_defaults(
+        llm_predictor=LLMPredictor(),
+        prompt_helper=prompt_helper,
+        embed_model=MockEmbedding(),
+    )
+    mock_qa_prompt = QuestionAnswerPrompt("{context_str}{query_str}")
+    builder = get_response_builder(
+        service_context=service_context,
+        text_qa_template=mock_qa_prompt,
+        mode=ResponseMode.MAP_REDUCE,
+    )
+
+    # 64 chunks --> 16 packed chunks --> 4 partial answers --> 1 answer
+    texts = ["word"] * 64
+    response = builder.get_response(text_chunks=texts, query_str="q")
+    assert str(response) == "64"
+    response = builder.get_response(text_chunks=texts, query_str="q", max_concurrency=1)
+    assert str(response) == "64"
+    response = asyncio.run(builder.aget_response(text_chunks=texts, query_str="q"))
+    assert str(response) == "64"
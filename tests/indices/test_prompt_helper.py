@@ -49,6 +49,13 @@ def test_get_chunk_size() -> None:
     )
     assert chunk_size == 2
 
+    # test ignoring chunk_size_limit for one call, without changing the helper
+    chunk_size = prompt_helper.get_chunk_size_given_prompt(
+        empty_prompt_text, 2, padding=0, use_chunk_size_limit=False
+    )
+    assert chunk_size == 3
+    assert prompt_helper.use_chunk_size_limit
+
     # test padding
     prompt_helper = PromptHelper(
         max_input_size=11, num_output=1, max_chunk_overlap=0, tokenizer=mock_tokenizer
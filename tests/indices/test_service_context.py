@@ -0,0 +1,63 @@
+"""Test service context."""
+import pytest
+from langchain.llms.fake import FakeListLLM
+
+from gpt_index.embeddings.cache import SimpleEmbeddingCache
+from gpt_index.indices.service_context import ServiceContext
+from gpt_index.llm_predictor.base import LLMPredictor
+from gpt_index.llm_predictor.cache import SimpleLLMResponseCache
+from gpt_index.llm_predictor.limiter import LLMRequestLimiter
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+
+def test_from_defaults_shared_caches() -> None:
+    """Test caches and limiters of shared predictors and embed models."""
+    llm_predictor = LLMPredictor(FakeListLLM(responses=[]))
+    embed_model = MockEmbedding()
+    response_cache = SimpleLLMResponseCache()
+    request_limiter = LLMRequestLimiter(max_concurrency=1)
+    embed_cache = SimpleEmbeddingCache()
+
+    ServiceContext.from_defaults(
+        llm_predictor=llm_predictor,
+        embed_model=embed_model,
+        llm_response_cache=response_cache,
+        llm_request_limiter=request_limiter,
+        embed_cache=embed_cache,
+    )
+    assert llm_predictor.response_cache is response_cache
+    assert llm_predictor.request_limiter is request_limiter
+    assert embed_model.embed_cache is embed_cache
+
+    # sharing the same caches, or not setting any, is fine
+    ServiceContext.from_defaults(
+        llm_predictor=llm_predictor,
+        embed_model=embed_model,
+        llm_response_cache=response_cache,
+        embed_cache=embed_cache,
+    )
+    ServiceContext.from_defaults(llm_predictor=llm_predictor, embed_model=embed_model)
+    assert llm_predictor.response_cache is response_cache
+
+    # but a different one is not silently replaced
+    with pytest.raises(ValueError):
+        ServiceContext.from_defaults(
+            llm_predictor=llm_predictor,
+            embed_model=embed_model,
+            llm_response_cache=SimpleLLMResponseCache(),
+        )
+    with pytest.raises(ValueError):
+        ServiceContext.from_defaults(
+            llm_predictor=llm_predictor,
+            embed_model=embed_model,
+            llm_request_limiter=LLMRequestLimiter(max_concurrency=2),
+        )
+    with pytest.raises(ValueError):
+        ServiceContext.from_defaults(
+            llm_predictor=llm_predictor,
+            embed_model=embed_model,
+            embed_cache=SimpleEmbeddingCache(),
+        )
+    assert llm_predictor.response_cache is response_cache
+    assert llm_predictor.request_limiter is request_limiter
+    assert embed_model.embed_cache is embed_cache
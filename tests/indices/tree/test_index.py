@@ -1,13 +1,16 @@
 """Test tree index."""
 
-from typing import Any, Dict, List, Optional
-from unittest.mock import patch
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
 
 from gpt_index.data_structs.data_structs_v2 import IndexGraph
 from gpt_index.data_structs.node_v2 import Node
 from gpt_index.indices.service_context import ServiceContext
 from gpt_index.storage.docstore import BaseDocumentStore
 from gpt_index.indices.tree.base import GPTTreeIndex
+from gpt_index.prompts.base import Prompt
 from gpt_index.readers.schema.base import Document
 
 
@@ -81,15 +84,7 @@ def test_build_tree_with_embed(
     assert all_nodes[5].text == ("This is another test.\nThis is a test v2.")
 
 
-OUTPUTS = [
-    ("Hello world.\nThis is a test.", ""),
-    ("This is another test.\nThis is a test v2.", ""),
-]
-
-
-@patch("gpt_index.indices.common_tree.base.run_async_tasks", side_effect=[OUTPUTS])
 def test_build_tree_async(
-    _mock_run_async_tasks: Any,
     documents: List[Document],
     mock_service_context: ServiceContext,
     struct_kwargs: Dict,
@@ -110,6 +105,64 @@ def test_build_tree_async(
     assert nodes[5].text == ("This is another test.\nThis is a test v2.")
 
 
+def test_build_tree_async_pipelined(
+    mock_service_context: ServiceContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that async tree builds bound concurrency and match sync builds."""
+    doc_text = "\n".join(f"Text chunk {i}." for i in range(20))
+    tree = GPTTreeIndex.from_documents(
+        [Document(doc_text)], service_context=mock_service_context, num_children=2
+    )
+
+    num_running = 0
+    max_running = 0
+    llm_predictor = mock_service_context.llm_predictor
+    orig_apredict = llm_predictor.apredict
+
+    async def mock_apredict(prompt: Prompt, **prompt_args: Any) -> Tuple[str, str]:
+        nonlocal num_running, max_running
+        num_running += 1
+        max_running = max(max_running, num_running)
+        await asyncio.sleep(0.001)
+        num_running -= 1
+        return await orig_apredict(prompt, **prompt_args)
+
+    monkeypatch.setattr(llm_predictor, "apredict", mock_apredict)
+    async_tree = GPTTreeIndex.from_documents(
+        [Document(doc_text)],
+        service_context=mock_service_context,
+        num_children=2,
+        use_async=True,
+        max_concurrency=3,
+    )
+    assert max_running == 3
+
+    # 20 leaves, then 10, 5, 3 and 2 root nodes
+    assert len(async_tree.index_struct.all_nodes) == 40
+    assert len(async_tree.index_struct.root_nodes) == 2
+
+    def get_texts(index: GPTTreeIndex, node_ids: Dict[int, str]) -> Dict[int, str]:
+        nodes = index.docstore.get_node_dict(node_ids)
+        return {i: node.get_text() for i, node in nodes.items()}
+
+    index_graph = tree.index_struct
+    async_index_graph = async_tree.index_struct
+    assert get_texts(async_tree, async_index_graph.all_nodes) == get_texts(
+        tree, index_graph.all_nodes
+    )
+    assert get_texts(async_tree, async_index_graph.root_nodes) == get_texts(
+        tree, index_graph.root_nodes
+    )
+    for index, node_id in async_index_graph.all_nodes.items():
+        assert async_index_graph.node_id_to_children_ids[node_id] == [
+            async_index_graph.all_nodes[i]
+            for i in tree.index_struct.get_children(
+                tree.docstore.get_node(index_graph.all_nodes[index])
+            )
+        ]
+
+
 def test_build_tree_multiple(
     mock_service_context: ServiceContext,
     struct_kwargs: Dict,
@@ -193,6 +246,47 @@ def test_insert(
     assert nodes[0].ref_doc_id == "new_doc_test"
 
 
+def test_index_graph_reverse_maps(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+) -> None:
+    """Test that the index graph keeps node indices and parents in sync."""
+    index_kwargs, _ = struct_kwargs
+    tree = GPTTreeIndex.from_documents(
+        documents, service_context=mock_service_context, **index_kwargs
+    )
+    tree.insert(Document("This is a new doc.", doc_id="new_doc"))
+    index_graph = tree.index_struct
+
+    def check_index_graph(index_graph: IndexGraph) -> None:
+        assert index_graph.node_id_to_index == {
+            node_id: index for index, node_id in index_graph.all_nodes.items()
+        }
+        for parent_id, children_ids in index_graph.node_id_to_children_ids.items():
+            for child_id in children_ids:
+                assert index_graph.get_parent_id(child_id) == parent_id
+        for root_id in index_graph.root_nodes.values():
+            assert index_graph.get_parent_id(root_id) is None
+
+    check_index_graph(index_graph)
+    (new_node_id,) = [
+        node_id
+        for node_id in index_graph.all_nodes.values()
+        if tree.docstore.get_node(node_id).ref_doc_id == "new_doc"
+    ]
+    assert index_graph.get_parent_id(new_node_id) is not None
+
+    # the reverse maps are rebuilt when loading, and are not serialized
+    index_graph_dict = index_graph.to_dict()
+    assert "_node_id_to_index" not in index_graph_dict
+    loaded_index_graph = IndexGraph.from_dict(index_graph_dict)
+    check_index_graph(loaded_index_graph)
+    assert loaded_index_graph.get_parent_id(new_node_id) == (
+        index_graph.get_parent_id(new_node_id)
+    )
+
+
 def test_twice_insert_empty(
     mock_service_context: ServiceContext,
 ) -> None:
@@ -1,16 +1,20 @@
 """Test pinecone indexes."""
 
 import sys
-from typing import List
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, Mock
 
 import pytest
+from gpt_index.data_structs.node_v2 import Node
 from gpt_index.indices.service_context import ServiceContext
 from gpt_index.indices.vector_store.base import GPTVectorStoreIndex
 
 from gpt_index.readers.schema.base import Document
 from gpt_index.storage.storage_context import StorageContext
 from gpt_index.vector_stores.pinecone import PineconeVectorStore
+from gpt_index.vector_stores.types import NodeEmbeddingResult
 from tests.indices.vector_store.utils import MockPineconeIndex
 
 from tests.mock_utils.mock_utils import mock_tokenizer
@@ -52,3 +56,121 @@ def test_build_pinecone(
     nodes = retriever.retrieve("What is?")
     assert len(nodes) == 1
     assert nodes[0].node.get_text() == "This is another test."
+
+
+class FakePineconeIndex:
+    """In-process fake Pinecone index, failing some upserts."""
+
+    def __init__(self, fail_ids: Optional[Dict[str, Exception]] = None) -> None:
+        self.vectors: Dict[str, Dict[str, Any]] = {}
+        self.upsert_batches: List[List[str]] = []
+        self._fail_ids = fail_ids or {}
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        ids = [vector["id"] for vector in vectors]
+        with self._lock:
+            self.upsert_batches.append(ids)
+            for vector_id in ids:
+                if vector_id in self._fail_ids:
+                    raise self._fail_ids.pop(vector_id)
+            # NOTE: the last vector of a batch is dropped once
+            if "partial" in self._fail_ids:
+                del self._fail_ids["partial"]
+                vectors = vectors[:-1]
+            for vector in vectors:
+                self.vectors[vector["id"]] = vector
+        return SimpleNamespace(upserted_count=len(vectors))
+
+
+class FakeApiException(Exception):
+    """Fake Pinecone API exception."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+class FakeProtocolError(Exception):
+    """Fake Pinecone protocol error."""
+
+
+def _mock_pinecone_module() -> None:
+    """Mock the pinecone import, with fake exception types."""
+    sys.modules["pinecone"] = MagicMock(
+        ApiException=FakeApiException, PineconeProtocolError=FakeProtocolError
+    )
+
+
+def _get_embedding_results(num_results: int) -> List[NodeEmbeddingResult]:
+    return [
+        NodeEmbeddingResult(
+            id=f"id{i}",
+            node=Node(text=f"text {i}", doc_id=f"id{i}"),
+            embedding=[float(i), 1.0],
+            doc_id=f"doc{i}",
+        )
+        for i in range(num_results)
+    ]
+
+
+def mock_sparse_tokenizer(texts: List[str]) -> Dict[str, List[List[int]]]:
+    """Mock batched tokenizer, mapping words to their lengths."""
+    return {"input_ids": [[len(word) for word in text.split()] for text in texts]}
+
+
+def test_pinecone_batched_add() -> None:
+    """Test that PineconeVectorStore.add upserts in batches."""
+    _mock_pinecone_module()
+    pinecone_index = FakePineconeIndex(fail_ids={"id7": FakeApiException(503)})
+    tokenizer = Mock(side_effect=mock_sparse_tokenizer)
+    vector_store = PineconeVectorStore(
+        pinecone_index=pinecone_index,
+        tokenizer=tokenizer,
+        add_sparse_vector=True,
+        batch_size=4,
+        max_concurrency=2,
+    )
+    results = _get_embedding_results(10)
+    ids = vector_store.add(results)
+    assert ids == [f"id{i}" for i in range(10)]
+    assert set(pinecone_index.vectors.keys()) == set(ids)
+    # 3 batches, and 1 retry of the failed batch
+    assert len(pinecone_index.upsert_batches) == 4
+    assert sorted(pinecone_index.upsert_batches)[-1] == ["id8", "id9"]
+    # sparse vectors are generated once per batch
+    assert tokenizer.call_count == 3
+    assert pinecone_index.vectors["id3"]["sparse_values"] == {
+        "indices": [4, 1],
+        "values": [1.0, 1.0],
+    }
+
+    # batches are also split by payload size
+    pinecone_index = FakePineconeIndex(
+        fail_ids={"partial": Exception(), "id5": FakeProtocolError()}
+    )
+    vector_store = PineconeVectorStore(
+        pinecone_index=pinecone_index,
+        tokenizer=Mock(),
+        max_batch_bytes=250,
+        max_concurrency=1,
+    )
+    vector_store.add(results)
+    assert set(pinecone_index.vectors.keys()) == set(ids)
+    assert all(len(batch) <= 2 for batch in pinecone_index.upsert_batches)
+    # the partially applied batch and the connection error are retried
+    assert len(pinecone_index.upsert_batches) == 7
+
+    # client errors are not retried
+    pinecone_index = FakePineconeIndex(fail_ids={"id0": FakeApiException(400)})
+    vector_store = PineconeVectorStore(pinecone_index=pinecone_index, tokenizer=Mock())
+    with pytest.raises(FakeApiException):
+        vector_store.add(results)
+    assert len(pinecone_index.upsert_batches) == 1
+
+    # nor are errors other than API and connection errors
+    pinecone_index = FakePineconeIndex(fail_ids={"id0": TypeError()})
+    vector_store = PineconeVectorStore(pinecone_index=pinecone_index, tokenizer=Mock())
+    with pytest.raises(TypeError):
+        vector_store.add(results)
+    assert len(pinecone_index.upsert_batches) == 1
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, cast
 from gpt_index.data_structs.node_v2 import DocumentRelationship, Node
 from gpt_index.indices.query.schema import QueryBundle
@@ -143,3 +144,25 @@ def test_query_and_count_tokens(mock_service_context: ServiceContext) -> None:
     retriever = index.as_retriever()
     _ = retriever.retrieve(QueryBundle(query_str))
     assert index.service_context.embed_model.last_token_usage == 3
+
+
+def test_simple_aretrieve(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test async retrieval matches sync retrieval."""
+    index = GPTVectorStoreIndex.from_documents(
+        documents, service_context=mock_service_context
+    )
+
+    query_str = "What is?"
+    retriever = index.as_retriever(similarity_top_k=2)
+    nodes = retriever.retrieve(QueryBundle(query_str))
+    anodes = asyncio.run(retriever.aretrieve(QueryBundle(query_str)))
+    assert [n.node.get_doc_id() for n in anodes] == [n.node.get_doc_id() for n in nodes]
+    assert [n.score for n in anodes] == [n.score for n in nodes]
+
+    # async query engine goes through aretrieve
+    query_engine = index.as_query_engine(similarity_top_k=1)
+    response = asyncio.run(query_engine.aquery(query_str))
+    assert response.source_nodes[0].node.text == "This is another test."
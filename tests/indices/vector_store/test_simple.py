@@ -1,13 +1,20 @@
 """Test vector store indexes."""
 
+import json
+from pathlib import Path
 from typing import Any, List, cast
 
+import numpy as np
+import pytest
 
+from gpt_index.data_structs.node_v2 import Node
 from gpt_index.indices.service_context import ServiceContext
 from gpt_index.indices.vector_store.base import GPTVectorStoreIndex
 
 from gpt_index.readers.schema.base import Document
-from gpt_index.vector_stores.simple import SimpleVectorStore
+from gpt_index.storage.storage_context import StorageContext
+from gpt_index.vector_stores.simple import SimpleVectorStore, SimpleVectorStoreData
+from gpt_index.vector_stores.types import NodeEmbeddingResult, VectorStoreQuery
 
 
 def test_build_simple(
@@ -141,3 +148,292 @@ def test_simple_async(
         vector_store = cast(SimpleVectorStore, index._vector_store)
         embedding = vector_store.get(text_id)
         assert (node.text, embedding) in actual_node_tups
+
+
+def test_simple_matrix(
+    mock_service_context: ServiceContext,
+    tmp_path: Path,
+) -> None:
+    """Test simple vector store backed by an embedding matrix."""
+    new_documents = [
+        Document("Hello world.", doc_id="test_id_0"),
+        Document("This is a test.", doc_id="test_id_1"),
+        Document("This is another test.", doc_id="test_id_2"),
+        Document("This is a test v2.", doc_id="test_id_3"),
+    ]
+    vector_store = SimpleVectorStore(use_matrix=True)
+    storage_context = StorageContext.from_defaults(vector_store=vector_store)
+    index = GPTVectorStoreIndex.from_documents(
+        documents=new_documents,
+        storage_context=storage_context,
+        service_context=mock_service_context,
+    )
+    nodes = index.as_retriever(similarity_top_k=2).retrieve("What is?")
+    assert [n.node.text for n in nodes][0] == "This is another test."
+    assert nodes[0].score == 1.0
+    assert nodes[1].score == 0.0
+
+    # deleting moves the last embedding into the freed row
+    index.delete("test_id_0")
+    assert vector_store._matrix is not None
+    assert vector_store._matrix.size == 3
+    for text_id, node_id in index.index_struct.nodes_dict.items():
+        node = index.docstore.get_node(node_id)
+        assert vector_store.get(
+            text_id
+        ) == mock_service_context.embed_model.get_text_embedding(node.get_text())
+
+    # dictionary-backed stores are persisted as json
+    persist_path = str(tmp_path / "vector_store.json")
+    loaded_store = SimpleVectorStore(
+        SimpleVectorStoreData(
+            embedding_dict=vector_store._matrix.to_dict(),
+            text_id_to_doc_id=vector_store._data.text_id_to_doc_id,
+        )
+    )
+    loaded_store.persist(persist_path)
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert loaded_store._matrix is None
+    loaded_matrix_store = SimpleVectorStore.from_persist_path(
+        persist_path, use_matrix=True
+    )
+    for text_id in index.index_struct.nodes_dict.keys():
+        assert loaded_store.get(text_id) == vector_store.get(text_id)
+        assert loaded_matrix_store.get(text_id) == vector_store.get(text_id)
+
+    # batched queries match single queries
+    queries = [
+        VectorStoreQuery(query_embedding=[0, 0, 1, 0, 0], similarity_top_k=2),
+        VectorStoreQuery(query_embedding=[0, 1, 0, 0, 0], similarity_top_k=1),
+        VectorStoreQuery(query_embedding=[0, 1, 1, 0, 0], similarity_top_k=2),
+    ]
+    for store in [vector_store, loaded_store]:
+        batch_results = store.batch_query(queries)
+        for query, result in zip(queries, batch_results):
+            assert result.ids == store.query(query).ids
+
+
+def test_simple_matrix_persist_binary(
+    mock_service_context: ServiceContext,
+    documents: List[Document],
+    tmp_path: Path,
+) -> None:
+    """Test binary persistence of the matrix-backed simple vector store."""
+    vector_store = SimpleVectorStore(use_matrix=True)
+    storage_context = StorageContext.from_defaults(vector_store=vector_store)
+    index = GPTVectorStoreIndex.from_documents(
+        documents=documents,
+        storage_context=storage_context,
+        service_context=mock_service_context,
+    )
+    storage_context.persist(persist_dir=str(tmp_path))
+    assert (tmp_path / "vector_store.npy").exists()
+    assert not (tmp_path / "vector_store.json").exists()
+
+    # the binary format is detected automatically and memory-mapped
+    loaded_context = StorageContext.from_defaults(persist_dir=str(tmp_path))
+    loaded_store = cast(SimpleVectorStore, loaded_context.vector_store)
+    assert loaded_store._matrix is not None
+    assert isinstance(loaded_store._matrix.embeddings, np.memmap)
+    for text_id in index.index_struct.nodes_dict.keys():
+        assert loaded_store.get(text_id) == vector_store.get(text_id)
+
+    query = VectorStoreQuery(query_embedding=[0, 0, 1, 0, 0], similarity_top_k=2)
+    assert loaded_store.query(query) == vector_store.query(query)
+
+    # updates never modify the persisted files
+    loaded_store.delete(documents[0].get_doc_id())
+    loaded_store.add(
+        [
+            NodeEmbeddingResult(
+                "new_id", Node("This is a test v3."), [0, 0, 0, 0, 1], "new_doc"
+            )
+        ]
+    )
+    persisted_store = SimpleVectorStore.from_persist_dir(str(tmp_path))
+    assert persisted_store._matrix is not None
+    assert persisted_store._matrix.size == 4
+
+    # persisting over the memory-mapped files
+    loaded_store.persist(str(tmp_path / "vector_store.json"))
+    reloaded_store = SimpleVectorStore.from_persist_dir(str(tmp_path))
+    assert reloaded_store.get("new_id") == [0, 0, 0, 0, 1]
+    assert reloaded_store._data == loaded_store._data
+
+    # persisting as json removes the stale binary files
+    SimpleVectorStore().persist(str(tmp_path / "vector_store.json"))
+    assert not (tmp_path / "vector_store.npy").exists()
+    assert SimpleVectorStore.from_persist_dir(str(tmp_path))._matrix is None
+
+
+def test_simple_delete_many(
+    mock_service_context: ServiceContext,
+    tmp_path: Path,
+) -> None:
+    """Test bulk delete from GPTVectorStoreIndex."""
+    new_documents = [
+        Document("Hello world.", doc_id="test_id_0"),
+        Document("This is a test.", doc_id="test_id_1"),
+        Document("This is another test.", doc_id="test_id_2"),
+        Document("This is a test v2.", doc_id="test_id_3"),
+    ]
+    index = GPTVectorStoreIndex.from_documents(
+        documents=new_documents, service_context=mock_service_context
+    )
+    vector_store = cast(SimpleVectorStore, index.vector_store)
+    assert set(vector_store._data.doc_id_to_text_ids.keys()) == {
+        "test_id_0",
+        "test_id_1",
+        "test_id_2",
+        "test_id_3",
+    }
+
+    index.delete_many(["test_id_0", "test_id_2", "missing_id"])
+    assert set(index.index_struct.doc_id_dict.keys()) == {"test_id_1", "test_id_3"}
+    assert len(index.index_struct.nodes_dict) == 2
+    assert set(vector_store._data.doc_id_to_text_ids.keys()) == {
+        "test_id_1",
+        "test_id_3",
+    }
+    assert set(vector_store._data.embedding_dict.keys()) == set(
+        index.index_struct.nodes_dict.keys()
+    )
+
+    # the reverse index is rebuilt for stores persisted without it
+    persist_path = str(tmp_path / "vector_store.json")
+    vector_store.persist(persist_path)
+    with open(persist_path) as f:
+        data_dict = json.load(f)
+    del data_dict["doc_id_to_text_ids"]
+    with open(persist_path, "w") as f:
+        json.dump(data_dict, f)
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert loaded_store._data == vector_store._data
+    loaded_store.delete("test_id_1")
+    assert set(loaded_store._data.text_id_to_doc_id.values()) == {"test_id_3"}
+
+
+def test_simple_build_with_checkpoints(
+    mock_service_context: ServiceContext,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test resuming a failed GPTVectorStoreIndex build from a checkpoint."""
+    texts = ["Hello world.", "This is a test.", "This is another test."]
+    documents = [Document(text, doc_id=f"test_id_{i}") for i, text in enumerate(texts)]
+    persist_dir = str(tmp_path)
+    inserted_doc_ids: List[str] = []
+    orig_insert = GPTVectorStoreIndex._insert
+
+    def mock_insert(self: Any, nodes: List[Node], **insert_kwargs: Any) -> None:
+        if any(node.ref_doc_id == "test_id_2" for node in nodes):
+            raise ValueError("Failed to embed nodes.")
+        inserted_doc_ids.extend(str(node.ref_doc_id) for node in nodes)
+        orig_insert(self, nodes, **insert_kwargs)
+
+    monkeypatch.setattr(GPTVectorStoreIndex, "_insert", mock_insert)
+    with pytest.raises(ValueError):
+        GPTVectorStoreIndex.from_documents_with_checkpoints(
+            documents,
+            "test_index",
+            service_context=mock_service_context,
+            checkpoint_batch_size=2,
+            persist_dir=persist_dir,
+        )
+    assert inserted_doc_ids == ["test_id_0", "test_id_1"]
+
+    # resume from the persisted checkpoint, updating a document
+    monkeypatch.setattr(GPTVectorStoreIndex, "_insert", orig_insert)
+    documents[0] = Document("This is a test v2.", doc_id="test_id_0")
+    storage_context = StorageContext.from_defaults(persist_dir=persist_dir)
+    index = GPTVectorStoreIndex.from_documents_with_checkpoints(
+        documents,
+        "test_index",
+        storage_context=storage_context,
+        service_context=mock_service_context,
+        checkpoint_batch_size=2,
+    )
+    assert index.index_id == "test_index"
+    assert set(index.index_struct.doc_id_dict.keys()) == {
+        "test_id_0",
+        "test_id_1",
+        "test_id_2",
+    }
+    nodes = index.docstore.get_nodes(list(index.index_struct.nodes_dict.values()))
+    assert sorted(node.get_text() for node in nodes) == [
+        "This is a test v2.",
+        "This is a test.",
+        "This is another test.",
+    ]
+    vector_store = cast(SimpleVectorStore, index.vector_store)
+    assert set(vector_store._data.embedding_dict.keys()) == set(
+        index.index_struct.nodes_dict.keys()
+    )
+
+    # once the build is complete, only new documents are inserted
+    monkeypatch.setattr(GPTVectorStoreIndex, "_insert", mock_insert)
+    inserted_doc_ids.clear()
+    documents.append(Document("This is a test v2.", doc_id="test_id_3"))
+    index = GPTVectorStoreIndex.from_documents_with_checkpoints(
+        documents,
+        "test_index",
+        storage_context=storage_context,
+        service_context=mock_service_context,
+    )
+    assert inserted_doc_ids == ["test_id_3"]
+    assert "test_id_3" in index.index_struct.doc_id_dict
+
+
+def test_simple_refresh(
+    mock_service_context: ServiceContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test refreshing GPTVectorStoreIndex, reusing unchanged embeddings."""
+    documents = [
+        Document("Hello world.\nThis is a test.", doc_id="test_id_0"),
+        Document("This is another test.", doc_id="test_id_1"),
+    ]
+    index = GPTVectorStoreIndex.from_documents(
+        documents=documents, service_context=mock_service_context
+    )
+
+    embed_model = mock_service_context.embed_model
+    queued_texts: List[str] = []
+    orig_queue_text_for_embedding = embed_model.queue_text_for_embedding
+
+    def mock_queue_text_for_embedding(text_id: str, text: str) -> None:
+        queued_texts.append(text)
+        orig_queue_text_for_embedding(text_id, text)
+
+    monkeypatch.setattr(
+        embed_model, "queue_text_for_embedding", mock_queue_text_for_embedding
+    )
+    documents = [
+        Document("Hello world.\nThis is a test v2.", doc_id="test_id_0"),
+        Document("This is another test.", doc_id="test_id_1"),
+        Document("This is a test.", doc_id="test_id_2"),
+    ]
+    refreshed_docs = index.refresh(documents)
+    assert refreshed_docs == [True, False, True]
+    # only new text is embedded, "This is a test." was in the old document
+    assert queued_texts == ["This is a test v2."]
+
+    actual_node_tups = [
+        ("Hello world.", [1, 0, 0, 0, 0], "test_id_0"),
+        ("This is a test v2.", [0, 0, 0, 1, 0], "test_id_0"),
+        ("This is another test.", [0, 0, 1, 0, 0], "test_id_1"),
+        ("This is a test.", [0, 1, 0, 0, 0], "test_id_2"),
+    ]
+    vector_store = cast(SimpleVectorStore, index.vector_store)
+    assert len(index.index_struct.nodes_dict) == 4
+    for text_id, node_id in index.index_struct.nodes_dict.items():
+        node = index.docstore.get_node(node_id)
+        embedding = vector_store.get(text_id)
+        assert (node.text, embedding, node.ref_doc_id) in actual_node_tups
+        # reused embeddings are only stored in the vector store
+        assert node.embedding is None
+
+    # nothing is refreshed the second time
+    queued_texts.clear()
+    assert index.refresh(documents) == [False, False, False]
+    assert queued_texts == []
@@ -1,4 +1,11 @@
 """Test text splitter."""
+import inspect
+
+import pytest
+
+import gpt_index.langchain_helpers.text_splitter as text_splitter_module
+import gpt_index.utils as utils_module
+import gpt_index.vector_stores.simple as vector_store_module
 from gpt_index.langchain_helpers.text_splitter import (
     SentenceSplitter,
     TokenTextSplitter,
@@ -85,3 +92,68 @@ def test_split_diff_sentence_token2() -> None:
     assert token_split[1] == " ".join(["bar"] * 11)
     assert sentence_split[0] == " ".join(["foo"] * 15) + "."
     assert sentence_split[1] == " ".join(["bar"] * 15)
+
+
+def test_split_tokenize_once() -> None:
+    """Test splitting with a single tokenization per text."""
+    text_splitter = TokenTextSplitter(chunk_size=2, chunk_overlap=1, tokenize_once=True)
+    chunks = text_splitter.split_text("foo bar hello world")
+    assert chunks == ["foo bar", "bar hello", "hello world"]
+
+    text = " ".join(["foo"] * 20)
+    text_splitter = TokenTextSplitter(
+        chunk_size=20, chunk_overlap=0, tokenize_once=True
+    )
+    assert len(text_splitter.split_text(text)) == 1
+    assert len(text_splitter.split_text(text, extra_info_str="extra_info")) == 2
+
+    # long tokens are force chunked by slicing their tokens
+    token = "a" * 100
+    chunks = text_splitter.split_text(token)
+    assert "".join(chunks).replace(" ", "") == token
+    assert all(len(text_splitter.tokenizer(chunk)) <= 20 for chunk in chunks)
+
+    token = ("a" * 49) + "\n" + ("a" * 50)
+    chunks = text_splitter.split_text(token)
+    assert len(chunks[0]) == 49
+    assert len(chunks[1]) == 50
+
+
+def test_split_tokenize_once_chunk_size() -> None:
+    """Test that no chunk is over the chunk size on real text."""
+    # NOTE: use the source of this package as real text
+    texts = [
+        inspect.getsource(module)
+        for module in (text_splitter_module, utils_module, vector_store_module)
+    ]
+    for chunk_size in (20, 100, 512):
+        text_splitter = TokenTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=10, tokenize_once=True
+        )
+        for text in texts:
+            chunks = text_splitter.split_text(text)
+            assert len(chunks) > 1
+            for chunk in chunks:
+                assert len(text_splitter.tokenizer(chunk)) <= chunk_size
+
+
+def test_split_tokenize_once_token_offsets_fn() -> None:
+    """Test splitting with a single tokenization and a custom tokenizer."""
+    with pytest.raises(ValueError):
+        TokenTextSplitter(tokenizer=list, tokenize_once=True)
+
+    # character-level tokenizer
+    text_splitter = TokenTextSplitter(
+        chunk_size=8,
+        chunk_overlap=0,
+        tokenizer=list,
+        tokenize_once=True,
+        token_offsets_fn=lambda text: list(range(len(text))),
+    )
+    assert text_splitter.split_text("abc def ghi jklmnopqrstu") == [
+        "abc def",
+        "ghi",
+        # the separator before a word counts towards its first chunk
+        "jklmnop",
+        "qrstu",
+    ]
@@ -0,0 +1,195 @@
+"""Test LLM response caches."""
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from langchain.llms.fake import FakeListLLM
+
+from gpt_index.llm_predictor.base import LLMPredictor
+from gpt_index.llm_predictor.cache import (
+    SimpleLLMResponseCache,
+    get_llm_cache_key,
+    get_prompt_template_id,
+)
+from gpt_index.llm_predictor.kv_cache import KVLLMResponseCache
+from gpt_index.prompts.default_prompts import DEFAULT_SIMPLE_INPUT_PROMPT
+from gpt_index.prompts.prompts import QuestionAnswerPrompt
+
+
+def test_cache_key() -> None:
+    """Test cache keys of prompts."""
+    template_id = get_prompt_template_id(DEFAULT_SIMPLE_INPUT_PROMPT)
+    key = get_llm_cache_key("model", template_id, {"query_str": "hello"})
+    # line endings are normalized, other whitespace is kept
+    key = get_llm_cache_key("model", template_id, {"query_str": "hello\n"})
+    assert key == get_llm_cache_key("model", template_id, {"query_str": "hello\r\n"})
+    assert key != get_llm_cache_key("model", template_id, {"query_str": "hello \n"})
+    assert key != get_llm_cache_key("model", template_id, {"query_str": "hello2"})
+    assert key != get_llm_cache_key("model2", template_id, {"query_str": "hello"})
+
+    qa_template_id = get_prompt_template_id(
+        QuestionAnswerPrompt("{context_str} {query_str}")
+    )
+    assert qa_template_id != template_id
+    assert key != get_llm_cache_key("model", qa_template_id, {"query_str": "hello"})
+
+
+def test_simple_cache_lru_and_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test SimpleLLMResponseCache eviction and expiration."""
+    cache = SimpleLLMResponseCache(max_size=2)
+    cache.put("a", "response_a")
+    cache.put("b", "response_b")
+    assert cache.get("a") == "response_a"
+    # "b" is the least recently used
+    cache.put("c", "response_c")
+    assert cache.get("b") is None
+    assert cache.get("a") == "response_a"
+    assert cache.get("c") == "response_c"
+    assert cache.hits == 3
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.75
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache = SimpleLLMResponseCache(ttl=10)
+    cache.put("a", "response_a")
+    monkeypatch.setattr(time, "time", lambda: now + 5)
+    assert cache.get("a") == "response_a"
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_kv_cache(tmp_path: Path) -> None:
+    """Test KVLLMResponseCache persists responses."""
+    persist_path = str(tmp_path / "llm_cache.db")
+    cache = KVLLMResponseCache.from_sqlite_path(persist_path)
+    cache.put("a", "response_a")
+    assert cache.get("a") == "response_a"
+
+    cache = KVLLMResponseCache.from_sqlite_path(persist_path)
+    assert cache.get("a") == "response_a"
+    assert cache.get("b") is None
+
+    cache = KVLLMResponseCache.from_sqlite_path(persist_path, ttl=1)
+    cache.put("b", "response_b")
+    assert cache.get("b") == "response_b"
+
+
+def test_llm_predictor_cache() -> None:
+    """Test LLMPredictor.predict uses the response cache."""
+    llm = FakeListLLM(responses=["response1", "response2", "response3"])
+    cache = SimpleLLMResponseCache()
+    predictor = LLMPredictor(llm, retry_on_throttling=False, response_cache=cache)
+
+    prompt = DEFAULT_SIMPLE_INPUT_PROMPT
+    response, _ = predictor.predict(prompt, query_str="hello world")
+    assert response == "response1"
+    total_tokens_used = predictor.total_tokens_used
+
+    # cached, and not counted as token usage
+    response, formatted_prompt = predictor.predict(prompt, query_str="hello world")
+    assert response == "response1"
+    assert formatted_prompt == prompt.format(query_str="hello world")
+    assert predictor.total_tokens_used == total_tokens_used
+
+    response, _ = predictor.predict(prompt, query_str="goodbye world")
+    assert response == "response2"
+    response, _ = asyncio.run(predictor.apredict(prompt, query_str="hello world"))
+    assert response == "response1"
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_llm_predictor_coalesce(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent identical prompts make a single LLM call."""
+    calls: List[Any] = []
+
+    def mock_predict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        calls.append(prompt_args)
+        time.sleep(0.1)
+        return "response"
+
+    async def mock_apredict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        calls.append(prompt_args)
+        await asyncio.sleep(0.1)
+        return "response"
+
+    monkeypatch.setattr(LLMPredictor, "_predict", mock_predict)
+    monkeypatch.setattr(LLMPredictor, "_apredict", mock_apredict)
+    predictor = LLMPredictor(
+        FakeListLLM(responses=[]), response_cache=SimpleLLMResponseCache()
+    )
+    prompt = DEFAULT_SIMPLE_INPUT_PROMPT
+
+    responses: List[str] = []
+    threads = [
+        threading.Thread(
+            target=lambda: responses.append(
+                predictor.predict(prompt, query_str="hello")[0]
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert responses == ["response"] * 5
+    assert len(calls) == 1
+
+    async def run_queries() -> List[Any]:
+        return await asyncio.gather(
+            *[predictor.apredict(prompt, query_str="hello2") for _ in range(5)]
+        )
+
+    outputs = asyncio.run(run_queries())
+    assert [output[0] for output in outputs] == ["response"] * 5
+    assert len(calls) == 2
+
+
+def test_llm_predictor_coalesce_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test errors are raised to coalesced callers and not cached."""
+
+    async def mock_apredict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        await asyncio.sleep(0.05)
+        raise ValueError("LLM error")
+
+    monkeypatch.setattr(LLMPredictor, "_apredict", mock_apredict)
+    cache = SimpleLLMResponseCache()
+    predictor = LLMPredictor(FakeListLLM(responses=[]), response_cache=cache)
+    prompt = DEFAULT_SIMPLE_INPUT_PROMPT
+
+    async def run_queries() -> List[Any]:
+        return await asyncio.gather(
+            *[predictor.apredict(prompt, query_str="hello") for _ in range(3)],
+            return_exceptions=True,
+        )
+
+    outputs = asyncio.run(run_queries())
+    assert all(isinstance(output, ValueError) for output in outputs)
+    assert len(cache) == 0
+
+
+def test_llm_predictor_cache_put_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test failing to cache a response doesn't fail or block predictions."""
+
+    def mock_put(self: Any, key: str, response: str) -> None:
+        raise IOError("cache error")
+
+    monkeypatch.setattr(SimpleLLMResponseCache, "put", mock_put)
+    llm = FakeListLLM(responses=["response1", "response2", "response3"])
+    predictor = LLMPredictor(
+        llm, retry_on_throttling=False, response_cache=SimpleLLMResponseCache()
+    )
+    prompt = DEFAULT_SIMPLE_INPUT_PROMPT
+
+    response, _ = predictor.predict(prompt, query_str="hello")
+    assert response == "response1"
+    # not left in flight, so later predictions don't wait on it
+    assert predictor._inflight == {}
+    response, _ = predictor.predict(prompt, query_str="hello")
+    assert response == "response2"
@@ -0,0 +1,203 @@
+"""Test LLM request limiting and async retries."""
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+import openai
+import pytest
+from langchain import LLMChain
+from langchain.llms.fake import FakeListLLM
+
+from gpt_index.llm_predictor.base import LLMPredictor
+from gpt_index.llm_predictor.limiter import LLMRequestLimiter
+from gpt_index.prompts.default_prompts import DEFAULT_SIMPLE_INPUT_PROMPT
+
+
+class ConcurrencyTracker:
+    """Track the max number of concurrent calls."""
+
+    def __init__(self) -> None:
+        self.num_calls = 0
+        self.num_running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            self.num_calls += 1
+            self.num_running += 1
+            self.max_running = max(self.max_running, self.num_running)
+
+    def end(self) -> None:
+        with self._lock:
+            self.num_running -= 1
+
+
+def test_apredict_retry_on_throttling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that apredict retries rate limit errors."""
+    errors: List[Exception] = [openai.error.RateLimitError("rate limited")]
+
+    async def mock_apredict(self: Any, **kwargs: Any) -> str:
+        if errors:
+            raise errors.pop()
+        return "response"
+
+    monkeypatch.setattr(LLMChain, "apredict", mock_apredict)
+    llm_predictor = LLMPredictor(FakeListLLM(responses=[]))
+    response, _ = asyncio.run(
+        llm_predictor.apredict(DEFAULT_SIMPLE_INPUT_PROMPT, query_str="hello")
+    )
+    assert response == "response"
+    assert not errors
+
+    errors.append(openai.error.RateLimitError("rate limited"))
+    llm_predictor = LLMPredictor(FakeListLLM(responses=[]), retry_on_throttling=False)
+    with pytest.raises(openai.error.RateLimitError):
+        asyncio.run(
+            llm_predictor.apredict(DEFAULT_SIMPLE_INPUT_PROMPT, query_str="hello")
+        )
+
+
+def test_limit_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the request limiter bounds concurrent LLM calls."""
+    tracker = ConcurrencyTracker()
+
+    def mock_predict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        tracker.start()
+        time.sleep(0.02)
+        tracker.end()
+        return "response"
+
+    async def mock_apredict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        tracker.start()
+        await asyncio.sleep(0.02)
+        tracker.end()
+        return "response"
+
+    monkeypatch.setattr(LLMPredictor, "_predict", mock_predict)
+    monkeypatch.setattr(LLMPredictor, "_apredict", mock_apredict)
+    llm_predictor = LLMPredictor(
+        FakeListLLM(responses=[]),
+        request_limiter=LLMRequestLimiter(max_concurrency=2),
+    )
+    prompt = DEFAULT_SIMPLE_INPUT_PROMPT
+
+    async def run_queries() -> List[Any]:
+        return await asyncio.gather(
+            *[llm_predictor.apredict(prompt, query_str=str(i)) for i in range(8)]
+        )
+
+    # the limiter is shared across event loops
+    for _ in range(2):
+        outputs = asyncio.run(run_queries())
+        assert [output[0] for output in outputs] == ["response"] * 8
+    assert tracker.num_calls == 16
+    assert tracker.max_running == 2
+
+    tracker.max_running = 0
+    threads = [
+        threading.Thread(
+            target=llm_predictor.predict, args=(prompt,), kwargs={"query_str": str(i)}
+        )
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracker.num_calls == 24
+    assert tracker.max_running == 2
+
+
+def test_limit_concurrency_across_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the cap is shared by sync calls and all event loops."""
+    tracker = ConcurrencyTracker()
+
+    def mock_predict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        tracker.start()
+        time.sleep(0.02)
+        tracker.end()
+        return "response"
+
+    async def mock_apredict(self: Any, prompt: Any, **prompt_args: Any) -> str:
+        tracker.start()
+        await asyncio.sleep(0.02)
+        tracker.end()
+        return "response"
+
+    monkeypatch.setattr(LLMPredictor, "_predict", mock_predict)
+    monkeypatch.setattr(LLMPredictor, "_apredict", mock_apredict)
+    llm_predictor = LLMPredictor(
+        FakeListLLM(responses=[]),
+        request_limiter=LLMRequestLimiter(max_concurrency=2),
+    )
+    prompt = DEFAULT_SIMPLE_INPUT_PROMPT
+
+    async def run_queries() -> List[Any]:
+        return await asyncio.gather(
+            *[llm_predictor.apredict(prompt, query_str=str(i)) for i in range(6)]
+        )
+
+    # two event loops in their own threads, and sync calls from four threads
+    threads = [threading.Thread(target=asyncio.run, args=(run_queries(),))]
+    threads.append(threading.Thread(target=asyncio.run, args=(run_queries(),)))
+    threads.extend(
+        threading.Thread(
+            target=llm_predictor.predict, args=(prompt,), kwargs={"query_str": str(i)}
+        )
+        for i in range(4)
+    )
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracker.num_calls == 16
+    assert tracker.max_running == 2
+
+
+def test_limit_cancelled_waiter() -> None:
+    """Test that cancelling a waiting call doesn't leak a slot."""
+    limiter = LLMRequestLimiter(max_concurrency=1)
+
+    async def wait_for_slot() -> None:
+        async with limiter.alimit():
+            pass
+
+    async def run() -> None:
+        async with limiter.alimit():
+            task = asyncio.create_task(wait_for_slot())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        await asyncio.wait_for(wait_for_slot(), timeout=1.0)
+
+    asyncio.run(run())
+    with limiter.limit():
+        pass
+
+
+def test_limit_requests_per_minute() -> None:
+    """Test that the request limiter waits for the request budget."""
+    limiter = LLMRequestLimiter(max_requests_per_minute=600)
+    assert not limiter.limits_tokens
+
+    async def run_requests() -> None:
+        for _ in range(601):
+            async with limiter.alimit():
+                pass
+
+    # the first 600 requests are a burst, the next one waits for 0.1s
+    start = time.time()
+    asyncio.run(run_requests())
+    assert time.time() - start >= 0.09
+
+    limiter = LLMRequestLimiter(max_tokens_per_minute=6000)
+    assert limiter.limits_tokens
+    start = time.time()
+    with limiter.limit(num_tokens=6000):
+        pass
+    with limiter.limit(num_tokens=10):
+        pass
+    assert time.time() - start >= 0.09
@@ -0,0 +1,70 @@
+"""Test simple node parser."""
+from typing import List
+
+from gpt_index.data_structs.node_v2 import DocumentRelationship, Node
+from gpt_index.langchain_helpers.text_splitter import TokenTextSplitter
+from gpt_index.node_parser.simple import SimpleNodeParser
+from gpt_index.readers.schema.base import Document
+
+
+def _get_documents() -> List[Document]:
+    """Get documents of different lengths."""
+    return [
+        Document(
+            " ".join(f"word{i}_{j}." for j in range(i * 7)),
+            doc_id=f"doc_{i}",
+            extra_info={"i": i},
+        )
+        for i in range(1, 12)
+    ]
+
+
+def _get_node_summary(nodes: List[Node]) -> List[tuple]:
+    """Get node contents, with relationships as positions in the node list."""
+    id_to_pos = {node.get_doc_id(): pos for pos, node in enumerate(nodes)}
+    return [
+        (
+            node.get_text(),
+            node.node_info,
+            node.extra_info,
+            node.ref_doc_id,
+            id_to_pos.get(node.relationships.get(DocumentRelationship.PREVIOUS, "")),
+            id_to_pos.get(node.relationships.get(DocumentRelationship.NEXT, "")),
+        )
+        for node in nodes
+    ]
+
+
+def test_parallel_node_parser() -> None:
+    """Test splitting documents in worker processes matches the serial path."""
+    text_splitter = TokenTextSplitter(chunk_size=20, chunk_overlap=5)
+    serial_parser = SimpleNodeParser(text_splitter=text_splitter)
+    parallel_parser = SimpleNodeParser(
+        text_splitter=text_splitter, num_workers=2, batch_size=2
+    )
+    documents = _get_documents()
+
+    serial_nodes = serial_parser.get_nodes_from_documents(documents)
+    parallel_nodes = parallel_parser.get_nodes_from_documents(documents)
+    assert len(serial_nodes) > len(documents)
+    assert _get_node_summary(parallel_nodes) == _get_node_summary(serial_nodes)
+
+    # streaming from a lazy iterable
+    streamed_nodes = list(parallel_parser.iter_nodes_from_documents(iter(documents)))
+    assert _get_node_summary(streamed_nodes) == _get_node_summary(serial_nodes)
+
+
+def test_parallel_node_parser_tokenize_once() -> None:
+    """Test that a tokenize_once splitter can be sent to worker processes."""
+    text_splitter = TokenTextSplitter(
+        chunk_size=20, chunk_overlap=5, tokenize_once=True
+    )
+    serial_parser = SimpleNodeParser(text_splitter=text_splitter)
+    parallel_parser = SimpleNodeParser(
+        text_splitter=text_splitter, num_workers=2, batch_size=2
+    )
+    documents = _get_documents()
+
+    serial_nodes = serial_parser.get_nodes_from_documents(documents)
+    parallel_nodes = parallel_parser.get_nodes_from_documents(documents)
+    assert _get_node_summary(parallel_nodes) == _get_node_summary(serial_nodes)
@@ -1,6 +1,9 @@
+from pathlib import Path
+
 import pytest
 from gpt_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
 from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from gpt_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
 from tests.storage.kvstore.mock_mongodb import MockMongoClient
 
 
@@ -17,3 +20,8 @@ def mongo_kvstore(mongo_client: MockMongoClient) -> MongoDBKVStore:
 @pytest.fixture()
 def simple_kvstore() -> SimpleKVStore:
     return SimpleKVStore()
+
+
+@pytest.fixture()
+def sqlite_kvstore(tmp_path: Path) -> SQLiteKVStore:
+    return SQLiteKVStore(str(tmp_path / "kvstore.db"))
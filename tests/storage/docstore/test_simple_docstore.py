@@ -3,8 +3,9 @@
 
 from pathlib import Path
 import pytest
-from gpt_index.data_structs.node_v2 import Node
-from gpt_index.storage.docstore import SimpleDocumentStore
+from gpt_index.data_structs.node_v2 import DocumentRelationship, Node
+from gpt_index.storage.docstore import DocumentCache, SimpleDocumentStore
+from gpt_index.storage.docstore.cache import get_doc_size
 from gpt_index.readers.schema.base import Document
 from gpt_index.storage.kvstore.simple_kvstore import SimpleKVStore
 
@@ -45,3 +46,77 @@ def test_docstore_persist(tmp_path: Path) -> None:
     assert gd1 == doc
     gd2 = new_docstore.get_document("d2")
     assert gd2 == node
+
+
+def test_docstore_get_nodes(simple_docstore: SimpleDocumentStore) -> None:
+    """Test getting nodes in bulk."""
+    nodes = [Node(f"node {i}", doc_id=f"n{i}") for i in range(3)]
+    docstore = simple_docstore
+    docstore.add_documents(nodes)
+    docstore.add_documents([Document("hello world", doc_id="d1")])
+
+    assert docstore.get_nodes(["n2", "n0"]) == [nodes[2], nodes[0]]
+    with pytest.raises(ValueError):
+        docstore.get_nodes(["n0", "missing"])
+    assert docstore.get_nodes(["n0", "missing"], raise_error=False) == [nodes[0]]
+    with pytest.raises(ValueError):
+        docstore.get_nodes(["d1"])
+    assert docstore.get_node_dict({5: "n1", 2: "n0"}) == {5: nodes[1], 2: nodes[0]}
+
+
+def test_docstore_doc_cache() -> None:
+    """Test docstore cache of deserialized documents."""
+    doc_cache = DocumentCache()
+    docstore = SimpleDocumentStore(doc_cache=doc_cache)
+    nodes = [
+        Node(f"node {i}", doc_id=f"n{i}", extra_info={"foo": "bar"}) for i in range(3)
+    ]
+    docstore.add_documents(nodes)
+
+    assert docstore.get_node("n0") == nodes[0]
+    assert docstore.get_nodes(["n0", "n1"]) == nodes[:2]
+    assert docstore.get_node("n1") == nodes[1]
+    assert (doc_cache.hits, doc_cache.misses) == (2, 2)
+    assert doc_cache.hit_rate == 0.5
+
+    # modifying returned nodes does not affect the cache
+    docstore.get_node("n0").text = "changed"
+    assert docstore.get_node("n0") == nodes[0]
+    cached_node = docstore.get_node("n0")
+    assert cached_node.extra_info is not None
+    cached_node.extra_info["foo"] = "changed"
+    cached_node.relationships[DocumentRelationship.SOURCE] = "changed"
+    assert docstore.get_node("n0") == nodes[0]
+
+    # updates and deletes invalidate the cache
+    new_node = Node("new node 0", doc_id="n0")
+    docstore.add_documents([new_node])
+    assert docstore.get_node("n0") == new_node
+    docstore.delete_document("n1")
+    assert not docstore.document_exists("n1")
+    assert docstore.get_nodes(["n1"], raise_error=False) == []
+
+
+def test_doc_cache_eviction() -> None:
+    """Test least recently used documents are evicted by size."""
+    nodes = [Node("x" * 1000, doc_id=f"n{i}") for i in range(3)]
+    doc_cache = DocumentCache(max_size_bytes=2 * get_doc_size(nodes[0]))
+    for node in nodes[:2]:
+        doc_cache.put(node.get_doc_id(), node)
+    assert doc_cache.get("n0") == nodes[0]
+    doc_cache.put("n2", nodes[2])
+    assert "n0" in doc_cache
+    assert "n1" not in doc_cache
+    assert doc_cache.size_bytes == 2 * get_doc_size(nodes[0])
+
+
+def test_docstore_document_hashes(simple_docstore: SimpleDocumentStore) -> None:
+    """Test setting and getting document hashes in bulk."""
+    docstore = simple_docstore
+    docstore.set_document_hash("d1", "hash1")
+    docstore.set_document_hashes({"d2": "hash2", "d3": "hash3"})
+    assert docstore.get_document_hash("d2") == "hash2"
+    assert docstore.get_document_hashes(["d1", "d3", "missing"]) == {
+        "d1": "hash1",
+        "d3": "hash3",
+    }
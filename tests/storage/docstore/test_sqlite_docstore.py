@@ -0,0 +1,35 @@
+"""Test SQLite docstore."""
+from pathlib import Path
+
+from gpt_index.data_structs.data_structs_v2 import IndexDict
+from gpt_index.data_structs.node_v2 import Node
+from gpt_index.readers.schema.base import Document
+from gpt_index.storage.docstore import SQLiteDocumentStore
+from gpt_index.storage.index_store import SQLiteIndexStore
+
+
+def test_sqlite_docstore(tmp_path: Path) -> None:
+    """Test SQLite docstore is durable without persisting."""
+    doc = Document("hello world", doc_id="d1", extra_info={"foo": "bar"})
+    node = Node("my node", doc_id="d2", node_info={"node": "info"})
+
+    docstore = SQLiteDocumentStore.from_persist_dir(str(tmp_path))
+    docstore.add_documents([doc, node])
+    assert docstore.get_document("d1") == doc
+    assert docstore.get_document_hash("d2") == node.get_doc_hash()
+
+    new_docstore = SQLiteDocumentStore.from_persist_dir(str(tmp_path))
+    assert new_docstore.get_document("d2") == node
+    new_docstore.delete_document("d1")
+    assert not docstore.document_exists("d1")
+    assert list(docstore.docs.keys()) == ["d2"]
+
+
+def test_sqlite_index_store(tmp_path: Path) -> None:
+    """Test SQLite index store is durable without persisting."""
+    index_struct = IndexDict()
+    index_store = SQLiteIndexStore.from_persist_dir(str(tmp_path))
+    index_store.add_index_struct(index_struct)
+
+    new_index_store = SQLiteIndexStore.from_persist_dir(str(tmp_path))
+    assert new_index_store.get_index_struct(index_struct.index_id) == index_struct
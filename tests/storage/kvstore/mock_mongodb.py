@@ -17,7 +17,10 @@ class MockMongoCollection:
     def find(self, filter: Optional[dict] = None) -> List[dict]:
         data_list = []
         for data in self._data.values():
-            if filter is None or all(data[key] == val for key, val in filter.items()):
+            if filter is None or all(
+                data[key] in val["$in"] if isinstance(val, dict) else data[key] == val
+                for key, val in filter.items()
+            ):
                 data_list.append(data.copy())
         return data_list
 
@@ -25,3 +25,10 @@ def test_kvstore_basic(mongo_kvstore: MongoDBKVStore) -> None:
 
     blob = mongo_kvstore.get(test_key, collection="non_existent")
     assert blob is None
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_get_many(kvstore_with_data: MongoDBKVStore) -> None:
+    kvstore_with_data.put_many([("key_1", {"i": 1}), ("key_2", {"i": 2})])
+    blobs = kvstore_with_data.get_many(["key_2", "missing", "test_key"])
+    assert blobs == {"key_2": {"i": 2}, "test_key": {"test_obj_key": "test_obj_val"}}
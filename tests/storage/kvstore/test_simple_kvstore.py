@@ -28,3 +28,11 @@ def test_kvstore_persist(tmp_path: Path, kvstore_with_data: SimpleKVStore) -> No
     kvstore_with_data.persist(testpath)
     loaded_kvstore = SimpleKVStore.from_persist_path(testpath)
     assert len(loaded_kvstore.get_all()) == 1
+
+
+def test_kvstore_get_many(kvstore_with_data: SimpleKVStore) -> None:
+    """Test kvstore bulk get."""
+    kvstore_with_data.put_many([("key_1", {"i": 1}), ("key_2", {"i": 2})])
+    blobs = kvstore_with_data.get_many(["key_2", "missing", "test_key"])
+    assert blobs == {"key_2": {"i": 2}, "test_key": {"test_obj_key": "test_obj_val"}}
+    assert kvstore_with_data.get_many(["key_1"], collection="non_existent") == {}
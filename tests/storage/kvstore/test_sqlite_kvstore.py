@@ -0,0 +1,35 @@
+from gpt_index.storage.kvstore.sqlite_kvstore import SQLiteKVStore
+
+
+def test_kvstore_basic(sqlite_kvstore: SQLiteKVStore) -> None:
+    test_key = "test_key"
+    test_blob = {"test_obj_key": "test_obj_val"}
+    sqlite_kvstore.put(test_key, test_blob)
+    blob = sqlite_kvstore.get(test_key)
+    assert blob == test_blob
+
+    blob = sqlite_kvstore.get(test_key, collection="non_existent")
+    assert blob is None
+
+    assert sqlite_kvstore.delete(test_key)
+    assert not sqlite_kvstore.delete(test_key)
+    assert sqlite_kvstore.get(test_key) is None
+
+
+def test_kvstore_put_get_many(sqlite_kvstore: SQLiteKVStore) -> None:
+    kv_pairs = [(f"key_{i}", {"i": i}) for i in range(1200)]
+    sqlite_kvstore.put_many(kv_pairs)
+    sqlite_kvstore.put("other_key", {"i": -1}, collection="other")
+
+    vals = sqlite_kvstore.get_many(["key_0", "key_1199", "missing", "other_key"])
+    assert vals == {"key_0": {"i": 0}, "key_1199": {"i": 1199}}
+    assert len(sqlite_kvstore.get_many([key for key, _ in kv_pairs])) == 1200
+    assert len(sqlite_kvstore.get_all()) == 1200
+    assert sqlite_kvstore.get_all(collection="other") == {"other_key": {"i": -1}}
+
+
+def test_kvstore_durable(sqlite_kvstore: SQLiteKVStore) -> None:
+    """Test writes are visible to a new store without persisting."""
+    sqlite_kvstore.put("test_key", {"test_obj_key": "test_obj_val"})
+    loaded_kvstore = SQLiteKVStore(sqlite_kvstore.persist_path)
+    assert loaded_kvstore.get("test_key") == {"test_obj_key": "test_obj_val"}
@@ -1,11 +1,14 @@
 """Test utils."""
 
+import asyncio
 from typing import Optional, Type, Union
 
 import pytest
 
 from gpt_index.utils import (
     ErrorToRetry,
+    RateLimiter,
+    aretry_on_exceptions_with_backoff,
     globals_helper,
     retry_on_exceptions_with_backoff,
     iter_batch,
@@ -99,6 +102,47 @@ def test_retry_on_conditional_exceptions() -> None:
         )
     assert call_count == 1
 
+    # the condition also applies to subclasses
+    call_count = 0
+    with pytest.raises(ConditionalException):
+        retry_on_exceptions_with_backoff(
+            lambda: fn_with_exception(ConditionalException(False)),
+            [ErrorToRetry(Exception, lambda e: e.should_retry)],
+            max_tries=3,
+            min_backoff_secs=0.0,
+        )
+    assert call_count == 1
+
+
+def test_aretry_on_exceptions_with_backoff() -> None:
+    """Make sure async retry function has accurate number of attempts."""
+    global call_count
+
+    async def afn_with_exception(exception_cls: Type[Exception]) -> bool:
+        return fn_with_exception(exception_cls)
+
+    call_count = 0
+    with pytest.raises(ValueError):
+        asyncio.run(
+            aretry_on_exceptions_with_backoff(
+                lambda: afn_with_exception(ValueError),
+                [ErrorToRetry(ValueError)],
+                max_tries=3,
+                min_backoff_secs=0.0,
+            )
+        )
+    assert call_count == 3
+
+
+def test_rate_limiter() -> None:
+    """Make sure rate limiter only waits once the budget is used up."""
+    rate_limiter = RateLimiter(max_per_minute=60)
+    assert rate_limiter.reserve(59) == 0.0
+    # 1 unit is left, and the bucket refills at 1 unit per second
+    assert 0.9 < rate_limiter.reserve(2) <= 1.0
+    # large amounts are capped to the bucket size
+    assert 60.0 < rate_limiter.reserve(1000) <= 61.0
+
 
 def test_iter_batch() -> None:
     """Check iter_batch works as expected on regular, lazy and empty sequences."""
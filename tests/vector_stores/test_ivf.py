@@ -0,0 +1,127 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from gpt_index.data_structs.node_v2 import Node
+from gpt_index.vector_stores.ivf import IVFIndex
+from gpt_index.vector_stores.simple import SimpleVectorStore
+from gpt_index.vector_stores.types import NodeEmbeddingResult, VectorStoreQuery
+
+
+@pytest.fixture
+def embedding_results() -> List[NodeEmbeddingResult]:
+    # clustered data, so that the coarse quantizer is meaningful
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(16, 32))
+    embeddings = centers[rng.integers(16, size=2000)] + 0.1 * rng.normal(
+        size=(2000, 32)
+    )
+    return [
+        NodeEmbeddingResult(
+            id=f"node_{i}",
+            node=Node(text=f"text {i}", doc_id=f"node_{i}"),
+            embedding=embedding.tolist(),
+            doc_id=f"doc_{i % 100}",
+        )
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def test_ivf_query(embedding_results: List[NodeEmbeddingResult]) -> None:
+    exact_store = SimpleVectorStore(use_matrix=True)
+    ivf_store = SimpleVectorStore(ivf_index=IVFIndex(nlist=16, nprobe=4))
+    exact_store.add(embedding_results[:1000])
+    ivf_store.add(embedding_results[:1000])
+    # trained on add, once there are enough embeddings
+    assert ivf_store.ivf_index is not None
+    assert ivf_store.ivf_index.is_trained
+
+    queries = [
+        VectorStoreQuery(query_embedding=result.embedding, similarity_top_k=10)
+        for result in embedding_results[::50]
+    ]
+
+    # incremental add after training
+    exact_store.add(embedding_results[1000:])
+    ivf_store.add(embedding_results[1000:])
+
+    recalls = []
+    for query in queries:
+        exact_ids = set(exact_store.query(query).ids or [])
+        ivf_ids = set(ivf_store.query(query).ids or [])
+        recalls.append(len(exact_ids & ivf_ids) / len(exact_ids))
+    assert np.mean(recalls) > 0.9
+
+    # deleted nodes are never returned
+    ivf_store.delete("doc_0")
+    for query in queries:
+        ids = ivf_store.query(query).ids or []
+        assert "node_0" not in ids
+        assert "node_100" not in ids
+
+
+def test_ivf_untrained(embedding_results: List[NodeEmbeddingResult]) -> None:
+    """Test queries are exact until there are enough embeddings to train."""
+    ivf_store = SimpleVectorStore(ivf_index=IVFIndex(nlist=100))
+    ivf_store.add(embedding_results[:100])
+    query = VectorStoreQuery(
+        query_embedding=embedding_results[0].embedding, similarity_top_k=1
+    )
+    assert ivf_store.query(query).ids == ["node_0"]
+    assert ivf_store.ivf_index is not None
+    assert not ivf_store.ivf_index.is_trained
+
+
+def test_ivf_delete(embedding_results: List[NodeEmbeddingResult]) -> None:
+    """Test deletes that move rows of the matrix keep the IVF lists in sync."""
+    exact_store = SimpleVectorStore(use_matrix=True)
+    # probing all lists, so that results are exact
+    ivf_store = SimpleVectorStore(ivf_index=IVFIndex(nlist=16, nprobe=16))
+    exact_store.add(embedding_results)
+    ivf_store.add(embedding_results)
+    for doc_id in ["doc_3", "doc_99", "doc_42", "doc_0"]:
+        exact_store.delete(doc_id)
+        ivf_store.delete(doc_id)
+
+    for result in embedding_results[::37]:
+        query = VectorStoreQuery(query_embedding=result.embedding, similarity_top_k=5)
+        assert ivf_store.query(query).ids == exact_store.query(query).ids
+
+
+def test_ivf_explicit_train(embedding_results: List[NodeEmbeddingResult]) -> None:
+    """Test training the IVF index before there are `min_train_size` embeddings."""
+    ivf_store = SimpleVectorStore(ivf_index=IVFIndex(nlist=4, nprobe=4))
+    ivf_store.add(embedding_results[:50])
+    assert ivf_store.ivf_index is not None
+    assert not ivf_store.ivf_index.is_trained
+
+    ivf_store.train_ivf_index()
+    assert ivf_store.ivf_index.is_trained
+    ivf_store.add(embedding_results[50:60])
+    query = VectorStoreQuery(
+        query_embedding=embedding_results[55].embedding, similarity_top_k=1
+    )
+    assert ivf_store.query(query).ids == ["node_55"]
+
+    with pytest.raises(ValueError):
+        SimpleVectorStore(use_matrix=True).train_ivf_index()
+
+
+def test_ivf_persist(
+    embedding_results: List[NodeEmbeddingResult], tmp_path: Path
+) -> None:
+    ivf_store = SimpleVectorStore(ivf_index=IVFIndex(nlist=16, nprobe=2))
+    ivf_store.add(embedding_results)
+    query = VectorStoreQuery(
+        query_embedding=embedding_results[3].embedding, similarity_top_k=5
+    )
+    result = ivf_store.query(query)
+
+    ivf_store.persist(str(tmp_path / "vector_store.json"))
+    loaded_store = SimpleVectorStore.from_persist_dir(str(tmp_path))
+    assert loaded_store.ivf_index is not None
+    assert loaded_store.ivf_index.is_trained
+    assert loaded_store.ivf_index.nprobe == 2
+    assert loaded_store.query(query) == result
@@ -1,4 +1,5 @@
-from typing import List, cast
+import uuid
+from typing import Any, List, cast
 
 import pytest
 
@@ -115,3 +116,47 @@ def test_build_query_filter_returns_combined_filter() -> None:
     assert query_filter.must[1].key == "text"  # type: ignore[index]
     assert isinstance(query_filter.must[1].match, MatchText)  # type: ignore[index]
     assert query_filter.must[1].match.text == "lorem"  # type: ignore[index]
+
+
+@pytest.mark.skipif(qdrant_client is None, reason="qdrant-client not installed")
+def test_aadd_max_concurrency(node: Node) -> None:
+    """Test aadd creates the collection asynchronously and bounds upserts."""
+    import asyncio
+
+    class MockAsyncClient:
+        def __init__(self) -> None:
+            self.num_running = 0
+            self.max_running = 0
+            self.num_upserts = 0
+            self.collection_created = False
+
+        async def recreate_collection(self, **kwargs: Any) -> None:
+            self.collection_created = True
+
+        async def upsert(self, **kwargs: Any) -> None:
+            self.num_running += 1
+            self.max_running = max(self.max_running, self.num_running)
+            await asyncio.sleep(0.01)
+            self.num_running -= 1
+            self.num_upserts += 1
+
+    aclient = MockAsyncClient()
+    client = qdrant_client.QdrantClient(":memory:")
+    qdrant_vector_store = QdrantVectorStore(
+        collection_name="test",
+        client=client,
+        aclient=aclient,
+        batch_size=1,
+        max_concurrency=2,
+    )
+    node_embeddings = [
+        NodeEmbeddingResult(
+            id=str(uuid.uuid4()), embedding=[1.0, 0.0], doc_id="test", node=node
+        )
+        for _ in range(8)
+    ]
+    ids = asyncio.run(qdrant_vector_store.aadd(node_embeddings))
+    assert ids == [result.id for result in node_embeddings]
+    assert aclient.collection_created
+    assert aclient.num_upserts == 8
+    assert aclient.max_running == 2